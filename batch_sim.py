@@ -0,0 +1,635 @@
+"""
+Batched simulation for NeuroLink: Cyberpunk Data Recovery game.
+Advances N independent games at once as NumPy arrays - fragment grid march, firewall nodes,
+data packets, corruption packets, upgrades, combos and lives - following the rules of
+Game.update and Game.check_collisions without creating sprites or Surfaces.
+
+Run this module to check parity against the GameState path and measure throughput:
+    python batch_sim.py
+"""
+
+import random
+import time
+from collections import deque
+import numpy as np
+from config import *
+from controls import ACTION_LEFT, ACTION_RIGHT, ACTION_SHOOT
+
+# Rect sizes and spawn offsets of the sprites the batch stands in for
+PLAYER_TOP = HEIGHT - 20 - PLAYER_HEIGHT
+PLAYER_START_X = WIDTH // 2 - PLAYER_WIDTH // 2
+ENEMY_BULLET_WIDTH = BULLET_WIDTH + 2
+ENEMY_BULLET_HEIGHT = BULLET_HEIGHT + 2
+ENEMY_BULLET_SPEED = int(BULLET_SPEED * 0.7)
+GRID_START_X = (WIDTH - (ENEMY_COLS * ENEMY_SPACING)) // 2
+GRID_START_Y = 50
+BOSS_SIZE = ENEMY_WIDTH * BOSS_SCALE
+BOSS_START_X = WIDTH // 2 - BOSS_SIZE // 2
+BOSS_START_Y = 50
+MAX_STATE = len(EMOJI_STATES) - 1
+
+POWERUP_SHIELD, POWERUP_DOUBLE_SHOT, POWERUP_LIFE, POWERUP_BOMB = (
+    POWERUP_TYPES.index(name) for name in ("shield", "double_shot", "life", "bomb"))
+
+
+def overlaps(ax, ay, aw, ah, bx, by, bw, bh):
+    """Vectorized pygame.Rect.colliderect"""
+    return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+
+def used_width(active):
+    """Return the number of leading slot columns that hold any active sprite"""
+    used = np.flatnonzero(active.any(axis=0))
+    return used[-1] + 1 if len(used) else 0
+
+
+class BatchSim:
+    """N independent games stepped together
+
+    Each game runs with autoplay: game over restarts it and a cleared level moves
+    on to the next, like Game.step(autoplay=True). Sprites beyond the per-game
+    slot capacities are dropped.
+    """
+
+    def __init__(self, n, seed=None, bullet_capacity=BATCH_BULLET_CAPACITY,
+                 enemy_bullet_capacity=BATCH_ENEMY_BULLET_CAPACITY, powerup_capacity=BATCH_POWERUP_CAPACITY):
+        """Initialize n fresh games"""
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.trace = {}  # Game index -> uniforms drawn for it, in GameState order (parity checks)
+        self.index = np.arange(n)
+
+        # Game and player state
+        self.score = np.zeros(n, np.int64)
+        self.high_score = np.zeros(n, np.int64)
+        self.level = np.zeros(n, np.int32)
+        self.lives = np.zeros(n, np.int32)
+        self.player_x = np.zeros(n, np.int32)
+        self.shield = np.zeros(n, bool)
+        self.shield_timer = np.zeros(n, np.int32)
+        self.double_shot = np.zeros(n, bool)
+        self.double_shot_timer = np.zeros(n, np.int32)
+        self.invincible = np.zeros(n, bool)
+        self.invincible_timer = np.zeros(n, np.int32)
+        self.combo_count = np.zeros(n, np.int32)
+        self.combo_timer = np.zeros(n, np.int32)
+        self.game_over = np.zeros(n, bool)
+        self.game_won = np.zeros(n, bool)
+
+        # Enemy movement and difficulty
+        self.direction = np.zeros(n, np.int32)
+        self.move_timer = np.zeros(n, np.int32)
+        self.move_delay = np.zeros(n, np.int32)
+        self.shoot_chance = np.zeros(n, np.float64)
+
+        # Fragment grid, or the firewall node on boss levels
+        self.boss_mode = np.zeros(n, bool)
+        self.grid_x = np.zeros(n, np.int32)
+        self.grid_y = np.zeros(n, np.int32)
+        self.alive = np.zeros((n, ENEMY_ROWS, ENEMY_COLS), bool)
+        self.state = np.zeros((n, ENEMY_ROWS, ENEMY_COLS), np.int8)
+        self.boss_x = np.zeros(n, np.int32)
+        self.boss_y = np.zeros(n, np.int32)
+        self.boss_health = np.zeros(n, np.int32)
+        self.boss_alive = np.zeros(n, bool)
+
+        # Sprite slots (rect top-left corners); data packets keep a serial for group order
+        self.bullet_active = np.zeros((n, bullet_capacity), bool)
+        self.bullet_x = np.zeros((n, bullet_capacity), np.int32)
+        self.bullet_y = np.zeros((n, bullet_capacity), np.int32)
+        self.bullet_serial = np.zeros((n, bullet_capacity), np.int64)
+        self.next_serial = 0
+        self.enemy_bullet_active = np.zeros((n, enemy_bullet_capacity), bool)
+        self.enemy_bullet_x = np.zeros((n, enemy_bullet_capacity), np.int32)
+        self.enemy_bullet_y = np.zeros((n, enemy_bullet_capacity), np.int32)
+        self.powerup_active = np.zeros((n, powerup_capacity), bool)
+        self.powerup_x = np.zeros((n, powerup_capacity), np.int32)
+        self.powerup_y = np.zeros((n, powerup_capacity), np.int32)
+        self.powerup_type = np.zeros((n, powerup_capacity), np.int8)
+        self.dropped = 0  # Spawns lost to full slots
+
+        self.reset(np.ones(n, bool))
+
+    def reset(self, mask):
+        """Restart the games in mask, like GameState.reset()"""
+        self.score[mask] = 0
+        self.level[mask] = 1
+        self.game_over[mask] = False
+        self.game_won[mask] = False
+        self.combo_count[mask] = 0
+        self.combo_timer[mask] = 0
+        self.direction[mask] = 1
+        self.move_timer[mask] = 0
+        self.move_delay[mask] = ENEMY_INITIAL_MOVE_DELAY
+        self.shoot_chance[mask] = ENEMY_SHOOT_CHANCE
+
+        self.player_x[mask] = PLAYER_START_X
+        self.lives[mask] = PLAYER_INITIAL_LIVES
+        for flag, timer in ((self.shield, self.shield_timer), (self.double_shot, self.double_shot_timer),
+                            (self.invincible, self.invincible_timer)):
+            flag[mask] = False
+            timer[mask] = 0
+
+        self.clear_sprites(mask)
+        self.create_enemies(mask)
+
+    def clear_sprites(self, mask):
+        """Remove every data packet, corruption packet and upgrade in mask"""
+        self.bullet_active[mask] = False
+        self.enemy_bullet_active[mask] = False
+        self.powerup_active[mask] = False
+
+    def create_enemies(self, mask):
+        """Build the grid, or the firewall node on boss levels, for the games in mask"""
+        boss = mask & (self.level % BOSS_LEVEL_INTERVAL == 0)
+        grid = mask & ~boss
+        self.boss_mode[mask] = boss[mask]
+
+        self.grid_x[grid] = GRID_START_X
+        self.grid_y[grid] = GRID_START_Y
+        self.alive[grid] = True
+        self.state[grid] = 0
+        self.boss_alive[grid] = False
+
+        self.alive[boss] = False
+        self.boss_alive[boss] = True
+        self.boss_x[boss] = BOSS_START_X
+        self.boss_y[boss] = BOSS_START_Y
+        self.boss_health[boss] = (BOSS_INITIAL_HEALTH
+                                  + (self.level[boss] // BOSS_LEVEL_INTERVAL) * BOSS_HEALTH_INCREASE_PER_LEVEL)
+
+    def next_level(self, mask):
+        """Advance the games in mask to their next level, like GameState.next_level()"""
+        self.level[mask] += 1
+        self.move_delay[mask] = np.maximum(LEVEL_MOVE_DELAY_MIN, self.move_delay[mask] - LEVEL_MOVE_DELAY_DECREASE)
+        self.shoot_chance[mask] += LEVEL_SHOOT_CHANCE_INCREASE
+        self.game_won[mask] = False
+        self.clear_sprites(mask)
+        self.create_enemies(mask)
+
+    def log(self, mask, values):
+        """Record the uniforms drawn for traced games in mask"""
+        for i, log in self.trace.items():
+            if mask[i]:
+                log.extend(np.atleast_1d(values[i]).tolist())
+
+    def spawn(self, mask, active, xs, ys, x, y, extra=()):
+        """Put one sprite per game in mask into its first free slot"""
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return rows, rows
+        free = ~active[rows]
+        has_slot = free.any(axis=1)
+        self.dropped += int((~has_slot).sum())
+        rows = rows[has_slot]
+        slots = free[has_slot].argmax(axis=1)
+        active[rows, slots] = True
+        xs[rows, slots] = x[rows] if np.ndim(x) else x
+        ys[rows, slots] = y[rows] if np.ndim(y) else y
+        for array, value in extra:
+            array[rows, slots] = value[rows] if np.ndim(value) else value
+        return rows, slots
+
+    def spawn_bullets(self, mask, x):
+        """Launch a data packet at centerx x from the top of each player in mask"""
+        serial = self.next_serial + self.index
+        self.next_serial += self.n
+        self.spawn(mask, self.bullet_active, self.bullet_x, self.bullet_y,
+                   x - BULLET_WIDTH // 2, PLAYER_TOP - BULLET_HEIGHT, ((self.bullet_serial, serial),))
+
+    def spawn_enemy_bullets(self, mask, centerx, top):
+        """Launch a corruption packet at centerx from top for each game in mask"""
+        self.spawn(mask, self.enemy_bullet_active, self.enemy_bullet_x, self.enemy_bullet_y,
+                   centerx - ENEMY_BULLET_WIDTH // 2, top)
+
+    def player_hit(self, mask):
+        """Apply Player.hit() to the games in mask and return where a hit registered"""
+        shielded = mask & self.shield
+        self.shield[shielded] = False
+
+        exposed = mask & ~self.shield & ~shielded & ~self.invincible
+        self.lives[exposed] -= 1
+        buffered = exposed & (self.lives > 0)
+        self.invincible[buffered] = True
+        self.invincible_timer[buffered] = PLAYER_INVINCIBLE_DURATION
+
+        registered = shielded | exposed
+        over = registered & (self.lives <= 0)
+        self.game_over |= over
+        self.high_score[over] = np.maximum(self.high_score[over], self.score[over])
+        return registered
+
+    def step(self, actions):
+        """Advance every game one tick with per-game ACTION_* bits and return the score gained"""
+        actions = np.asarray(actions)
+        previous_score = self.score.copy()
+
+        # Shooting happens in handle_events, before the update
+        shoot = (actions & ACTION_SHOOT) != 0
+        double = shoot & self.double_shot
+        self.spawn_bullets(shoot & ~double, self.player_x + PLAYER_WIDTH // 2)
+        self.spawn_bullets(double, self.player_x + PLAYER_WIDTH // 3)
+        self.spawn_bullets(double, self.player_x + PLAYER_WIDTH * 2 // 3)
+
+        # Player movement
+        left = (actions & ACTION_LEFT) != 0
+        self.player_x[left] = np.maximum(0, self.player_x[left] - PLAYER_SPEED)
+        right = (actions & ACTION_RIGHT) != 0
+        self.player_x[right] = np.minimum(WIDTH - PLAYER_WIDTH, self.player_x[right] + PLAYER_SPEED)
+
+        # Player timers
+        for flag, timer in ((self.invincible, self.invincible_timer), (self.shield, self.shield_timer),
+                            (self.double_shot, self.double_shot_timer)):
+            timer[flag] -= 1
+            flag &= timer > 0
+
+        # Packets and upgrades
+        width = used_width(self.bullet_active)
+        self.bullet_y[:, :width] -= BULLET_SPEED
+        self.bullet_active[:, :width] &= self.bullet_y[:, :width] + BULLET_HEIGHT >= 0
+        width = used_width(self.enemy_bullet_active)
+        self.enemy_bullet_y[:, :width] += ENEMY_BULLET_SPEED
+        self.enemy_bullet_active[:, :width] &= self.enemy_bullet_y[:, :width] <= HEIGHT
+        width = used_width(self.powerup_active)
+        self.powerup_y[:, :width] += POWERUP_SPEED
+        self.powerup_active[:, :width] &= self.powerup_y[:, :width] <= HEIGHT
+
+        self.move_enemies()
+        self.enemy_shoot()
+        self.check_collisions()
+
+        # Combo timers
+        counting = self.combo_timer > 0
+        self.combo_timer[counting] -= 1
+        expired = counting & (self.combo_timer <= 0)
+        self.combo_count[expired] = 0
+
+        reward = self.score - previous_score
+        done = self.game_over.copy()
+        cleared = self.game_won & ~done
+
+        # Autoplay
+        self.reset(done)
+        self.next_level(cleared)
+        return reward, done, cleared
+
+    def move_enemies(self):
+        """March the grids and move the firewall nodes, like Game.move_enemies()"""
+        self.move_timer += 1
+        fire = self.move_timer >= self.move_delay
+        self.move_timer[fire] = 0
+
+        # Firewall nodes
+        boss = fire & self.boss_mode & self.boss_alive
+        if boss.any():
+            self.boss_x[boss] += ENEMY_INITIAL_SPEED * BOSS_MOVE_SPEED_MULTIPLIER * self.direction[boss]
+            flip = boss & (((self.boss_x + BOSS_SIZE > WIDTH) & (self.direction > 0))
+                           | ((self.boss_x < 0) & (self.direction < 0)))
+            self.direction[flip] *= -1
+            roll = self.rng.random(self.n)
+            self.log(boss, roll)
+            down = boss & (roll < BOSS_MOVE_DOWN_CHANCE)
+            self.boss_y[down] += ENEMY_MOVE_DOWN // 2
+
+        # Fragment grids
+        grid = fire & ~self.boss_mode
+        if not grid.any():
+            return
+        columns = self.alive.any(axis=1)
+        occupied = columns.any(axis=1)
+        first = columns.argmax(axis=1)
+        last = ENEMY_COLS - 1 - columns[:, ::-1].argmax(axis=1)
+        left = self.grid_x + first * ENEMY_SPACING
+        right = self.grid_x + last * ENEMY_SPACING + ENEMY_WIDTH
+        down = grid & occupied & (((right + ENEMY_INITIAL_SPEED > WIDTH) & (self.direction > 0))
+                                  | ((left - ENEMY_INITIAL_SPEED < 0) & (self.direction < 0)))
+        if down.any():
+            self.direction[down] *= -1
+
+            # Fragments evolve as they descend
+            rolls = self.rng.random(self.alive.shape)
+            candidates = down[:, None, None] & self.alive & (self.state < MAX_STATE)
+            for i, log in self.trace.items():
+                if down[i]:
+                    log.extend(rolls[i][candidates[i]].tolist())
+            self.state[candidates & (rolls < ENEMY_EVOLUTION_CHANCE)] += 1
+
+        self.grid_x[grid] += ENEMY_INITIAL_SPEED * self.direction[grid]
+        self.grid_y[down] += ENEMY_MOVE_DOWN
+
+    def enemy_shoot(self):
+        """Fire corruption packets, like Game.enemy_shoot()"""
+        shoot_roll = self.rng.random(self.n)
+        pick_roll = self.rng.random(self.n)
+
+        # Firewall nodes fire a three packet spread
+        boss = self.boss_mode & self.boss_alive
+        self.log(boss, shoot_roll)
+        boss &= shoot_roll < self.shoot_chance * BOSS_SHOOT_CHANCE_MULTIPLIER
+        for offset in (-20, 0, 20):
+            self.spawn_enemy_bullets(boss, self.boss_x + BOSS_SIZE // 2 + offset, self.boss_y + BOSS_SIZE)
+
+        # The bottom fragment of a random column fires
+        columns = self.alive.any(axis=1)
+        grid = ~self.boss_mode & columns.any(axis=1)
+        self.log(grid, shoot_roll)
+        grid &= shoot_roll <= self.shoot_chance
+        self.log(grid, pick_roll)
+        rows = np.flatnonzero(grid)
+        if not len(rows):
+            return
+        occupied = columns[rows]
+        pick = (pick_roll[rows] * occupied.sum(axis=1)).astype(np.int64)
+        col = (np.cumsum(occupied, axis=1) > pick[:, None]).argmax(axis=1)
+        bottom_row = ENEMY_ROWS - 1 - self.alive[rows, ::-1, col].argmax(axis=1)
+        centerx = np.zeros(self.n, np.int32)
+        top = np.zeros(self.n, np.int32)
+        centerx[rows] = self.grid_x[rows] + col * ENEMY_SPACING + ENEMY_WIDTH // 2
+        top[rows] = self.grid_y[rows] + bottom_row * ENEMY_SPACING + ENEMY_HEIGHT
+        self.spawn_enemy_bullets(grid, centerx, top)
+
+    def check_collisions(self):
+        """Resolve hits, contact, pickups and level completion, like Game.check_collisions()"""
+        self.bullet_hits()
+
+        # Corruption packets hitting players that are not in the neural buffer
+        width = used_width(self.enemy_bullet_active)
+        exposed = ~self.invincible
+        hit = self.enemy_bullet_active[:, :width] & exposed[:, None] & overlaps(
+            self.enemy_bullet_x[:, :width], self.enemy_bullet_y[:, :width], ENEMY_BULLET_WIDTH, ENEMY_BULLET_HEIGHT,
+            self.player_x[:, None], PLAYER_TOP, PLAYER_WIDTH, PLAYER_HEIGHT)
+        self.enemy_bullet_active[:, :width] &= ~hit
+        self.player_hit(hit.any(axis=1))
+
+        # Fragments reaching the player's row - the first in group order counts
+        row_bottom = self.grid_y[:, None] + np.arange(ENEMY_ROWS) * ENEMY_SPACING + ENEMY_HEIGHT
+        reached = self.alive.any(axis=2) & (row_bottom >= PLAYER_TOP)
+        grid_contact = reached.any(axis=1)
+        boss_contact = self.boss_alive & (self.boss_y + BOSS_SIZE >= PLAYER_TOP)
+        registered = self.player_hit(grid_contact | boss_contact)
+        self.boss_alive[registered & boss_contact] = False
+        rows = np.flatnonzero(registered & grid_contact)
+        if len(rows):
+            row = reached[rows].argmax(axis=1)
+            col = self.alive[rows, row].argmax(axis=1)
+            self.alive[rows, row, col] = False
+
+        # Upgrades
+        picked = self.powerup_active & overlaps(
+            self.powerup_x, self.powerup_y, POWERUP_SIZE, POWERUP_SIZE,
+            self.player_x[:, None], PLAYER_TOP, PLAYER_WIDTH, PLAYER_HEIGHT)
+        if picked.any():
+            self.powerup_active &= ~picked
+            self.apply_powerups(picked)
+
+        # Level complete
+        self.game_won |= ~self.alive.any(axis=(1, 2)) & ~self.boss_alive
+
+    def bullet_hits(self):
+        """Score data packets hitting fragments and firewall nodes in group order"""
+        # Slots fill first-free, so columns past the last active one are empty
+        width = used_width(self.bullet_active)
+        active = self.bullet_active[:, :width]
+        x, y = self.bullet_x[:, :width], self.bullet_y[:, :width]
+
+        # Fragment gaps are wider than a packet, so each packet can only touch the slot
+        # its bottom-right pixel falls in, and overlaps it when within the fragment plus packet size
+        col, x_offset = np.divmod(x + (BULLET_WIDTH - 1) - self.grid_x[:, None], ENEMY_SPACING)
+        row, y_offset = np.divmod(y + (BULLET_HEIGHT - 1) - self.grid_y[:, None], ENEMY_SPACING)
+        inside = (active & (col >= 0) & (col < ENEMY_COLS) & (row >= 0) & (row < ENEMY_ROWS)
+                  & (x_offset < ENEMY_WIDTH + BULLET_WIDTH - 1) & (y_offset < ENEMY_HEIGHT + BULLET_HEIGHT - 1))
+        slot = np.where(inside, row * ENEMY_COLS + col, 0)
+        hit = inside & np.take_along_axis(self.alive.reshape(self.n, -1), slot, axis=1)
+        boss_hit = np.zeros_like(hit)
+        if self.boss_alive.any():
+            boss_hit = active & self.boss_alive[:, None] & overlaps(
+                x, y, BULLET_WIDTH, BULLET_HEIGHT, self.boss_x[:, None], self.boss_y[:, None], BOSS_SIZE, BOSS_SIZE)
+            hit |= boss_hit
+        games, slots = np.nonzero(hit)
+        if not len(games):
+            return
+        self.bullet_active[games, slots] = False
+
+        # Hits in group order (game, then packet launch order)
+        boss_hit = boss_hit[games, slots]
+        row = np.where(boss_hit, 0, row[games, slots])
+        col = np.where(boss_hit, 0, col[games, slots])
+        order = np.lexsort((self.bullet_serial[games, slots], games))
+        games, row, col, boss_hit = games[order], row[order], col[order], boss_hit[order]
+        rank = np.arange(len(games)) - np.searchsorted(games, games)  # Hits before this one in its game
+        multiplier = np.minimum(COMBO_MAX_MULTIPLIER, 1 + (self.combo_count[games] + rank) // COMBO_HITS_PER_MULTIPLIER)
+
+        # Firewall nodes lose one health per hit, and pay out again on every hit past zero
+        health_before = self.boss_health[games] - rank
+        boss_destroyed = boss_hit & (health_before <= 1)
+        boss_points = np.where(boss_hit, SCORE_BOSS_HIT, 0) + np.where(
+            boss_destroyed, SCORE_BOSS_DESTROY_MULTIPLIER * self.level[games], 0)
+
+        # Fragments evolve once per hit and are recovered by every hit at full evolution
+        slot = np.where(boss_hit, -1, (games * ENEMY_ROWS + row) * ENEMY_COLS + col)
+        slot_order = np.argsort(slot, kind="stable")
+        slot_sorted = slot[slot_order]
+        slot_rank = np.empty(len(games), np.int64)
+        slot_rank[slot_order] = np.arange(len(games)) - np.searchsorted(slot_sorted, slot_sorted)
+        state_before = np.minimum(MAX_STATE, self.state[games, row, col] + slot_rank)
+        destroyed = ~boss_hit & (state_before >= MAX_STATE)
+        grid_points = np.where(destroyed, SCORE_DESTROY, SCORE_HIT) * multiplier
+
+        np.add.at(self.score, games, np.where(boss_hit, boss_points, grid_points))
+        hits = np.bincount(games, minlength=self.n)
+        self.combo_count += hits.astype(np.int32)
+        self.combo_timer[hits > 0] = COMBO_DURATION
+
+        np.subtract.at(self.boss_health, games[boss_hit], 1)
+        self.boss_alive &= self.boss_health > 0
+        grid = ~boss_hit
+        np.add.at(self.state, (games[grid], row[grid], col[grid]), 1)
+        np.minimum(self.state, MAX_STATE, out=self.state)
+        self.alive[games[destroyed], row[destroyed], col[destroyed]] = False
+
+        # Upgrade drops, one roll per recovered fragment
+        drop_games, drop_row, drop_col = games[destroyed], row[destroyed], col[destroyed]
+        drop_rolls = self.rng.random(len(drop_games))
+        type_rolls = self.rng.random(len(drop_games))
+        drops = drop_rolls < POWERUP_CHANCE
+        for i, log in self.trace.items():
+            for k in np.flatnonzero(drop_games == i):
+                log.append(float(drop_rolls[k]))
+                if drops[k]:
+                    log.append(float(type_rolls[k]))
+        for k in np.flatnonzero(drops):
+            game = drop_games[k]
+            mask = self.index == game
+            centerx = self.grid_x[game] + drop_col[k] * ENEMY_SPACING + ENEMY_WIDTH // 2
+            centery = self.grid_y[game] + drop_row[k] * ENEMY_SPACING + ENEMY_HEIGHT // 2
+            kind = int(type_rolls[k] * len(POWERUP_TYPES))
+            self.spawn(mask, self.powerup_active, self.powerup_x, self.powerup_y,
+                       centerx - POWERUP_SIZE // 2, centery - POWERUP_SIZE // 2, ((self.powerup_type, kind),))
+
+    def apply_powerups(self, picked):
+        """Apply collected upgrades, like Game.apply_powerup()"""
+        def collected(kind):
+            return (picked & (self.powerup_type == kind)).sum(axis=1)
+
+        shield = collected(POWERUP_SHIELD) > 0
+        self.shield[shield] = True
+        self.shield_timer[shield] = PLAYER_SHIELD_DURATION
+
+        double = collected(POWERUP_DOUBLE_SHOT) > 0
+        self.double_shot[double] = True
+        self.double_shot_timer[double] = DOUBLE_SHOT_DURATION
+
+        self.lives[:] = np.where(collected(POWERUP_LIFE) > 0,
+                                 np.minimum(PLAYER_MAX_LIVES, self.lives + collected(POWERUP_LIFE)), self.lives)
+
+        # Bombs recover every fragment, or take up to 10 health off a firewall node each
+        bombs = collected(POWERUP_BOMB)
+        grid = (bombs > 0) & ~self.boss_mode
+        self.score[grid] += SCORE_BOMB_DESTROY * self.alive[grid].sum(axis=(1, 2))
+        self.alive[grid] = False
+        for _ in range(int(bombs.max())):
+            boss = (bombs > 0) & self.boss_alive
+            bombs -= 1
+            destroyed = boss & (self.boss_health <= 10)
+            self.boss_health[boss] = np.maximum(0, self.boss_health[boss] - 10)
+            self.score[destroyed] += SCORE_BOSS_DESTROY_MULTIPLIER * self.level[destroyed]
+            self.boss_alive &= ~destroyed
+
+
+class ScriptedRandom(random.Random):
+    """Random stream whose random() and choice() replay uniforms from a script
+
+    Used by the parity check to give a GameState the same rolls as one batched
+    game; everything else (cosmetic randint, getrandbits) stays seeded.
+    """
+
+    def __init__(self, seed=None):
+        """Initialize with an empty script"""
+        super().__init__(seed)
+        self.script = deque()
+
+    def random(self):
+        """Return the next scripted uniform"""
+        return self.script.popleft()
+
+    def choice(self, seq):
+        """Pick from seq with the next scripted uniform"""
+        return seq[int(self.script.popleft() * len(seq))]
+
+    def getrandbits(self, k):
+        """Keep integer draws on the seeded stream"""
+        return super().getrandbits(k)
+
+
+def reference_state(game):
+    """Return the comparable state of a GameState-driven game"""
+    gs = game.game_state
+    player = gs.player
+    state = {
+        "score": gs.score, "high_score": gs.high_score, "level": gs.level, "lives": player.lives,
+        "player_x": player.rect.x, "shield": player.shield, "double_shot": player.double_shot,
+        "invincible": player.invincible, "combo_count": gs.combo_count, "combo_timer": gs.combo_timer,
+        "direction": gs.enemy_direction, "move_timer": gs.enemy_move_timer,
+        "bullets": sorted(b.rect.topleft for b in gs.player_bullets),
+        "enemy_bullets": sorted(b.rect.topleft for b in gs.enemy_bullets),
+        "powerups": sorted((p.rect.x, p.rect.y, POWERUP_TYPES.index(p.type)) for p in gs.powerups),
+    }
+    if gs.boss_mode:
+        boss = next(iter(gs.enemies), None)
+        state["boss"] = (boss.rect.x, boss.rect.y, boss.health) if boss else None
+    else:
+        state["grid"] = (gs.formation.x, gs.formation.y,
+                         [[e.state if e else -1 for e in row] for row in gs.formation.slots])
+    return state
+
+
+def batch_state(sim, i):
+    """Return the comparable state of batched game i"""
+    state = {
+        "score": int(sim.score[i]), "high_score": int(sim.high_score[i]), "level": int(sim.level[i]),
+        "lives": int(sim.lives[i]), "player_x": int(sim.player_x[i]), "shield": bool(sim.shield[i]),
+        "double_shot": bool(sim.double_shot[i]), "invincible": bool(sim.invincible[i]),
+        "combo_count": int(sim.combo_count[i]), "combo_timer": int(sim.combo_timer[i]),
+        "direction": int(sim.direction[i]), "move_timer": int(sim.move_timer[i]),
+        "bullets": sorted(zip(sim.bullet_x[i][sim.bullet_active[i]].tolist(),
+                              sim.bullet_y[i][sim.bullet_active[i]].tolist())),
+        "enemy_bullets": sorted(zip(sim.enemy_bullet_x[i][sim.enemy_bullet_active[i]].tolist(),
+                                    sim.enemy_bullet_y[i][sim.enemy_bullet_active[i]].tolist())),
+        "powerups": sorted(zip(sim.powerup_x[i][sim.powerup_active[i]].tolist(),
+                               sim.powerup_y[i][sim.powerup_active[i]].tolist(),
+                               sim.powerup_type[i][sim.powerup_active[i]].tolist())),
+    }
+    if sim.boss_mode[i]:
+        state["boss"] = ((int(sim.boss_x[i]), int(sim.boss_y[i]), int(sim.boss_health[i]))
+                         if sim.boss_alive[i] else None)
+    else:
+        state["grid"] = (int(sim.grid_x[i]), int(sim.grid_y[i]),
+                         np.where(sim.alive[i], sim.state[i], -1).tolist())
+    return state
+
+
+def parity_check(games=BOSS_LEVEL_INTERVAL, ticks=3000, seed=0, shoot_chance=0.3):
+    """Step batched games next to GameState games with the same inputs and rolls
+
+    Returns None when every tick matched, or a description of the first mismatch.
+    """
+    from neurolink import Game
+    from controls import ActionInput
+
+    sim = BatchSim(games, seed)
+    sim.trace = {i: [] for i in range(games)}
+    policy_rng = np.random.default_rng(seed)
+    actions = np.zeros(games, np.int64)
+
+    # Game i starts on level 1 + i % BOSS_LEVEL_INTERVAL, so the firewall node is covered too
+    references = []
+    for i in range(games):
+        game = Game(headless=True, input_source=ActionInput(lambda tick, i=i: int(actions[i])), seed=seed + i)
+        game.game_state.rng = ScriptedRandom(seed + i)
+        for _ in range(i % BOSS_LEVEL_INTERVAL):
+            game.game_state.next_level()
+            sim.next_level(sim.index == i)
+        references.append(game)
+
+    for tick in range(ticks):
+        # Wander with occasional double moves, shooting often so grids get cleared
+        actions[:] = policy_rng.choice((0, ACTION_LEFT, ACTION_RIGHT, ACTION_LEFT | ACTION_RIGHT),
+                                       games, p=(0.3, 0.3, 0.3, 0.1))
+        actions |= np.where(policy_rng.random(games) < shoot_chance, ACTION_SHOOT, 0)
+        sim.step(actions)
+
+        for i, game in enumerate(references):
+            script = game.game_state.rng.script
+            script.extend(sim.trace[i])
+            sim.trace[i].clear()
+            game.step(autoplay=True)
+            if script:
+                return f"game {i} tick {tick}: GameState used fewer rolls than the batch ({len(script)} left)"
+
+            expected, actual = reference_state(game), batch_state(sim, i)
+            if expected != actual:
+                diff = {key: (expected.get(key), actual.get(key)) for key in expected.keys() | actual.keys()
+                        if expected.get(key) != actual.get(key)}
+                return f"game {i} tick {tick}: {diff}"
+    return None
+
+
+def benchmark(games=4096, ticks=200, seed=0):
+    """Return batched game ticks per second with random actions"""
+    sim = BatchSim(games, seed)
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, 8, (ticks, games))
+    start = time.perf_counter()
+    for tick in range(ticks):
+        sim.step(actions[tick])
+    return games * ticks / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    mismatch = parity_check()
+    print("Parity with GameState: " + ("OK" if mismatch is None else f"MISMATCH - {mismatch}"))
+    for games in (1, 256, 4096):
+        print(f"{games:5d} games: {benchmark(games):,.0f} game ticks/s")
@@ -0,0 +1,288 @@
+"""
+Scenario benchmarks for NeuroLink: Cyberpunk Data Recovery game.
+Runs scripted scenarios through Game.update/Game.draw, reports per-phase frame timings and
+peak memory as JSON, and compares them against a stored baseline to catch regressions.
+
+Usage:
+    python bench.py                              # run every scenario, print JSON
+    python bench.py --save-baseline              # store the results as the new baseline
+    python bench.py --compare                    # flag regressions against the baseline
+    python bench.py --scenario boss --profile-dir profiles  # also dump boss.pstats
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import contextlib
+import platform
+import tracemalloc
+import cProfile
+import pstats
+
+# Draw into an off-screen buffer unless a real window is asked for
+if "--window" not in sys.argv:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+import numpy as np
+from config import *
+from neurolink import Game
+from controls import ActionInput, random_policy
+from timing import SimulationClock
+from profiler import PhaseTimer
+
+# Scenarios - each sets up a fresh game and may return a per-frame hook
+
+def setup_grid(game):
+    """Full 5x10 data fragment grid with the bot moving and shooting"""
+    game.show_welcome = False
+
+
+def setup_boss(game):
+    """Firewall node level built by create_enemies"""
+    gs = game.game_state
+    game.show_welcome = False
+    gs.level = BOSS_LEVEL_INTERVAL
+    gs.create_enemies()
+
+
+def setup_bomb(game):
+    """Trace eliminator detonating on a full grid every BENCH_BOMB_INTERVAL frames"""
+    game.show_welcome = False
+    frame = [0]
+
+    def detonate():
+        if frame[0] % BENCH_BOMB_INTERVAL == 0:
+            game.apply_powerup("bomb")
+        frame[0] += 1
+
+    return detonate
+
+
+def setup_particles(game):
+    """10k live particles, topped up every frame"""
+    gs = game.game_state
+    game.show_welcome = False
+    rng = random.Random(0)
+
+    def refill():
+        missing = BENCH_PARTICLES - len(gs.particles)
+        while missing > 0:
+            count = min(missing, PARTICLE_COUNT_EXPLOSION)
+            gs.create_particles(rng.randrange(WIDTH), rng.randrange(HEIGHT), NEON_RED, count)
+            missing -= count
+
+    refill()
+    return refill
+
+
+def setup_welcome(game):
+    """Welcome screen on its own, before any game state is built (the startup path)"""
+    game.show_welcome = True
+
+
+SCENARIOS = {
+    "grid": (setup_grid, True),
+    "boss": (setup_boss, True),
+    "bomb": (setup_bomb, True),
+    "particles": (setup_particles, True),
+    "welcome": (setup_welcome, False),  # A key press would leave the welcome screen
+}
+
+
+def make_game(name, seed, dirty_rects, postfx=0):
+    """Build a game for a scenario with deterministic input, time and randomness"""
+    setup, bot = SCENARIOS[name]
+    policy = random_policy(seed) if bot else (lambda tick: 0)
+    with contextlib.redirect_stdout(sys.stderr):  # Keep stdout clean for the JSON report
+        game = Game(dirty_rects=dirty_rects, input_source=ActionInput(policy), clock=SimulationClock(), seed=seed,
+                    postfx=postfx)
+
+    hook = setup(game)
+    return game, hook
+
+
+def play(game, hook, frames, timer=None):
+    """Run frames of events, update and draw (the game state is only fetched once play has started)"""
+    perf_counter = time.perf_counter
+    for _ in range(frames):
+        if hook:
+            hook()
+        start = perf_counter()
+        game.handle_events()
+        game.update()
+        game.draw()
+        game.clock.tick(FPS)
+        if timer:
+            timer.end_frame((perf_counter() - start) * 1000)
+
+        # Keep the scenario in play - restore lives, and move on from cleared levels
+        if game.show_welcome:
+            continue
+        gs = game.game_state
+        gs.player.lives = max(gs.player.lives, PLAYER_INITIAL_LIVES)
+        if gs.game_won:
+            gs.next_level()
+
+
+def run_scenario(name, frames, warmup, seed, dirty_rects, profile_dir=None, postfx=0):
+    """Benchmark one scenario and return its phase timings and peak memory"""
+    # Memory pass
+    game, hook = make_game(name, seed, dirty_rects, postfx)
+    tracemalloc.start()
+    play(game, hook, frames)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Timing pass
+    game, hook = make_game(name, seed, dirty_rects, postfx)
+    play(game, hook, warmup)
+    timer = PhaseTimer()
+    timer.wrap(game, "handle_events", "events")
+    timer.wrap(game, "update", "update")
+    timer.wrap(game, "move_enemies", "enemies")
+    timer.wrap(game, "enemy_shoot", "enemies")
+    timer.wrap(game, "check_collisions", "collisions")
+    timer.wrap(game, "apply_powerup", "powerup")
+    timer.wrap(game, "draw", "draw")
+    if game.show_welcome:
+        timer.wrap(game.welcome_stars, "draw", "stars_draw")
+    else:
+        gs = game.game_state
+        timer.wrap(gs.particles, "update", "particles_update")
+        timer.wrap(gs.stars, "draw", "stars_draw")
+        timer.wrap(gs.particles, "draw", "particles_draw")
+    timer.wrap(game.postfx, "apply", "postfx")
+    timer.wrap(game, "draw_hud", "hud")
+    play(game, hook, frames, timer)
+
+    # Optional profile pass
+    if profile_dir:
+        game, hook = make_game(name, seed, dirty_rects, postfx)
+        profiler = cProfile.Profile()
+        profiler.runcall(play, game, hook, frames)
+        os.makedirs(profile_dir, exist_ok=True)
+        path = os.path.join(profile_dir, f"{name}.pstats")
+        profiler.dump_stats(path)
+        print(f"Profile for {name} written to {path}", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(15)
+
+    return {
+        "frames": frames,
+        "phases": timer.summary(),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, tolerance=BENCH_TOLERANCE, min_ms=BENCH_MIN_DELTA_MS):
+    """Return a list of regressions of results against a baseline
+
+    A phase regresses when its p50 or p99 grows by more than tolerance and by more
+    than min_ms; peak memory regresses when it grows by more than tolerance.
+    """
+    regressions = []
+    for name, scenario in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for phase, stats in scenario["phases"].items():
+            base_stats = base["phases"].get(phase)
+            if not base_stats:
+                continue
+            for key in ("p50", "p99"):
+                old, new = base_stats[key], stats[key]
+                if new - old > min_ms and new > old * (1 + tolerance):
+                    regressions.append(f"{name}/{phase} {key}: {old:.3f} -> {new:.3f} ms "
+                                       f"(+{(new / old - 1) * 100 if old else float('inf'):.0f}%)")
+        old, new = base["peak_kb"], scenario["peak_kb"]
+        if new > old * (1 + tolerance):
+            regressions.append(f"{name} peak memory: {old:.0f} -> {new:.0f} KiB")
+    return regressions
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="NeuroLink scenario benchmarks")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--frames", type=int, default=BENCH_FRAMES,
+                        help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=BENCH_WARMUP_FRAMES,
+                        help="frames run before measuring")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--dirty-rects", action="store_true", help="benchmark the dirty-rect renderer")
+    parser.add_argument("--postfx", type=int, default=0, choices=range(len(POSTFX_TIERS)),
+                        help="post-processing quality tier to draw with")
+    parser.add_argument("--window", action="store_true", help="draw to a real window instead of off-screen")
+    parser.add_argument("--baseline", default=BENCH_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline file")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare against the baseline and exit with status 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=BENCH_TOLERANCE,
+                        help="allowed fractional slowdown before a phase counts as regressed")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument("--profile-dir", help="run each scenario under cProfile and dump <scenario>.pstats here")
+    return parser.parse_args()
+
+
+def main():
+    """Run the benchmarks"""
+    args = parse_args()
+    names = args.scenario or list(SCENARIOS)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "frames": args.frames,
+            "seed": args.seed,
+            "dirty_rects": args.dirty_rects,
+            "postfx": POSTFX_TIERS[args.postfx][0],
+        },
+        "scenarios": {},
+    }
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results["scenarios"][name] = run_scenario(name, args.frames, args.warmup, args.seed,
+                                                  args.dirty_rects, args.profile_dir, args.postfx)
+
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    status = 0
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first", file=sys.stderr)
+            status = 2
+        else:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+            regressions = compare(results, baseline, args.tolerance)
+            for line in regressions:
+                print(f"REGRESSION {line}", file=sys.stderr)
+            if regressions:
+                status = 1
+            else:
+                print("No regressions against the baseline", file=sys.stderr)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(text + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+
+    pygame.quit()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
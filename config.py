@@ -6,11 +6,29 @@ Contains all game constants and settings for easier tuning.
 # Display settings
 WIDTH = 800
 HEIGHT = 600
-FPS = 60
+FPS = 60  # Simulation steps per second; all frame-count timers below tick at this rate
+
+# Frame pacing
+RENDER_FPS = 0  # Render frame cap, 0 to follow the display refresh rate (FPS when unknown)
+MAX_CATCHUP_STEPS = 5  # Simulation steps per rendered frame before the backlog is dropped
+INTERPOLATION_MAX_DISTANCE = 64  # Sprites that jump further than this are not interpolated
+FRAME_STATS_WINDOW = 600  # Frames kept for the jitter and percentile stats
+
+# Rendering
+DIRTY_RECT_RENDERING = False  # Redraw only changed regions (--dirty-rects)
+DIRTY_RECT_FULL_FLIP_THRESHOLD = 0.4  # Fraction of the screen above which a full flip is cheaper
+RENDER_BACKEND = "surface"  # "surface" blits in software, "texture" draws through SDL's renderer (--backend)
+TEXTURE_RENDERER_SOFTWARE = False  # Use SDL's software renderer for the texture backend (--software-renderer)
+TEXT_CACHE_SIZE = 64  # Rendered HUD text surfaces kept in the LRU cache
+FONT_CACHE_FILE = ".font_cache.json"  # System font paths resolved on earlier launches
 
 # Cyberpunk color palette
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
 NEON_BLUE = (0, 195, 255)      # Bright blue
 NEON_TEAL = (0, 255, 207)     # Bright teal
 NEON_CYAN = (0, 240, 255)     # Electric cyan
@@ -29,14 +47,17 @@ PLAYER_HEIGHT = 40
 PLAYER_SPEED = 8
 PLAYER_INITIAL_LIVES = 3  # System integrity levels
 PLAYER_MAX_LIVES = 5
-PLAYER_INVINCIBLE_DURATION = 120  # 2 seconds at 60 FPS - Neural buffer
-PLAYER_SHIELD_DURATION = 600  # 10 seconds at 60 FPS - Firewall protection
+PLAYER_INVINCIBLE_DURATION = 2 * FPS  # 2 seconds - Neural buffer
+PLAYER_SHIELD_DURATION = 10 * FPS  # 10 seconds - Firewall protection
+PLAYER_ANIM_FRAMES = 10  # Baked thrust/shield frames per 1 second cycle
+PLAYER_GLITCH_FRAMES = 3  # Baked glitch variants for the neural buffer effect
+PLAYER_FRAME_SEED = 0  # Seeds the thrust and glitch jitter, so every process bakes the same frames
 
 # Data Packet settings
 BULLET_WIDTH = 5
 BULLET_HEIGHT = 15
 BULLET_SPEED = 10
-DOUBLE_SHOT_DURATION = 600  # 10 seconds at 60 FPS - Bandwidth boost
+DOUBLE_SHOT_DURATION = 10 * FPS  # 10 seconds - Bandwidth boost
 
 # Data Fragment settings
 ENEMY_WIDTH = 40
@@ -49,6 +70,10 @@ ENEMY_MOVE_DOWN = 20
 ENEMY_INITIAL_MOVE_DELAY = 30
 ENEMY_SHOOT_CHANCE = 0.005  # Corruption spread chance
 ENEMY_EVOLUTION_CHANCE = 0.3  # Chance of fragment evolution on descent
+ENEMY_ROTATION_SPEED = 30  # Degrees per second a fragment turns
+ENEMY_ATLAS_ROTATION_FRAMES = 12  # Animation frames per turn of a fragment's symmetry
+ENEMY_ATLAS_COLOR_STEP = 20  # Fragment color shifts are rounded to this step (levels -30, -10, 10, 30)
+ENEMY_ATLAS_CIRCUIT_VARIANTS = 3  # Circuit patterns per evolved state
 
 # Firewall Node settings
 BOSS_SCALE = 4  # Firewall node is 4x the size of regular data fragments
@@ -58,6 +83,8 @@ BOSS_HEALTH_INCREASE_PER_LEVEL = 10
 BOSS_SHOOT_CHANCE_MULTIPLIER = 5
 BOSS_MOVE_SPEED_MULTIPLIER = 2
 BOSS_MOVE_DOWN_CHANCE = 0.05
+BOSS_RING_ANGLE_STEP = 1  # Degrees between the firewall node's pre-rotated ring frames (the best quality tier)
+BOSS_SHIELD_ALPHA_STEP = 8  # Shield opacity levels are rounded to this step
 
 # System Upgrade settings
 POWERUP_TYPES = ["shield", "double_shot", "life", "bomb"]
@@ -71,8 +98,14 @@ POWERUP_CHANCE = 0.01
 POWERUP_SPEED = 2
 POWERUP_SIZE = 20
 
+# Sprite pools - pre-allocated sprites per level type
+POOL_SIZES = {
+    "grid": {"bullet": 16, "enemy_bullet": 16, "powerup": 4},
+    "boss": {"bullet": 16, "enemy_bullet": 48, "powerup": 4},
+}
+
 # Combo system
-COMBO_DURATION = 120  # 2 seconds at 60 FPS
+COMBO_DURATION = 2 * FPS  # 2 seconds
 COMBO_MAX_MULTIPLIER = 8
 COMBO_HITS_PER_MULTIPLIER = 3
 
@@ -92,6 +125,7 @@ PARTICLE_MIN_SIZE = 2
 PARTICLE_MAX_SIZE = 5
 PARTICLE_MIN_LIFETIME = 30
 PARTICLE_MAX_LIFETIME = 60
+PARTICLE_CAPACITY = 2048  # Initial particle array size (grows as needed)
 
 # Star background
 STAR_COUNT = 100
@@ -99,6 +133,44 @@ STAR_MIN_SIZE = 1
 STAR_MAX_SIZE = 3
 STAR_MIN_SPEED = 0.1
 STAR_MAX_SPEED = 0.5
+STAR_DIRTY_LIMIT = 256  # Moved stars above which the dirty-rect path repaints everything
+STAR_LAYERS = [
+    # (share of stars, min size, max size, min speed, max speed, color)
+    (0.5, STAR_MIN_SIZE, STAR_MIN_SIZE, STAR_MIN_SPEED, 0.2, (0, 120, 128)),  # Far - dim and slow
+    (0.35, STAR_MIN_SIZE, 2, 0.2, 0.35, (0, 180, 192)),  # Mid
+    (0.15, 2, STAR_MAX_SIZE, 0.35, STAR_MAX_SPEED, NEON_CYAN),  # Near - bright and fast
+]
+
+# Post-processing (--postfx) - glow and CRT scanlines over the world layers, under the HUD
+POSTFX_QUALITY = 0  # Starting tier (index into POSTFX_TIERS), 0 is off
+POSTFX_THRESHOLD = 100  # Channel level above which a pixel glows
+POSTFX_GLOW_STRENGTH = 2.0  # Glow brightness relative to the blurred bright pixels
+POSTFX_SCANLINE_LEVEL = 200  # Brightness of every other row (of 255)
+POSTFX_MASK_LEVEL = 215  # Brightness of the two dimmed channels in each CRT mask column (of 255)
+POSTFX_TIERS = [
+    # (name, downscale, blur radius, blur passes, smooth upscale, scanlines, CRT mask) - cost at
+    # 800x600 on a single-core Xeon VM, measured by python postfx.py
+    ("off", 0, 0, 0, False, False, False),
+    ("low", 4, 2, 1, False, False, False),  # p50 2.0 ms
+    ("medium", 4, 3, 2, True, True, False),  # p50 3.7 ms
+    ("high", 2, 5, 2, True, True, True),  # p50 8.2 ms
+]
+
+# Quality governor - steps visual load down when frames miss their budget, back up with headroom
+QUALITY_GOVERNOR = True  # Adapt quality at run time (--no-governor keeps the best tier)
+QUALITY_TIERS = [
+    # (name, particle share, star share, post-processing cap, firewall node ring step in degrees) - best first
+    ("high", 1.0, 1.0, 3, BOSS_RING_ANGLE_STEP),
+    ("medium", 0.6, 0.7, 2, 3),
+    ("low", 0.35, 0.45, 1, 5),
+    ("minimal", 0.2, 0.25, 0, 9),
+]
+GOVERNOR_DOWN_LOAD = 0.9  # Median frame work above this share of the budget drops a tier
+GOVERNOR_DOWN_FRAMES = 30  # Frames the median is taken over
+GOVERNOR_UP_LOAD = 0.6  # Frame work that stays below this share of the budget raises a tier
+GOVERNOR_UP_PERCENTILE = 90  # ...for this percentile of frames
+GOVERNOR_UP_FRAMES = 180  # Frames at a tier before a raise is considered
+GOVERNOR_UP_MAX_FRAMES = 3600  # Longest wait before retrying a raise that had to be undone
 
 # Difficulty scaling
 LEVEL_MOVE_DELAY_DECREASE = 5
@@ -106,6 +178,17 @@ LEVEL_MOVE_DELAY_MIN = 5
 LEVEL_SHOOT_CHANCE_INCREASE = 0.002
 
 # Sound settings
+SOUND_DIR = "sounds"
+SOUND_FILES = {
+    "shoot": "Space Shooter SFX by edwardszakal.wav",
+    "hit": "Space Shooter SFX by edwardszakal.wav",
+    "game_over": "Game Over 02 Voices by LilMati.wav",
+    "powerup": "Bouncing Power Up 1_2 by Joao Janz.wav",
+    "explosion": "Space Explosion by Morgan Purkis.wav",
+    "level_up": "Level Up Mission Complete by Beetlemuse.wav"
+}
+SOUND_CACHE = True  # Keep decoded samples on disk so later launches skip decoding
+SOUND_CACHE_DIR = "sounds/.cache"
 SOUND_VOLUME = {
     "shoot": 0.3,
     "hit": 0.4,
@@ -115,6 +198,66 @@ SOUND_VOLUME = {
     "level_up": 0.7
 }
 
+# Voice management
+SOUND_CHANNEL_GROUPS = {  # Group -> mixer channels reserved for it
+    "cues": 2,  # Game over and level up are never drowned out by combat
+    "player": 3,
+    "combat": 6
+}
+SOUND_GROUP = {
+    "shoot": "player",
+    "hit": "combat",
+    "game_over": "cues",
+    "powerup": "player",
+    "explosion": "combat",
+    "level_up": "cues"
+}
+SOUND_PRIORITY = {  # A full group steals its lowest-priority, oldest voice for an equal or higher priority sound
+    "shoot": 1,
+    "hit": 0,
+    "game_over": 3,
+    "powerup": 2,
+    "explosion": 1,
+    "level_up": 2
+}
+SOUND_DEFAULT_GROUP = "combat"
+SOUND_DEDUPE_WINDOW = 0.04  # Seconds within which a repeat of the same sound is dropped
+SOUND_SEGMENTS = {}  # Sound name -> (source sound, start seconds, duration seconds), sliced at load time
+
+# Replays
+REPLAY_KEYFRAME_INTERVAL = 10 * FPS  # Ticks between game state keyframes for seeking
+
+# Frame profiler overlay (F3, F4 exports CSV)
+PROFILER_HISTORY = 600  # Frames of phase samples kept for graphs, percentiles and export
+PROFILER_REFRESH_HZ = 4  # Panel re-renders per second
+PROFILER_WIDTH = 300
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_ALPHA = None  # Panel opacity (0-255), None for an opaque and cheaper blit
+PROFILER_FONT_SIZE = 14
+PROFILER_CSV_NAME = "profile-%Y%m%d-%H%M%S.csv"  # strftime pattern
+
+# Benchmarks (bench.py)
+BENCH_FRAMES = 300  # Measured frames per scenario
+BENCH_WARMUP_FRAMES = 30
+BENCH_PERCENTILES = (50, 90, 99)
+BENCH_PARTICLES = 10000  # Live particles in the particle stress scenario
+BENCH_BOMB_INTERVAL = 60  # Frames between detonations in the bomb scenario
+BENCH_BASELINE = "bench_baseline.json"
+BENCH_TOLERANCE = 0.15  # Allowed fractional slowdown before a phase is flagged
+BENCH_MIN_DELTA_MS = 0.05  # Smaller slowdowns are treated as noise
+
 # Emoji states
 EMOJI_STATES = ["😊", "😐", "😠", "😡"]
 BOSS_EMOJI = "👿"
+
+# Batched simulation
+BATCH_BULLET_CAPACITY = 128  # Data packet slots per game - enough to fire double shots every tick
+BATCH_ENEMY_BULLET_CAPACITY = 128  # Corruption packet slots per game
+BATCH_POWERUP_CAPACITY = 16  # Upgrade slots per game
+
+# Environment pool
+POOL_OBS_ENEMY_BULLETS = 8  # Lowest corruption packets in a feature observation
+POOL_OBS_POWERUPS = 4  # Upgrades in a feature observation
+POOL_STEP_TIMEOUT = 10  # Seconds a worker may take for one command before it is replaced
+POOL_SPAWN_TIMEOUT = 30  # Seconds a new worker may take to start its games
+POOL_MAX_RESTARTS = 100  # Worker replacements before the pool gives up
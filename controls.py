@@ -0,0 +1,82 @@
+"""
+Input sources for NeuroLink: Cyberpunk Data Recovery game.
+The game reads events and held keys through an input source, so scripted or bot input can
+drive it without a keyboard or window.
+"""
+
+import random
+import pygame
+
+# Per-tick action bits used by scripted and bot input
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_SHOOT = 4
+
+
+class KeyboardInput:
+    """Live keyboard and window events from pygame"""
+
+    def get_events(self):
+        """Return the pending pygame events"""
+        return pygame.event.get()
+
+    def get_pressed(self):
+        """Return the held key state"""
+        return pygame.key.get_pressed()
+
+
+class HeldKeys:
+    """Key state mapping for synthetic input, indexable like pygame.key.get_pressed()"""
+
+    def __init__(self, keys=()):
+        """Initialize with the set of held keys"""
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class ActionInput:
+    """Input driven by per-tick action bits from a policy callable
+
+    The policy is called once per tick with the tick number and returns a
+    combination of ACTION_LEFT, ACTION_RIGHT and ACTION_SHOOT.
+    """
+
+    def __init__(self, policy):
+        """Initialize with the action policy"""
+        self.policy = policy
+        self.tick = 0
+        self.action = 0
+
+    def get_events(self):
+        """Advance one tick and return a space key press if the action shoots"""
+        self.action = self.policy(self.tick)
+        self.tick += 1
+        if self.action & ACTION_SHOOT:
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+        return []
+
+    def get_pressed(self):
+        """Return the movement keys held by the current action"""
+        keys = []
+        if self.action & ACTION_LEFT:
+            keys.append(pygame.K_LEFT)
+        if self.action & ACTION_RIGHT:
+            keys.append(pygame.K_RIGHT)
+        return HeldKeys(keys)
+
+
+def random_policy(seed=None, shoot_chance=0.2):
+    """Return a policy that wanders left and right and shoots at random"""
+    rng = random.Random(seed)
+    state = {"move": 0, "hold": 0}
+
+    def policy(tick):
+        if state["hold"] <= 0:
+            state["move"] = rng.choice((0, ACTION_LEFT, ACTION_RIGHT))
+            state["hold"] = rng.randint(5, 30)
+        state["hold"] -= 1
+        return state["move"] | (ACTION_SHOOT if rng.random() < shoot_chance else 0)
+
+    return policy
@@ -0,0 +1,345 @@
+"""
+Multiprocess environment pool for NeuroLink: Cyberpunk Data Recovery game.
+Hosts K headless games across worker processes and steps them in lockstep. Actions,
+observations, rewards and done flags live in shared memory, so a step only signals each
+worker with a one-byte message; nothing is pickled.
+
+Usage:
+    python env_pool.py --envs 32 --workers 4 --steps 5000
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from multiprocessing import connection, shared_memory
+import numpy as np
+from config import *
+
+# Observation layout - one float32 row per game
+OBS_PLAYER = 13  # Player, upgrades, combo, level, firewall node and formation scalars
+OBS_GRID = ENEMY_ROWS * ENEMY_COLS  # Fragment evolution per grid slot, 0 when empty
+OBS_BULLETS = 2 * POOL_OBS_ENEMY_BULLETS  # Lowest corruption packets (x, y)
+OBS_POWERUPS = 3 * POOL_OBS_POWERUPS  # Upgrades (x, y, type)
+OBS_SIZE = OBS_PLAYER + OBS_GRID + OBS_BULLETS + OBS_POWERUPS
+
+# Worker commands and replies
+CMD_STEP = b"s"
+CMD_RESET = b"r"
+CMD_CLOSE = b"q"
+REPLY_READY = b"k"
+
+
+def observe(game, out):
+    """Write a game's feature observation into the float32 row out"""
+    gs = game.game_state
+    player = gs.player
+    out[:] = 0
+    out[0] = player.rect.x / WIDTH
+    out[1] = player.lives / PLAYER_MAX_LIVES
+    out[2] = player.shield
+    out[3] = player.double_shot
+    out[4] = player.invincible
+    out[5] = gs.combo_multiplier / COMBO_MAX_MULTIPLIER
+    out[6] = gs.level
+    out[7] = gs.boss_mode
+    if gs.boss_mode:
+        for boss in gs.enemies:
+            out[8] = boss.health / boss.max_health
+            out[9] = boss.rect.x / WIDTH
+            out[10] = boss.rect.y / HEIGHT
+    else:
+        formation = gs.formation
+        out[11] = formation.x / WIDTH
+        out[12] = formation.y / HEIGHT
+        grid = out[OBS_PLAYER:OBS_PLAYER + OBS_GRID]
+        for enemy in formation.fragments():
+            row, col = enemy.slot
+            grid[row * ENEMY_COLS + col] = (enemy.state + 1) / len(EMOJI_STATES)
+
+    offset = OBS_PLAYER + OBS_GRID
+    bullets = sorted(gs.enemy_bullets, key=lambda bullet: -bullet.rect.y)[:POOL_OBS_ENEMY_BULLETS]
+    for i, bullet in enumerate(bullets):
+        out[offset + 2 * i] = bullet.rect.centerx / WIDTH
+        out[offset + 2 * i + 1] = bullet.rect.centery / HEIGHT
+
+    offset += OBS_BULLETS
+    for i, powerup in enumerate(list(gs.powerups)[:POOL_OBS_POWERUPS]):
+        out[offset + 3 * i] = powerup.rect.centerx / WIDTH
+        out[offset + 3 * i + 1] = powerup.rect.centery / HEIGHT
+        out[offset + 3 * i + 2] = (POWERUP_TYPES.index(powerup.type) + 1) / len(POWERUP_TYPES)
+
+
+class SharedBuffers:
+    """Named shared-memory arrays for actions, observations, rewards, dones and worker stats"""
+
+    def __init__(self, num_envs, num_workers, names=None):
+        """Create the buffers, or attach to existing ones when names is given"""
+        layout = {
+            "actions": ((num_envs,), np.int8),
+            "obs": ((num_envs, OBS_SIZE), np.float32),
+            "rewards": ((num_envs,), np.float32),
+            "dones": ((num_envs,), np.bool_),
+            "stats": ((num_workers, 2), np.float64),  # Steps and busy seconds per worker
+        }
+        self.owner = names is None
+        self.blocks = {}
+        for key, (shape, dtype) in layout.items():
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            if self.owner:
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[key])
+            self.blocks[key] = block
+            array = np.ndarray(shape, dtype, buffer=block.buf)
+            if self.owner:
+                array[...] = 0
+            setattr(self, key, array)
+
+    @property
+    def names(self):
+        """Return the block names, for attaching from another process"""
+        return {key: block.name for key, block in self.blocks.items()}
+
+    def close(self):
+        """Detach from the buffers, freeing them if this process created them"""
+        for key in self.blocks:
+            setattr(self, key, None)  # Drop the array views before closing their memory
+        for block in self.blocks.values():
+            block.close()
+            if self.owner:
+                block.unlink()
+        self.blocks = {}
+
+
+def worker_main(worker, start, stop, num_envs, num_workers, names, seed, conn):
+    """Worker process: host games start..stop-1 and step them on command"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from neurolink import Game
+    from controls import ActionInput
+    import timing
+
+    buffers = SharedBuffers(num_envs, num_workers, names)
+    actions, obs, rewards, dones = buffers.actions, buffers.obs, buffers.rewards, buffers.dones
+    stats = buffers.stats[worker]
+    games = [Game(headless=True, input_source=ActionInput(lambda tick, i=i: int(actions[i])), seed=seed + i)
+             for i in range(start, stop)]
+    envs = list(zip(range(start, stop), games))
+    for i, game in envs:
+        observe(game, obs[i])
+    conn.send_bytes(REPLY_READY)
+
+    perf_counter = time.perf_counter
+    while True:
+        command = conn.recv_bytes()
+        begin = perf_counter()
+        if command == CMD_STEP:
+            for i, game in envs:
+                gs = game.game_state
+                timing.set_clock(gs.clock)
+                score = gs.score
+                done = game.step(autoplay=True)
+                rewards[i] = 0 if done else gs.score - score
+                dones[i] = done
+                observe(game, obs[i])
+            stats[0] += len(envs)
+        elif command == CMD_RESET:
+            for i, game in envs:
+                game.game_state.reset()
+                rewards[i] = 0
+                dones[i] = False
+                observe(game, obs[i])
+        elif command == CMD_CLOSE:
+            break
+        stats[1] += perf_counter() - begin
+        conn.send_bytes(REPLY_READY)
+
+    del actions, obs, rewards, dones, stats
+    buffers.close()
+    conn.close()
+
+
+class EnvPool:
+    """K headless games spread over worker processes, stepped in lockstep
+
+    step() and reset() return views of the shared buffers, which the next call
+    overwrites. A worker that dies or stops answering within POOL_STEP_TIMEOUT is
+    replaced; its games restart with fresh seeds and report done for that step.
+    """
+
+    def __init__(self, num_envs, num_workers=None, seed=0):
+        """Start the workers and wait for their first observations"""
+        self.num_envs = num_envs
+        self.num_workers = max(1, min(num_envs, num_workers or os.cpu_count() or 1))
+        self.seed = seed
+        self.buffers = SharedBuffers(num_envs, self.num_workers)
+        self.context = multiprocessing.get_context("spawn")  # pygame state must not be forked
+        bounds = [num_envs * worker // self.num_workers for worker in range(self.num_workers + 1)]
+        self.slices = list(zip(bounds[:-1], bounds[1:]))
+        self.processes = [None] * self.num_workers
+        self.conns = [None] * self.num_workers
+        self.generations = [0] * self.num_workers
+        self.restarts = 0
+        self.start_time = time.perf_counter()
+        try:
+            for worker in range(self.num_workers):
+                self.spawn(worker)
+            self.wait(range(self.num_workers), POOL_SPAWN_TIMEOUT)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def spawn(self, worker):
+        """Start (or restart) a worker process"""
+        start, stop = self.slices[worker]
+        seed = self.seed + start + self.generations[worker] * self.num_envs
+        parent, child = self.context.Pipe()
+        process = self.context.Process(
+            target=worker_main, daemon=True,
+            args=(worker, start, stop, self.num_envs, self.num_workers, self.buffers.names, seed, child))
+        process.start()
+        child.close()
+        self.processes[worker] = process
+        self.conns[worker] = parent
+
+    def respawn(self, worker, hung=False):
+        """Replace a crashed or hung worker"""
+        process = self.processes[worker]
+        if hung:
+            process.kill()
+        process.join()
+        self.conns[worker].close()
+        self.generations[worker] += 1
+        self.restarts += 1
+        if self.restarts > POOL_MAX_RESTARTS:
+            raise RuntimeError(f"Workers failed {self.restarts} times; giving up")
+        reason = "stopped answering" if hung else f"exited with code {process.exitcode}"
+        print(f"Worker {worker} {reason}; restarting", file=sys.stderr)
+        self.spawn(worker)
+
+    def wait(self, workers, timeout=POOL_STEP_TIMEOUT):
+        """Wait for every worker in workers to finish its command, replacing failed ones
+
+        Returns the workers that were replaced.
+        """
+        pending = {self.conns[worker]: worker for worker in workers}
+        sentinels = {self.processes[worker].sentinel: worker for worker in workers}
+        failed = []
+        hung = []
+        deadline = time.monotonic() + timeout
+        while pending:
+            ready = connection.wait(list(pending) + list(sentinels), max(0, deadline - time.monotonic()))
+            if not ready:  # Timed out - every pending worker is hung
+                hung = list(pending.values())
+                failed.extend(hung)
+                break
+            for item in ready:
+                if item in pending:
+                    worker = pending[item]
+                    try:
+                        item.recv_bytes()
+                    except (EOFError, OSError):
+                        failed.append(worker)
+                    del pending[item]
+                    sentinels.pop(self.processes[worker].sentinel, None)
+            for item in ready:
+                if item in sentinels:  # Died without answering
+                    worker = sentinels.pop(item)
+                    failed.append(worker)
+                    pending = {conn: w for conn, w in pending.items() if w != worker}
+
+        # Replacements start from fresh games, which ends those games' episodes
+        for worker in failed:
+            self.respawn(worker, worker in hung)
+        if failed:
+            self.wait(failed, POOL_SPAWN_TIMEOUT)
+            for worker in failed:
+                start, stop = self.slices[worker]
+                self.buffers.rewards[start:stop] = 0
+                self.buffers.dones[start:stop] = True
+        return failed
+
+    def command(self, message):
+        """Send a command to every worker and wait for them all"""
+        for worker, conn in enumerate(self.conns):
+            try:
+                conn.send_bytes(message)
+            except (BrokenPipeError, OSError):
+                pass  # Picked up as a crash by wait()
+        return self.wait(range(self.num_workers))
+
+    def reset(self):
+        """Restart every game and return the observations"""
+        self.command(CMD_RESET)
+        return self.buffers.obs
+
+    def step(self, actions):
+        """Step every game with one ACTION_* bitmask each and return (obs, rewards, dones)"""
+        self.buffers.actions[:] = actions
+        self.command(CMD_STEP)
+        return self.buffers.obs, self.buffers.rewards, self.buffers.dones
+
+    def stats(self):
+        """Return steps/sec per worker (over its busy time) and overall, plus restarts"""
+        steps, busy = self.buffers.stats[:, 0], self.buffers.stats[:, 1]
+        elapsed = time.perf_counter() - self.start_time
+        return {
+            "workers": [round(float(s / b) if b else 0.0, 1) for s, b in zip(steps, busy)],
+            "total_steps": int(steps.sum()),
+            "steps_per_second": round(float(steps.sum() / elapsed), 1) if elapsed else 0.0,
+            "restarts": self.restarts,
+        }
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        if self.buffers is None:
+            return
+        workers = [(process, conn) for process, conn in zip(self.processes, self.conns) if process is not None]
+        for process, conn in workers:
+            try:
+                conn.send_bytes(CMD_CLOSE)
+            except (BrokenPipeError, OSError):
+                pass
+        for process, conn in workers:
+            process.join(POOL_SPAWN_TIMEOUT)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            conn.close()
+        self.buffers.close()
+        self.buffers = None
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Step headless NeuroLink games in a process pool")
+    parser.add_argument("--envs", type=int, default=16, help="number of games")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--steps", type=int, default=2000, help="lockstep steps to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+    with EnvPool(args.envs, args.workers, args.seed) as pool:
+        pool.start_time = time.perf_counter()  # Leave worker start-up out of the throughput
+        episodes = 0
+        for _ in range(args.steps):
+            obs, rewards, dones = pool.step(rng.integers(0, 8, args.envs))
+            episodes += int(dones.sum())
+        stats = pool.stats()
+    print(f"{stats['total_steps']} steps at {stats['steps_per_second']:.0f} steps/s over "
+          f"{len(stats['workers'])} workers ({episodes} games ended, {stats['restarts']} restarts)")
+    for worker, rate in enumerate(stats["workers"]):
+        print(f"  worker {worker}: {rate:.0f} steps/s")
@@ -0,0 +1,108 @@
+"""
+Fixed-timestep helpers for NeuroLink: Cyberpunk Data Recovery game.
+The simulation always advances in SIM_RATE steps per second while rendering runs at its own
+rate; these helpers interpolate sprite positions between steps and track frame pacing.
+"""
+
+import math
+from collections import deque
+import pygame
+from config import *
+
+def display_refresh_rate(default=FPS):
+    """Return the refresh rate of the current display, or default when SDL cannot tell"""
+    for name in ("get_current_refresh_rate", "get_desktop_refresh_rates"):
+        query = getattr(pygame.display, name, None)
+        if query is None:
+            continue
+        try:
+            rate = query()
+        except pygame.error:
+            continue
+        if isinstance(rate, (list, tuple)):
+            rate = rate[0] if rate else 0
+        if rate:
+            return rate
+    return default
+
+
+class Interpolator:
+    """Draws sprites between their previous and current simulation positions"""
+
+    def __init__(self, max_distance=INTERPOLATION_MAX_DISTANCE):
+        """Initialize with no captured positions"""
+        self.max_distance = max_distance
+        self.previous = {}
+        self.saved = []
+
+    def capture(self, sprites):
+        """Remember sprite positions before a simulation step"""
+        self.previous = {sprite: sprite.rect.topleft for sprite in sprites}
+
+    def apply(self, alpha):
+        """Move sprite rects to the blend of previous and current position
+
+        Sprites that jumped further than max_distance (respawned from a pool,
+        wrapped around) are drawn where they are. Call restore() after drawing.
+        """
+        saved = self.saved
+        max_distance = self.max_distance
+        for sprite, (px, py) in self.previous.items():
+            if not sprite.alive():
+                continue
+            rect = sprite.rect
+            x, y = rect.topleft
+            if (x, y) == (px, py) or abs(x - px) > max_distance or abs(y - py) > max_distance:
+                continue
+            saved.append((rect, x, y))
+            rect.topleft = (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+
+    def restore(self):
+        """Put sprite rects back at their simulation positions"""
+        for rect, x, y in self.saved:
+            rect.topleft = (x, y)
+        self.saved = []
+
+
+class FramePacing:
+    """Rolling frame-time and catch-up statistics for the render loop"""
+
+    def __init__(self, window=FRAME_STATS_WINDOW):
+        """Initialize empty stats"""
+        self.frame_ms = deque(maxlen=window)
+        self.frames = 0
+        self.steps = 0
+        self.catchup_frames = 0  # Frames that ran more than one simulation step
+        self.capped_frames = 0  # Frames that hit MAX_CATCHUP_STEPS and dropped backlog
+        self.dropped_ms = 0.0
+
+    def record(self, frame_ms, steps, dropped_ms):
+        """Record one rendered frame"""
+        self.frame_ms.append(frame_ms)
+        self.frames += 1
+        self.steps += steps
+        if steps > 1:
+            self.catchup_frames += 1
+        if dropped_ms:
+            self.capped_frames += 1
+            self.dropped_ms += dropped_ms
+
+    def stats(self):
+        """Return frame rate, mean frame time, jitter and catch-up counters"""
+        samples = sorted(self.frame_ms)
+        if not samples:
+            return {}
+        mean = sum(samples) / len(samples)
+        jitter = math.sqrt(sum((s - mean) ** 2 for s in samples) / len(samples))
+        return {
+            "frames": self.frames,
+            "sim_steps": self.steps,
+            "fps": 1000 / mean if mean else 0.0,
+            "mean_ms": mean,
+            "jitter_ms": jitter,
+            "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+            "max_ms": samples[-1],
+            "catchup_frames": self.catchup_frames,
+            "capped_frames": self.capped_frames,
+            "dropped_ms": self.dropped_ms,
+        }
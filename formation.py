@@ -0,0 +1,122 @@
+"""
+Enemy formation for NeuroLink: Cyberpunk Data Recovery game.
+Keeps the data fragment grid as an array of slots that moves with a single group offset, so
+the march, edge test and shooter pick do not have to visit every fragment.
+"""
+
+from config import *
+
+class Formation:
+    """Grid of data fragments moving as one unit
+
+    Fragments store their home position inside the grid; their rects follow the
+    formation origin (x, y) lazily, whenever the step counter has moved on.
+    """
+
+    def __init__(self, x, y, rows=ENEMY_ROWS, cols=ENEMY_COLS, spacing=ENEMY_SPACING):
+        """Initialize an empty formation with its top-left slot at (x, y)"""
+        self.x = x
+        self.y = y
+        self.rows = rows
+        self.cols = cols
+        self.spacing = spacing
+        self.step = 0  # Bumped whenever the origin moves
+
+        self.slots = [[None] * cols for _ in range(rows)]
+        self.count = 0
+        self.col_counts = [0] * cols
+        self.row_counts = [0] * rows
+
+        # Lowest occupied row per column (-1 when the column is empty)
+        self.bottom_rows = [-1] * cols
+
+        # Occupied slot bounds (columns and lowest row)
+        self.min_col = cols
+        self.max_col = -1
+        self.max_row = -1
+
+    def __len__(self):
+        """Return the number of fragments left in the formation"""
+        return self.count
+
+    def add(self, enemy, row, col):
+        """Place a fragment in a slot"""
+        self.slots[row][col] = enemy
+        enemy.formation = self
+        enemy.slot = (row, col)
+        enemy.home = (col * self.spacing, row * self.spacing)
+        enemy.synced_step = -1
+
+        self.count += 1
+        self.col_counts[col] += 1
+        self.row_counts[row] += 1
+        self.bottom_rows[col] = max(self.bottom_rows[col], row)
+        self.min_col = min(self.min_col, col)
+        self.max_col = max(self.max_col, col)
+        self.max_row = max(self.max_row, row)
+
+    def remove(self, enemy):
+        """Take a destroyed fragment out of its slot and shrink the bounds if needed"""
+        enemy.rect  # Sync the rect before it stops following the formation
+        row, col = enemy.slot
+        self.slots[row][col] = None
+        enemy.formation = None
+
+        self.count -= 1
+        self.col_counts[col] -= 1
+        self.row_counts[row] -= 1
+
+        if row == self.bottom_rows[col]:
+            column_row = row - 1
+            while column_row >= 0 and self.slots[column_row][col] is None:
+                column_row -= 1
+            self.bottom_rows[col] = column_row
+
+        if not self.count:
+            self.min_col, self.max_col, self.max_row = self.cols, -1, -1
+            return
+        while not self.col_counts[self.min_col]:
+            self.min_col += 1
+        while not self.col_counts[self.max_col]:
+            self.max_col -= 1
+        while not self.row_counts[self.max_row]:
+            self.max_row -= 1
+
+    @property
+    def left(self):
+        """Screen x of the leftmost fragment edge"""
+        return self.x + self.min_col * self.spacing
+
+    @property
+    def right(self):
+        """Screen x of the rightmost fragment edge"""
+        return self.x + self.max_col * self.spacing + ENEMY_WIDTH
+
+    @property
+    def bottom(self):
+        """Screen y of the lowest fragment edge"""
+        return self.y + self.max_row * self.spacing + ENEMY_HEIGHT
+
+    def at_edge(self, direction, speed):
+        """Return True if the next horizontal step would cross a screen edge"""
+        if not self.count:
+            return False
+        return (self.right + speed > WIDTH and direction > 0) or (self.left - speed < 0 and direction < 0)
+
+    def move(self, dx, dy):
+        """Shift the whole formation"""
+        self.x += dx
+        self.y += dy
+        self.step += 1
+
+    def fragments(self):
+        """Yield every remaining fragment in row-major order"""
+        for row in self.slots:
+            for enemy in row:
+                if enemy is not None:
+                    yield enemy
+
+    def shooters(self):
+        """Return the bottom fragment of each occupied column"""
+        slots = self.slots
+        return [slots[row][col] for col, row in enumerate(self.bottom_rows) if row >= 0]
@@ -0,0 +1,120 @@
+"""
+Animation atlas for NeuroLink: Cyberpunk Data Recovery game.
+Bakes data fragment frames once per evolution state, rotation step, pulse size, color
+level, circuit pattern and core color, so animating the whole grid is one blit per fragment.
+"""
+
+import pygame
+import random
+import math
+from config import *
+
+# Shape, fill color and detail level per evolution state (simple to most evolved)
+FRAGMENT_STATES = [
+    (6, NEON_TEAL, 0),  # Simple data - basic hexagon shape with minimal detail
+    (8, NEON_GREEN, 1),  # Starting to evolve - octagon with inner details
+    (10, NEON_YELLOW, 2),  # More complex - decagon with multiple layers
+    (12, NEON_ORANGE, 3),  # Final form - complex with internal structure
+]
+
+class FragmentAtlas:
+    """Data fragment frames shared by every fragment, each drawn the first time it is shown
+
+    Shapes repeat every 360/sides degrees, so ENEMY_ATLAS_ROTATION_FRAMES frames
+    cover a full turn; the pulse only changes the whole-pixel outer radius.
+    """
+
+    def __init__(self, width=ENEMY_WIDTH, height=ENEMY_HEIGHT):
+        """Initialize an empty atlas for fragments of the given size"""
+        self.width = width
+        self.height = height
+        self.frames = {}  # (state, color level, circuits, rotation frame, radius, red core) -> Surface
+        self.radius = min(width, height) // 2
+
+        # Per state: degrees before the shape repeats, and rotation frames per degree
+        self.turns = [(360 / sides, sides * ENEMY_ATLAS_ROTATION_FRAMES / 360) for sides, _, _ in FRAGMENT_STATES]
+
+    def __len__(self):
+        """Return the number of baked frames"""
+        return len(self.frames)
+
+    def frame(self, state, color_level, circuits, rotation, pulse, ticks):
+        """Return the frame for a fragment's look at this moment
+
+        Args:
+            state: Evolution state (0-3)
+            color_level: Quantized color shift (see color_level())
+            circuits: Circuit pattern (0 to ENEMY_ATLAS_CIRCUIT_VARIANTS - 1, 0 below state 2)
+            rotation: Rotation in degrees
+            pulse: Size factor (0.7-1.0)
+            ticks: Game milliseconds (the most evolved core blinks with them)
+        """
+        period, frames_per_degree = self.turns[state]
+        key = (state, color_level, circuits, int(rotation % period * frames_per_degree),
+               int(self.radius * pulse), state > 2 and ticks % 1000 > 500)
+        surface = self.frames.get(key)
+        if surface is None:
+            surface = self.bake(*key)
+            self.frames[key] = surface
+        return surface
+
+    def bake(self, state, color_level, circuits, rotation_frame, outer_radius, red_core):
+        """Draw one frame"""
+        num_sides, base_color, detail_level = FRAGMENT_STATES[state]
+        image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+
+        # Apply color shift for variety
+        color_shift = color_level * ENEMY_ATLAS_COLOR_STEP - 30
+        color = tuple(max(0, min(255, channel + color_shift)) for channel in base_color[:3])
+
+        rotation_angle = rotation_frame * 360 / (num_sides * ENEMY_ATLAS_ROTATION_FRAMES)
+        pulse = outer_radius / self.radius
+
+        # Draw fragment shape
+        center = (self.width // 2, self.height // 2)
+
+        # Draw outer shape
+        points = []
+        for i in range(num_sides):
+            angle = 2 * math.pi * i / num_sides + math.radians(rotation_angle)
+            x = center[0] + outer_radius * math.cos(angle)
+            y = center[1] + outer_radius * math.sin(angle)
+            points.append((x, y))
+        pygame.draw.polygon(image, color, points)
+
+        # Add inner details based on complexity level
+        if detail_level > 0:
+            inner_radius = outer_radius * 0.7
+            points = []
+            for i in range(num_sides):
+                angle = 2 * math.pi * i / num_sides + math.radians(rotation_angle + 180/num_sides)
+                x = center[0] + inner_radius * math.cos(angle)
+                y = center[1] + inner_radius * math.sin(angle)
+                points.append((x, y))
+            pygame.draw.polygon(image, (0, 0, 0), points)
+            pygame.draw.polygon(image, NEON_PURPLE, points, 1)
+
+        if detail_level > 1:
+            # Add circuit-like patterns, the same for every frame of a pattern
+            rng = random.Random(f"{state}/{circuits}")
+            for i in range(min(4, detail_level)):
+                start_angle = math.radians(rng.randint(0, 359))
+                line_len = outer_radius * 0.6
+                start_pos = (center[0] + math.cos(start_angle) * outer_radius * 0.3,
+                            center[1] + math.sin(start_angle) * outer_radius * 0.3)
+                end_pos = (start_pos[0] + math.cos(start_angle) * line_len,
+                          start_pos[1] + math.sin(start_angle) * line_len)
+                pygame.draw.line(image, NEON_BLUE, start_pos, end_pos, 1)
+
+        if detail_level > 2:
+            # Add pulsing center core
+            core_radius = int(outer_radius * 0.25 * pulse)
+            core_color = NEON_RED if red_core else NEON_PINK
+            pygame.draw.circle(image, core_color, center, core_radius)
+
+        return image
+
+
+def color_level(color_shift):
+    """Return the atlas color level closest to a -30..30 color shift"""
+    return round((color_shift + 30) / ENEMY_ATLAS_COLOR_STEP)
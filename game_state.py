@@ -7,17 +7,52 @@ import pygame
 import random
 from config import *
 from sprites import *
+from pools import SpritePool
+from particles import ParticleSystem
+from starfield import StarField
+from spatial_hash import SpatialGroup
+from formation import Formation
+from timing import SimulationClock
+import timing
 
 class GameState:
     """Manages the digital system state, data recovery tracking, and network level progression"""
     
-    def __init__(self, sound_manager):
-        """Initialize the game state"""
+    def __init__(self, sound_manager, seed=None):
+        """Initialize the game state
+        
+        Args:
+            sound_manager: Sound effects player
+            seed: Seed for the game's random stream (random if None)
+        """
         self.sound_manager = sound_manager
+        
+        # One seeded random stream for every roll the simulation makes
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        
+        # Simulation time counts ticks, and sprite animation reads it through timing
+        self.clock = SimulationClock()
+        timing.set_clock(self.clock)
+        
+        # Share of each particle burst that is emitted and degrees between the firewall
+        # node's ring frames (the quality governor lowers and coarsens them)
+        self.particle_share = 1.0
+        self.boss_ring_step = BOSS_RING_ANGLE_STEP
+        
+        # Sprite pools of this game, pre-sized per level type
+        self.bullet_pool = SpritePool(Bullet, (0, 0))
+        self.enemy_bullet_pool = SpritePool(EnemyBullet, (0, 0))
+        self.powerup_pool = SpritePool(PowerUp, (0, 0, POWERUP_TYPES[0]))
+        
         self.reset()
     
     def reset(self):
         """Reset the game state to initial values"""
+        # Hand pooled sprites from the previous game back to their pools
+        if hasattr(self, "all_sprites"):
+            self.close()
+        
         # Game state
         self.score = 0
         self.high_score = self.high_score if hasattr(self, 'high_score') else 0
@@ -41,14 +76,13 @@ class GameState:
         self.boss_mode = False
         
         # Create sprite groups
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.RenderUpdates()
         self.players = pygame.sprite.GroupSingle()
-        self.enemies = pygame.sprite.Group()
+        self.enemies = SpatialGroup()
         self.player_bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
-        self.stars = pygame.sprite.Group()
+        self.enemy_bullets = SpatialGroup()
+        self.powerups = SpatialGroup()
+        self.particles = ParticleSystem(seed=self.rng.getrandbits(32))
         
         # Create player
         self.player = Player()
@@ -63,49 +97,52 @@ class GameState:
     
     def create_stars(self):
         """Create background stars"""
-        for _ in range(STAR_COUNT):
-            star = Star()
-            self.stars.add(star)
-            self.all_sprites.add(star)
+        self.stars = StarField(seed=self.rng.getrandbits(32))
     
     def create_enemies(self):
         """Create the enemy grid"""
         # Clear existing enemies
         self.enemies.empty()
+        self.enemies.origin = None
+        self.formation = None
         
         # Every BOSS_LEVEL_INTERVAL levels, create a boss
         if self.level % BOSS_LEVEL_INTERVAL == 0:
             self.boss_mode = True
-            boss = Boss(WIDTH // 2 - ENEMY_WIDTH * BOSS_SCALE // 2, 50, self.level)
+            self.reserve_pools("boss")
+            boss = Boss(WIDTH // 2 - ENEMY_WIDTH * BOSS_SCALE // 2, 50, self.level, self.rng, self.boss_ring_step)
             self.enemies.add(boss)
             self.all_sprites.add(boss)
             return
         
         # Regular enemy grid
         self.boss_mode = False
+        self.reserve_pools("grid")
         start_x = (WIDTH - (ENEMY_COLS * ENEMY_SPACING)) // 2
         start_y = 50
         
+        # The grid marches as one formation; hash it relative to the formation origin
+        self.formation = Formation(start_x, start_y)
+        self.enemies.origin = self.formation
+        
         for row in range(ENEMY_ROWS):
             for col in range(ENEMY_COLS):
                 x = start_x + col * ENEMY_SPACING
                 y = start_y + row * ENEMY_SPACING
-                enemy = Enemy(x, y)
+                enemy = Enemy(x, y, self.rng)
+                self.formation.add(enemy, row, col)
                 self.enemies.add(enemy)
                 self.all_sprites.add(enemy)
     
     def create_particles(self, x, y, color, count=PARTICLE_COUNT_NORMAL):
         """Create explosion particles"""
-        for _ in range(count):
-            particle = Particle(x, y, color)
-            self.particles.add(particle)
-            self.all_sprites.add(particle)
+        self.particles.emit(x, y, color, max(1, round(count * self.particle_share)))
     
     def create_powerup(self, x, y):
         """Create a random powerup with a certain chance"""
-        if random.random() < POWERUP_CHANCE:
-            powerup_type = random.choice(POWERUP_TYPES)
-            powerup = PowerUp(x, y, powerup_type)
+        if self.rng.random() < POWERUP_CHANCE:
+            powerup_type = self.rng.choice(POWERUP_TYPES)
+            powerup = self.powerup_pool.acquire(x, y, powerup_type)
             self.powerups.add(powerup)
             self.all_sprites.add(powerup)
     
@@ -117,9 +154,7 @@ class GameState:
         self.game_won = False
         
         # Clear bullets and powerups
-        self.player_bullets.empty()
-        self.enemy_bullets.empty()
-        self.powerups.empty()
+        self.release_sprites(self.player_bullets, self.enemy_bullets, self.powerups)
         
         # Create new enemies
         self.create_enemies()
@@ -127,6 +162,31 @@ class GameState:
         # Play sound
         self.sound_manager.play("level_up")
     
+    def reserve_pools(self, level_type):
+        """Pre-size the sprite pools for a level type ("grid" or "boss")"""
+        sizes = POOL_SIZES[level_type]
+        self.bullet_pool.reserve(sizes["bullet"])
+        self.enemy_bullet_pool.reserve(sizes["enemy_bullet"])
+        self.powerup_pool.reserve(sizes["powerup"])
+    
+    def release_sprites(self, *groups):
+        """Kill every sprite in the groups, returning pooled ones to their pools"""
+        for group in groups:
+            for sprite in group.sprites():
+                sprite.kill()
+    
+    def close(self):
+        """Return every pooled sprite in play to its pool, before a reset or when the state is replaced"""
+        self.release_sprites(self.player_bullets, self.enemy_bullets, self.powerups)
+    
+    def pool_stats(self):
+        """Return hit/miss/high-water counters for each sprite pool"""
+        return {
+            "bullet": self.bullet_pool.stats(),
+            "enemy_bullet": self.enemy_bullet_pool.stats(),
+            "powerup": self.powerup_pool.stats(),
+        }
+    
     def update_combo(self):
         """Update the combo system"""
         if self.combo_timer > 0:
@@ -0,0 +1,78 @@
+"""
+Quality governor for NeuroLink: Cyberpunk Data Recovery game.
+Watches how long each frame's work takes and steps visual quality down a QUALITY_TIERS tier
+when frames miss their budget, and back up when there is headroom, so one build runs smoothly
+on fast and slow machines without tuning.
+"""
+
+from collections import deque
+from config import *
+
+class QualityGovernor:
+    """Picks a QUALITY_TIERS tier (0 is the best) from recent frame work times
+
+    A tier is dropped once the median frame over GOVERNOR_DOWN_FRAMES frames takes
+    more than GOVERNOR_DOWN_LOAD of the budget, and raised once the
+    GOVERNOR_UP_PERCENTILE frame over GOVERNOR_UP_FRAMES frames stays under
+    GOVERNOR_UP_LOAD. The gap between the two loads is the hysteresis, and a raise
+    that has to be undone within GOVERNOR_UP_FRAMES doubles the wait before the
+    next raise from that tier (up to GOVERNOR_UP_MAX_FRAMES), so a machine on the
+    edge of a tier settles below it instead of flapping.
+    """
+
+    def __init__(self, budget_ms=1000 / FPS, tier=0):
+        """Initialize the governor
+
+        Args:
+            budget_ms: Work time a frame may take
+            tier: Starting tier
+        """
+        self.budget_ms = budget_ms
+        self.tier = tier
+        self.samples = deque(maxlen=GOVERNOR_UP_FRAMES)  # Work ms of recent frames at this tier
+        self.up_waits = [GOVERNOR_UP_FRAMES] * len(QUALITY_TIERS)  # Frames before raising from each tier
+        self.frames_at_tier = 0
+        self.raised = False  # The current tier was reached by a raise
+        self.changes = 0
+
+    @property
+    def name(self):
+        """Return the current tier's name"""
+        return QUALITY_TIERS[self.tier][0]
+
+    @property
+    def settings(self):
+        """Return the current tier's (name, particle share, star share, post-processing cap, ring step)"""
+        return QUALITY_TIERS[self.tier]
+
+    def record(self, work_ms):
+        """Add one frame's work time and return True if the tier changed"""
+        samples = self.samples
+        samples.append(work_ms)
+        self.frames_at_tier += 1
+
+        if self.tier < len(QUALITY_TIERS) - 1 and len(samples) >= GOVERNOR_DOWN_FRAMES:
+            recent = sorted(list(samples)[-GOVERNOR_DOWN_FRAMES:])
+            if recent[len(recent) // 2] > self.budget_ms * GOVERNOR_DOWN_LOAD:
+                if self.raised and self.frames_at_tier < GOVERNOR_UP_FRAMES:
+                    # The raise was premature; wait longer before trying it again
+                    below = self.tier + 1
+                    self.up_waits[below] = min(self.up_waits[below] * 2, GOVERNOR_UP_MAX_FRAMES)
+                self.change(self.tier + 1, raised=False)
+                return True
+
+        if self.tier > 0 and self.frames_at_tier >= self.up_waits[self.tier]:
+            ordered = sorted(samples)
+            high = ordered[min(len(ordered) - 1, len(ordered) * GOVERNOR_UP_PERCENTILE // 100)]
+            if high < self.budget_ms * GOVERNOR_UP_LOAD:
+                self.change(self.tier - 1, raised=True)
+                return True
+        return False
+
+    def change(self, tier, raised):
+        """Switch to tier and start measuring it afresh"""
+        self.tier = tier
+        self.raised = raised
+        self.samples.clear()
+        self.frames_at_tier = 0
+        self.changes += 1
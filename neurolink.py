@@ -16,58 +16,186 @@ Controls:
 - N: Proceed to next network level after completion
 - Q: Exit neural link (when disconnected or level complete)
 - M: Toggle audio atmosphere on/off
+- F3: Toggle the frame profiler overlay (F4 exports its samples to CSV)
 """
 
+import startup
 import pygame
+startup.mark("import pygame")
 import sys
+import time
+import argparse
 import random
 import math
 import os
 from config import *
 from sprites import *
+startup.mark("import config, sprites")
 from sound_manager import SoundManager
 from game_state import GameState
+from starfield import StarField
+startup.mark("import sound_manager, game_state")
+from renderer import DirtyRenderer
+from controls import KeyboardInput, ActionInput, random_policy
+from timing import WallClock, SimulationClock
+from fixed_step import Interpolator, FramePacing, display_refresh_rate
+import timing
+from screens import ScreenCache
+from text_cache import TextCache, DigitAtlas, load_font
+from profiler import ProfilerOverlay
+from postfx import PostProcess
+from governor import QualityGovernor
+from replay import Replay, RecordingInput
+import spatial_hash
+startup.mark("import renderer, screens, profiler, replay")
 
 class Game:
     """Main game class"""
     
-    def __init__(self):
-        """Initialize the game"""
-        # Initialize pygame
-        pygame.init()
+    def __init__(self, dirty_rects=DIRTY_RECT_RENDERING, headless=False, input_source=None, clock=None,
+                 seed=None, backend=RENDER_BACKEND, software_renderer=TEXTURE_RENDERER_SOFTWARE,
+                 postfx=POSTFX_QUALITY, governor=QUALITY_GOVERNOR, sound=True):
+        """Initialize the game
+        
+        Args:
+            dirty_rects: Use the dirty-rect renderer for gameplay frames (surface backend only)
+            headless: Simulate without a window, sound or rendering
+            input_source: Where events and held keys come from (keyboard by default)
+            clock: Frame limiter (uncapped simulation clock when headless)
+            seed: Seed for the game's random stream (random if None)
+            backend: "surface" to blit onto the display surface, "texture" to draw through SDL's renderer
+            software_renderer: Use SDL's software renderer for the texture backend
+            postfx: Glow and scanline quality tier (0 is off, see POSTFX_TIERS)
+            governor: Lower visual quality while frames miss their budget (see QUALITY_TIERS)
+            sound: Load and play sounds (never when headless)
+        """
+        self.headless = headless
+        self.seed = seed
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        
+        # Initialize only the pygame modules in use (the sound manager opens the mixer
+        # in the background); headless games need none
+        if not headless:
+            pygame.display.init()
+            pygame.font.init()
+            startup.mark("pygame display and font init")
+        
+        # Set up the frame limiter (the game state keeps simulation time)
+        self.clock = clock or (SimulationClock() if headless else WallClock())
+        
+        # Set up input
+        self.input = input_source or KeyboardInput()
         
-        # Set up the display
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("NeuroLink: Cyberpunk Data Recovery")
+        # Initialize sound manager
+        self.sound_manager = SoundManager(enabled=sound and not headless)
+        startup.mark("sound manager")
         
-        # Set up the clock
-        self.clock = pygame.time.Clock()
+        # Game flow control
+        self.running = True
+        self.show_welcome = not headless
+        
+        # The game state is built when the welcome screen gives way to play
+        self._game_state = None
+        if not self.show_welcome:
+            self.start_game()
+        
+        # Fixed-timestep interpolation and frame pacing stats
+        self.interpolator = Interpolator()
+        self.pacing = FramePacing()
+        
+        # Headless games never draw
+        self.renderer = None
+        self.texture_renderer = None
+        self.profiler = None
+        self.postfx = None
+        self.governor = None
+        if headless:
+            return
         
-        # Initialize sound manager
-        self.sound_manager = SoundManager()
+        # Set up the display; the texture backend draws anything that needs a
+        # surface onto its canvas, so that stands in for the screen
+        if backend == "texture":
+            from texture_renderer import TextureRenderer  # Only this backend needs pygame._sdl2
+            self.texture_renderer = TextureRenderer("NeuroLink: Cyberpunk Data Recovery", software=software_renderer)
+            self.screen = self.texture_renderer.canvas
+        else:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("NeuroLink: Cyberpunk Data Recovery")
+        startup.mark("window")
         
-        # Initialize game state
-        self.game_state = GameState(self.sound_manager)
+        # Optional dirty-rect renderer
+        if dirty_rects and not self.texture_renderer:
+            self.renderer = DirtyRenderer(self.screen)
         
         # Set up fonts
-        self.font = pygame.font.SysFont(None, 36)
-        self.small_font = pygame.font.SysFont(None, 24)
-        self.title_font = pygame.font.SysFont(None, 72)
-        
-        # Game flow control
-        self.running = True
-        self.show_welcome = True
+        self.font = load_font(None, 36)
+        self.small_font = load_font(None, 24)
+        self.title_font = load_font(None, 72)
+        startup.mark("fonts")
+        
+        # Pre-composed menu and overlay screens
+        self.screens = ScreenCache(self.font, self.small_font, self.title_font)
+        self.welcome_stars = StarField()
+        startup.mark("menu screens")
+        
+        # HUD text cache, digit atlas for changing numbers and lives icon
+        self.text_cache = TextCache()
+        self.digits = DigitAtlas(self.font, WHITE)
+        self.life_icon = pygame.Surface((21, 16), pygame.SRCALPHA)
+        pygame.draw.polygon(self.life_icon, WHITE, [(10, 0), (0, 15), (20, 15)])
+        
+        # Glow and scanlines over the world layers
+        self.postfx = PostProcess(quality=postfx)
+        self.postfx_quality = postfx  # Tier asked for; the governor may cap it
+        
+        # Frame-time driven quality tiers
+        if governor:
+            self.governor = QualityGovernor()
+        
+        # Frame profiler overlay (F3), which loads its font when first shown
+        self.profiler = ProfilerOverlay()
+        startup.mark("HUD caches")
+    
+    @property
+    def game_state(self):
+        """Return the game state, building it on first use"""
+        return self.start_game()
+    
+    @game_state.setter
+    def game_state(self, game_state):
+        """Replace the game state, handing the outgoing one's pooled sprites back"""
+        if self._game_state is not None and self._game_state is not game_state:
+            self._game_state.close()
+        self._game_state = game_state
+    
+    def start_game(self):
+        """Build the game state unless it already exists, and return it"""
+        if self._game_state is None:
+            self._game_state = GameState(self.sound_manager, self.seed)
+            startup.mark("game state")
+        return self._game_state
     
     def handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
+        for event in self.input.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             
             if event.type == pygame.KEYDOWN:
+                # Frame profiler - F3 toggles it, F4 exports its samples (never gameplay keys)
+                if event.key in (pygame.K_F3, pygame.K_F4):
+                    if self.profiler and event.key == pygame.K_F3:
+                        self.profiler.toggle()
+                    elif self.profiler and self.profiler.enabled:
+                        print(f"Profiler samples written to {self.profiler.export_csv()}")
+                    continue
+                
                 # Welcome screen - any key to start
                 if self.show_welcome:
                     self.show_welcome = False
+                    self.start_game()
                     continue
                 
                 # Pause game
@@ -98,14 +226,15 @@ class Game:
                     
                     # Debug: add random powerup
                     if event.key == pygame.K_o:  # Changed from P to O to avoid conflict with pause
-                        powerup_type = random.choice(POWERUP_TYPES)
-                        powerup = PowerUp(random.randint(50, WIDTH - 50), 50, powerup_type)
+                        rng = self.game_state.rng
+                        powerup_type = rng.choice(POWERUP_TYPES)
+                        powerup = self.game_state.powerup_pool.acquire(rng.randint(50, WIDTH - 50), 50, powerup_type)
                         self.game_state.powerups.add(powerup)
                         self.game_state.all_sprites.add(powerup)
     
     def player_shoot(self):
         """Handle player shooting"""
-        bullets = self.game_state.player.shoot()
+        bullets = self.game_state.player.shoot(self.game_state.bullet_pool.acquire)
         for bullet in bullets:
             self.game_state.player_bullets.add(bullet)
             self.game_state.all_sprites.add(bullet)
@@ -114,17 +243,18 @@ class Game:
     
     def enemy_shoot(self):
         """Handle enemy shooting"""
+        rng = self.game_state.rng
         if not self.game_state.enemies or (not self.game_state.boss_mode and 
-                                          random.random() > self.game_state.enemy_shoot_chance):
+                                          rng.random() > self.game_state.enemy_shoot_chance):
             return
         
         if self.game_state.boss_mode:
             # Boss shoots more frequently and multiple bullets
-            if random.random() < self.game_state.enemy_shoot_chance * BOSS_SHOOT_CHANCE_MULTIPLIER:
+            if rng.random() < self.game_state.enemy_shoot_chance * BOSS_SHOOT_CHANCE_MULTIPLIER:
                 boss = next(iter(self.game_state.enemies))  # Get the boss
                 # Shoot 3 bullets in a spread pattern
                 for offset in [-20, 0, 20]:
-                    bullet = EnemyBullet(
+                    bullet = self.game_state.enemy_bullet_pool.acquire(
                         boss.rect.centerx + offset,
                         boss.rect.bottom
                     )
@@ -132,16 +262,11 @@ class Game:
                     self.game_state.all_sprites.add(bullet)
             return
         
-        # Regular enemies - find bottom enemies in each column
-        columns = {}
-        for enemy in self.game_state.enemies:
-            col = int(enemy.rect.centerx / ENEMY_SPACING)
-            if col not in columns or enemy.rect.bottom > columns[col].rect.bottom:
-                columns[col] = enemy
-        
-        if columns:
-            shooter = random.choice(list(columns.values()))
-            bullet = EnemyBullet(shooter.rect.centerx, shooter.rect.bottom)
+        # Regular enemies - the bottom enemy of a random column shoots
+        shooters = self.game_state.formation.shooters()
+        if shooters:
+            shooter = rng.choice(shooters)
+            bullet = self.game_state.enemy_bullet_pool.acquire(shooter.rect.centerx, shooter.rect.bottom)
             self.game_state.enemy_bullets.add(bullet)
             self.game_state.all_sprites.add(bullet)
     
@@ -165,36 +290,32 @@ class Game:
                 gs.enemy_direction *= -1
             
             # Boss occasionally moves down
-            if random.random() < BOSS_MOVE_DOWN_CHANCE:
+            if gs.rng.random() < BOSS_MOVE_DOWN_CHANCE:
                 boss.rect.y += ENEMY_MOVE_DOWN // 2
             
+            gs.enemies.relocate(boss)
             return
         
-        # Check if any enemy has reached the edge
-        move_down = False
-        for enemy in gs.enemies:
-            if (enemy.rect.right + ENEMY_INITIAL_SPEED > WIDTH and gs.enemy_direction > 0) or \
-               (enemy.rect.left - ENEMY_INITIAL_SPEED < 0 and gs.enemy_direction < 0):
-                move_down = True
-                gs.enemy_direction *= -1
-                break
-        
-        # Move enemies
-        for enemy in gs.enemies:
-            if move_down:
-                enemy.rect.y += ENEMY_MOVE_DOWN
-                # Make enemies angrier as they descend
-                if not enemy.is_boss and enemy.state < len(EMOJI_STATES) - 1 and random.random() < ENEMY_ANGER_CHANCE:
+        # Check if the formation has reached the edge
+        formation = gs.formation
+        move_down = formation.at_edge(gs.enemy_direction, ENEMY_INITIAL_SPEED)
+        if move_down:
+            gs.enemy_direction *= -1
+            # Make enemies evolve as they descend
+            for enemy in formation.fragments():
+                if enemy.state < len(EMOJI_STATES) - 1 and gs.rng.random() < ENEMY_EVOLUTION_CHANCE:
                     enemy.state += 1
                     enemy.update_image()
-            enemy.rect.x += ENEMY_INITIAL_SPEED * gs.enemy_direction
+        
+        # Move the whole formation (the spatial hash is relative to it)
+        formation.move(ENEMY_INITIAL_SPEED * gs.enemy_direction, ENEMY_MOVE_DOWN if move_down else 0)
     
     def check_collisions(self):
         """Check for collisions between game objects"""
         gs = self.game_state  # Shorthand
         
         # Player bullets hitting enemies
-        hits = pygame.sprite.groupcollide(gs.player_bullets, gs.enemies, True, False)
+        hits = spatial_hash.groupcollide(gs.player_bullets, gs.enemies, True, False)
         for bullet, enemies_hit in hits.items():
             for enemy in enemies_hit:
                 # Handle hit
@@ -229,7 +350,7 @@ class Game:
         
         # Enemy bullets hitting player
         if not gs.player.invincible:
-            hits = pygame.sprite.spritecollide(gs.player, gs.enemy_bullets, True)
+            hits = spatial_hash.spritecollide(gs.player, gs.enemy_bullets, True)
             if hits:
                 hit_registered = gs.player.hit()
                 if hit_registered:
@@ -244,8 +365,8 @@ class Game:
                     else:
                         self.sound_manager.play("hit")
         
-        # Enemies reaching the bottom or colliding with player
-        for enemy in gs.enemies:
+        # Enemies reaching the bottom or colliding with player (only rows that reach the player can)
+        for enemy in gs.enemies.query_below(gs.player.rect.top - 1):
             if enemy.rect.bottom >= gs.player.rect.top or pygame.sprite.collide_rect(enemy, gs.player):
                 hit_registered = gs.player.hit()
                 if hit_registered:
@@ -260,7 +381,7 @@ class Game:
                 break
         
         # Player collecting power-ups
-        hits = pygame.sprite.spritecollide(gs.player, gs.powerups, True)
+        hits = spatial_hash.spritecollide(gs.player, gs.powerups, True)
         for powerup in hits:
             self.apply_powerup(powerup.type)
             self.sound_manager.play("powerup")
@@ -297,14 +418,24 @@ class Game:
             
             # Create explosion particles everywhere
             for _ in range(20):
-                gs.create_particles(random.randint(0, WIDTH), random.randint(0, HEIGHT), NEON_RED)
+                gs.create_particles(gs.rng.randint(0, WIDTH), gs.rng.randint(0, HEIGHT), NEON_RED)
             
             self.sound_manager.play("explosion")
     
     def update(self):
-        """Update game state"""
+        """Update game state by one simulation tick"""
+        # Nothing is simulated until the game starts; only the welcome stars move
+        if self.show_welcome:
+            if not self.headless:
+                self.welcome_stars.update()
+            return
+        
         gs = self.game_state  # Shorthand
         
+        # Advance simulation time and read this tick's held keys
+        gs.clock.tick()
+        keys = self.input.get_pressed()
+        
         # Skip updates if paused
         if gs.paused:
             return
@@ -317,7 +448,6 @@ class Game:
             return
         
         # Update player
-        keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT]:
             gs.player.move_left()
         if keys[pygame.K_RIGHT]:
@@ -338,262 +468,374 @@ class Game:
     
     def draw_welcome_screen(self):
         """Draw the cyberpunk welcome screen with dynamic elements"""
-        # Create a gradient background
-        gradient_surface = pygame.Surface((WIDTH, HEIGHT))
-        for y in range(HEIGHT):
-            # Create a dark to slightly blue gradient
-            color_value = max(5, min(20, int(20 * (1 - y / HEIGHT))))
-            gradient_surface.fill((0, color_value, color_value + 10), (0, y, WIDTH, 1))
-        self.screen.blit(gradient_surface, (0, 0))
-        
-        # Draw animated digital grid (subtle cyberpunk circuit pattern)
-        current_time = pygame.time.get_ticks() / 1000
-        grid_spacing = 40
-        grid_offset = int(current_time * 10) % grid_spacing
-        grid_alpha = abs(math.sin(current_time)) * 100 + 50
-        
-        grid_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for x in range(-grid_offset, WIDTH, grid_spacing):
-            # Vertical lines
-            alpha = int(grid_alpha * (0.5 + 0.5 * math.sin(x / 100 + current_time)))
-            pygame.draw.line(grid_surface, (int(GRID_LINE[0]), int(GRID_LINE[1]), int(GRID_LINE[2]), alpha), (x, 0), (x, HEIGHT), 1)
-            
-        for y in range(-grid_offset, HEIGHT, grid_spacing):
-            # Horizontal lines
-            alpha = int(grid_alpha * (0.5 + 0.5 * math.sin(y / 100 + current_time)))
-            pygame.draw.line(grid_surface, (int(GRID_LINE[0]), int(GRID_LINE[1]), int(GRID_LINE[2]), alpha), (0, y), (WIDTH, y), 1)
-        
-        self.screen.blit(grid_surface, (0, 0))
-        
-        # Draw stars with pulsating effect
-        self.game_state.stars.draw(self.screen)
-        
-        # Draw title with simple animation effect
-        title_color = (int(NEON_CYAN[0]), 
-                       int(NEON_CYAN[1]), 
-                       int(min(255, NEON_CYAN[2] + int(40 * math.sin(current_time * 3)))))
-        
-        title_text = self.title_font.render("NEUROLINK", True, title_color)
-        
-        # Position title centrally - accounts for MacBook displays with different resolutions
-        title_x = WIDTH // 2 - title_text.get_width() // 2
-        title_y = int(HEIGHT * 0.25)  # Adjusted positioning for better MacBook display compatibility
-        self.screen.blit(title_text, (title_x, title_y))
-        
-        # Draw subtitle with a simplified neon effect (avoiding dynamic color issues)
-        pulse_value = int(20 * math.sin(current_time * 2 + 1))
-        # Use direct RGB values to avoid type issues
-        subtitle_color = (255, min(255, 100 + pulse_value), 153)
-        subtitle_text = self.font.render("CYBERPUNK DATA RECOVERY", True, subtitle_color)
-        
-        # Digital glitch effect for subtitle (subtle)
-        glitch_offset = int(math.sin(current_time * 10) * 2)  # Small horizontal offset
-        subtitle_x = WIDTH // 2 - subtitle_text.get_width() // 2 + glitch_offset
-        subtitle_y = title_y + title_text.get_height() + 20
-        self.screen.blit(subtitle_text, (subtitle_x, subtitle_y))
-        
-        # Draw a decorative separator line
-        line_width = int(subtitle_text.get_width() * 0.8)
-        line_x = WIDTH // 2 - line_width // 2
-        line_y = subtitle_y + subtitle_text.get_height() + 20
-        
-        # Simple animated line
-        pygame.draw.line(self.screen, NEON_TEAL, 
-                      (line_x, line_y), 
-                      (line_x + line_width, line_y), 2)
-        
-        # Draw instructions with animated colors
-        instructions = [
-            "Arrow Keys: Navigate Data Interceptor",
-            "Spacebar: Send Data Packets",
-            "P: Pause Neural Connection",
-            "M: Toggle Audio Atmosphere",
-            "Collect System Upgrades to enhance your Interceptor",
-            "Breach Firewall Nodes every 5 network levels",
-            "",
-            "Press any key to initiate connection"
-        ]
-        
-        # Position instructions with proper spacing for MacBook displays
-        y_pos = line_y + 40
-        for idx, instruction in enumerate(instructions):
-            # Skip empty lines but maintain spacing
-            if not instruction:
-                y_pos += 20
-                continue
-                
-            # Special color handling for the last instruction (call to action)
-            if idx == len(instructions) - 1:
-                # Use yellow for call to action
-                inst_text = self.font.render(instruction, True, NEON_YELLOW)
-                # Add a simple shadow
-                inst_shadow = self.font.render(instruction, True, (30, 30, 40))
-                self.screen.blit(inst_shadow, (WIDTH // 2 - inst_text.get_width() // 2 + 2, y_pos + 2))
-            else:
-                # Normal instructions with slight color variation
-                hue_shift = (idx * 30 + current_time * 20) % 100
-                inst_color = NEON_TEAL if idx % 2 == 0 else NEON_BLUE
-                inst_text = self.small_font.render(instruction, True, inst_color)
-            
-            # Center text with slight position animation for cyberpunk feel
-            inst_x = WIDTH // 2 - inst_text.get_width() // 2
-            if idx == len(instructions) - 1:
-                # Subtle horizontal motion for call to action
-                inst_x += int(math.sin(current_time * 2) * 3)
-                
-            self.screen.blit(inst_text, (inst_x, y_pos))
-            y_pos += 30 if idx != len(instructions) - 2 else 45  # Larger gap before final instruction
-        
-        # Draw a simple ship logo at the bottom
-        icon_y = HEIGHT - 100
-        icon_x = WIDTH // 2
-        icon_size = 30
-        
-        # Simple interceptor triangle
-        ship_points = [
-            (icon_x, icon_y - icon_size),  # Top point
-            (icon_x - icon_size, icon_y + icon_size),  # Bottom left
-            (icon_x + icon_size, icon_y + icon_size),  # Bottom right
-        ]
-        
-        # Draw interceptor
-        pygame.draw.polygon(self.screen, NEON_CYAN, ship_points)
-        
-        # Simple engine exhaust
-        pygame.draw.rect(self.screen, NEON_BLUE, 
-                      (icon_x - 10, icon_y + icon_size, 20, 10))
+        self.screens.draw_welcome(self.screen, self.welcome_stars)
     
     def draw_pause_screen(self):
         """Draw the pause screen overlay"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = self.title_font.render("PAUSED", True, WHITE)
-        continue_text = self.font.render("Press P to continue", True, WHITE)
-        
-        self.screen.blit(pause_text, (WIDTH // 2 - pause_text.get_width() // 2, HEIGHT // 2 - 50))
-        self.screen.blit(continue_text, (WIDTH // 2 - continue_text.get_width() // 2, HEIGHT // 2 + 20))
+        self.screens.draw_pause(self.screen)
     
     def draw_game_over_screen(self):
         """Draw the game over screen"""
-        self.screen.fill(BLACK)
-        
-        # Draw stars in background
-        self.game_state.stars.draw(self.screen)
-        
-        game_over_text = self.title_font.render("GAME OVER", True, NEON_RED)
-        final_score_text = self.font.render(f"Final Score: {self.game_state.score}", True, NEON_BLUE)
-        high_score_text = self.font.render(f"High Score: {self.game_state.high_score}", True, NEON_TEAL)
-        restart_text = self.font.render("Press R to restart", True, NEON_TEAL)
-        quit_text = self.font.render("Press Q to quit", True, NEON_TEAL)
-        
-        self.screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 100))
-        self.screen.blit(final_score_text, (WIDTH // 2 - final_score_text.get_width() // 2, HEIGHT // 2 - 30))
-        self.screen.blit(high_score_text, (WIDTH // 2 - high_score_text.get_width() // 2, HEIGHT // 2 + 10))
-        self.screen.blit(restart_text, (WIDTH // 2 - restart_text.get_width() // 2, HEIGHT // 2 + 50))
-        self.screen.blit(quit_text, (WIDTH // 2 - quit_text.get_width() // 2, HEIGHT // 2 + 80))
+        gs = self.game_state  # Shorthand
+        self.screens.draw_game_over(self.screen, gs.stars, gs.score, gs.high_score)
     
     def draw_game_won_screen(self):
         """Draw the level complete screen"""
-        won_text = self.title_font.render(f"LEVEL {self.game_state.level} COMPLETE!", True, GREEN)
-        score_text = self.font.render(f"Score: {self.game_state.score}", True, WHITE)
-        next_text = self.font.render("Press N for next level", True, WHITE)
-        
-        self.screen.blit(won_text, (WIDTH // 2 - won_text.get_width() // 2, HEIGHT // 2 - 80))
-        self.screen.blit(score_text, (WIDTH // 2 - score_text.get_width() // 2, HEIGHT // 2 - 30))
-        self.screen.blit(next_text, (WIDTH // 2 - next_text.get_width() // 2, HEIGHT // 2 + 20))
+        self.screens.draw_game_won(self.screen, self.game_state.level, self.game_state.score)
+    
+    def counter_width(self, label, value):
+        """Return the pixel width of a labelled HUD counter"""
+        return self.text_cache.render(self.font, label, WHITE).get_width() + self.digits.width(value)
     
-    def draw_hud(self):
-        """Draw heads-up display (score, lives, etc.)"""
+    def draw_counter(self, surface, label, value, x, y):
+        """Draw a cached label followed by a number composed from the digit atlas"""
+        label_text = self.text_cache.render(self.font, label, WHITE)
+        label_rect = surface.blit(label_text, (x, y))
+        return label_rect.union(self.digits.draw(surface, value, (label_rect.right, y)))
+    
+    def draw_hud(self, surface=None):
+        """Draw heads-up display (score, lives, etc.) and return the screen areas it touched
+        
+        Args:
+            surface: Where to draw (the screen if None)
+        """
         gs = self.game_state  # Shorthand
+        surface = self.screen if surface is None else surface
+        render = self.text_cache.render
+        rects = []
         
         # Draw score and level
-        score_text = self.font.render(f"Score: {gs.score}", True, WHITE)
-        level_text = self.font.render(f"Level: {gs.level}", True, WHITE)
-        high_score_text = self.font.render(f"High Score: {gs.high_score}", True, WHITE)
-        
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(level_text, (WIDTH - level_text.get_width() - 10, 10))
-        self.screen.blit(high_score_text, (WIDTH // 2 - high_score_text.get_width() // 2, 10))
-        
-        # Draw lives
+        rects.append(self.draw_counter(surface, "Score: ", gs.score, 10, 10))
+        level_width = self.counter_width("Level: ", gs.level)
+        rects.append(self.draw_counter(surface, "Level: ", gs.level, WIDTH - level_width - 10, 10))
+        high_score_width = self.counter_width("High Score: ", gs.high_score)
+        rects.append(self.draw_counter(surface, "High Score: ", gs.high_score,
+                                       WIDTH // 2 - high_score_width // 2, 10))
+        
+        # Draw lives as small triangles
         for i in range(gs.player.lives):
-            # Draw small triangles for lives
-            points = [
-                (30 + i * 25, HEIGHT - 20),  # Top
-                (20 + i * 25, HEIGHT - 5),   # Bottom left
-                (40 + i * 25, HEIGHT - 5)    # Bottom right
-            ]
-            pygame.draw.polygon(self.screen, WHITE, points)
+            rects.append(surface.blit(self.life_icon, (20 + i * 25, HEIGHT - 20)))
         
         # Draw active power-ups
         power_up_y = HEIGHT - 50
         if gs.player.shield:
-            shield_text = self.small_font.render("SHIELD", True, BLUE)
-            self.screen.blit(shield_text, (WIDTH - shield_text.get_width() - 10, power_up_y))
+            shield_text = render(self.small_font, "SHIELD", BLUE)
+            rects.append(surface.blit(shield_text, (WIDTH - shield_text.get_width() - 10, power_up_y)))
             power_up_y -= 25
         
         if gs.player.double_shot:
-            double_text = self.small_font.render("DOUBLE SHOT", True, YELLOW)
-            self.screen.blit(double_text, (WIDTH - double_text.get_width() - 10, power_up_y))
+            double_text = render(self.small_font, "DOUBLE SHOT", YELLOW)
+            rects.append(surface.blit(double_text, (WIDTH - double_text.get_width() - 10, power_up_y)))
         
         # Draw combo multiplier if active
         if gs.combo_count > 1:
-            combo_text = self.font.render(f"Combo x{gs.combo_multiplier}", True, NEON_ORANGE)
-            self.screen.blit(combo_text, (WIDTH // 2 - combo_text.get_width() // 2, 50))
+            combo_text = render(self.font, f"Combo x{gs.combo_multiplier}", NEON_ORANGE)
+            rects.append(surface.blit(combo_text, (WIDTH // 2 - combo_text.get_width() // 2, 50)))
         
         # Draw sound status
         sound_status = "ON" if self.sound_manager.enabled else "OFF"
-        sound_text = self.small_font.render(f"Sound: {sound_status}", True, WHITE)
-        self.screen.blit(sound_text, (10, HEIGHT - 30))
+        sound_text = render(self.small_font, f"Sound: {sound_status}", WHITE)
+        rects.append(surface.blit(sound_text, (10, HEIGHT - 30)))
+        
+        # Draw the quality tier the governor picked
+        if self.governor:
+            quality_text = render(self.small_font, f"Quality: {self.governor.name}", WHITE)
+            rects.append(surface.blit(quality_text, (WIDTH - quality_text.get_width() - 10, HEIGHT - 30)))
+        
+        return rects
+    
+    def draw(self, alpha=1.0):
+        """Draw the game screen
+        
+        Args:
+            alpha: How far rendering is between the last two simulation steps (0-1)
+        """
+        # Blend sprite positions between simulation steps
+        if alpha < 1.0 and not self.show_welcome:
+            self.interpolator.apply(alpha)
+            try:
+                self.draw_frame()
+            finally:
+                self.interpolator.restore()
+        else:
+            self.draw_frame()
     
-    def draw(self):
-        """Draw the game screen"""
+    def draw_frame(self, present=True):
+        """Draw the game screen with sprites where their rects are
+        
+        Args:
+            present: Show the frame on the display (off-screen renders skip this)
+        """
+        gs = None if self.show_welcome else self.game_state  # Shorthand
+        
+        # Plain gameplay frames can take the dirty-rect or texture path, unless
+        # post-processing needs the whole frame's pixels
+        plain = (not self.show_welcome and not (gs.game_over or gs.game_won or gs.paused)
+                 and not self.postfx.enabled)
+        if present and self.texture_renderer and plain:
+            target = self.texture_renderer.begin()
+            gs.stars.draw(target)
+            gs.all_sprites.draw(target)
+            gs.particles.draw(target)
+            self.draw_hud(target)
+            if self.profiler.enabled:
+                self.profiler.draw(target)
+            self.texture_renderer.present()
+            return
+        
+        if present and self.renderer and plain:
+            layers = (gs.stars, gs.all_sprites, gs.particles)
+            self.renderer.clear(layers)
+            sprite_rects = self.renderer.draw(layers)
+            hud_rects = self.draw_hud()
+            if self.profiler.enabled:
+                hud_rects.append(self.profiler.draw(self.screen))
+            self.renderer.present(sprite_rects, hud_rects)
+            return
+        
         self.screen.fill(BLACK)
         
         if self.show_welcome:
             self.draw_welcome_screen()
         else:
-            # Draw all sprites
-            self.game_state.all_sprites.draw(self.screen)
+            # Draw the star background and all sprites
+            gs.stars.draw(self.screen)
+            gs.all_sprites.draw(self.screen)
+            gs.particles.draw(self.screen)
+            self.postfx.apply(self.screen)
             
             # Draw HUD
             self.draw_hud()
             
             # Draw game state screens
-            if self.game_state.game_over:
+            if gs.game_over:
                 self.draw_game_over_screen()
-            elif self.game_state.game_won:
+            elif gs.game_won:
                 self.draw_game_won_screen()
-            elif self.game_state.paused:
+            elif gs.paused:
                 self.draw_pause_screen()
         
+        # Frame profiler on top of everything
+        if self.profiler.enabled:
+            self.profiler.draw(self.screen)
+        
+        # Overlay screens repaint everything, so the dirty path must start over
+        if self.renderer:
+            self.renderer.invalidate()
+        
         # Update the display
-        pygame.display.flip()
+        if present:
+            if self.texture_renderer:
+                self.texture_renderer.present_canvas()
+            else:
+                pygame.display.flip()
     
-    def run(self):
-        """Main game loop"""
+    def apply_quality(self):
+        """Apply the governor's tier to particles, stars, the firewall node's animation and post-processing"""
+        gs = self.game_state  # Shorthand
+        _, particle_share, star_share, postfx_cap, ring_step = self.governor.settings
+        gs.particle_share = particle_share
+        if gs.boss_ring_step != ring_step:
+            gs.boss_ring_step = ring_step
+            for enemy in gs.enemies:
+                if enemy.is_boss:
+                    enemy.ring_step = ring_step
+        if gs.stars.share != star_share:
+            gs.stars.set_share(star_share)
+            if self.renderer:
+                self.renderer.invalidate()  # Hidden stars would linger in the dirty path
+        self.postfx.set_quality(min(self.postfx_quality, postfx_cap))
+    
+    def run(self, render_fps=RENDER_FPS, pacing_stats=False, startup_profile=False):
+        """Main game loop
+        
+        The simulation advances in fixed steps of 1/FPS seconds, as many as the
+        elapsed time calls for (up to MAX_CATCHUP_STEPS per frame), and every
+        rendered frame interpolates sprites between the last two steps. Fast
+        displays get smooth motion at the same game speed; slow machines skip
+        rendered frames rather than slowing the game down.
+        
+        Args:
+            render_fps: Render frame cap, 0 to follow the display refresh rate
+            pacing_stats: Print frame pacing stats on exit
+            startup_profile: Print the startup timeline once the first frame is up
+        """
+        render_fps = render_fps or display_refresh_rate()
+        step_ms = 1000 / FPS
+        lag = 0.0
+        last = time.perf_counter()
+        first_frame = True
+        
         while self.running:
+            now = time.perf_counter()
+            frame_ms = (now - last) * 1000
+            last = now
+            lag += frame_ms
+            
+            profiling = self.profiler.enabled and not self.show_welcome
+            if profiling:
+                self.profiler.begin_frame(self)
+            
             # Handle events
             self.handle_events()
             
-            # Update game state
-            self.update()
+            # Update game state in fixed steps
+            steps = 0
+            while lag >= step_ms and steps < MAX_CATCHUP_STEPS:
+                if not self.show_welcome:
+                    self.interpolator.capture(self.game_state.all_sprites)
+                self.update()
+                lag -= step_ms
+                steps += 1
+            
+            # Too far behind - drop whole steps instead of spiralling
+            dropped_ms = lag - lag % step_ms
+            lag -= dropped_ms
+            self.pacing.record(frame_ms, steps, dropped_ms)
             
             # Draw everything
-            self.draw()
+            self.draw(lag / step_ms)
+            if profiling and self.profiler.enabled:
+                self.profiler.end_frame()
+            if first_frame:
+                first_frame = False
+                startup.mark("first frame")
+                if startup_profile:
+                    startup.print_timeline()
             
-            # Cap the frame rate
-            self.clock.tick(FPS)
+            # Let the governor see how long this frame's work took, during play only
+            # (menus and overlays are cheap and would raise quality falsely)
+            if self.governor and not self.show_welcome:
+                gs = self.game_state  # Shorthand
+                if not (gs.game_over or gs.game_won or gs.paused):
+                    self.governor.record((time.perf_counter() - now) * 1000)
+                self.apply_quality()
+            
+            # Cap the render rate
+            self.clock.tick(render_fps)
+        
+        if pacing_stats:
+            print(self.format_pacing())
         
         # Quit pygame
         pygame.quit()
         sys.exit()
+    
+    def format_pacing(self):
+        """Return the frame pacing stats as a one-line summary"""
+        stats = self.pacing.stats()
+        if not stats:
+            return "No frames rendered"
+        quality = (f" - quality {self.governor.name} after {self.governor.changes} changes"
+                   if self.governor else "")
+        return (f"{stats['frames']} frames, {stats['sim_steps']} steps - {stats['fps']:.1f} fps, "
+                f"mean {stats['mean_ms']:.2f} ms, jitter {stats['jitter_ms']:.2f} ms, "
+                f"p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms - "
+                f"{stats['catchup_frames']} catch-up frames, {stats['capped_frames']} capped "
+                f"({stats['dropped_ms']:.0f} ms dropped){quality}")
+    
+    def step(self, autoplay=False):
+        """Advance one tick of input and simulation without drawing
+        
+        Args:
+            autoplay: Restart after game over and advance after a cleared level by
+                      itself, so long unattended runs keep exercising gameplay
+        
+        Returns:
+            True if the game ended this tick (before any autoplay restart)
+        """
+        self.handle_events()
+        self.update()
+        
+        gs = self.game_state  # Shorthand
+        game_over = gs.game_over
+        if autoplay:
+            if gs.game_over:
+                gs.reset()
+            elif gs.game_won:
+                gs.next_level()
+        return game_over
+    
+    def simulate(self, ticks):
+        """Step the game as fast as possible with autoplay and return throughput stats"""
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step(autoplay=True)
+            self.clock.tick(FPS)
+        elapsed = time.perf_counter() - start
+        
+        gs = self.game_state  # Shorthand
+        return {
+            "ticks": ticks,
+            "seconds": elapsed,
+            "ticks_per_second": ticks / elapsed if elapsed else float("inf"),
+            "level": gs.level,
+            "score": gs.score,
+            "high_score": gs.high_score,
+        }
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="NeuroLink: Cyberpunk Data Recovery")
+    parser.add_argument("--dirty-rects", action="store_true", default=DIRTY_RECT_RENDERING,
+                        help="only redraw and update changed screen regions")
+    parser.add_argument("--backend", choices=("surface", "texture"), default=RENDER_BACKEND,
+                        help="draw with software surface blits or through SDL's renderer with textures")
+    parser.add_argument("--postfx", type=int, choices=range(len(POSTFX_TIERS)), default=POSTFX_QUALITY,
+                        help="glow and scanline quality: " + ", ".join(
+                            f"{quality} {tier[0]}" for quality, tier in enumerate(POSTFX_TIERS)))
+    parser.add_argument("--no-governor", dest="governor", action="store_false", default=QUALITY_GOVERNOR,
+                        help="keep the best quality tier instead of adapting it to frame times")
+    parser.add_argument("--software-renderer", action="store_true", default=TEXTURE_RENDERER_SOFTWARE,
+                        help="use SDL's software renderer for the texture backend (no GPU needed)")
+    parser.add_argument("--render-fps", type=int, default=RENDER_FPS,
+                        help="render frame cap, 0 to follow the display refresh rate")
+    parser.add_argument("--pacing-stats", action="store_true",
+                        help="print frame time, jitter and catch-up stats on exit")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate uncapped without a window, driven by a random bot")
+    parser.add_argument("--ticks", type=int, default=10000,
+                        help="number of ticks to simulate with --headless")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the game's random stream (random by default)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the seed and every tick's input to a replay file")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print how long each import and init step took to the first frame")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    
+    if args.headless:
+        input_source = ActionInput(random_policy(seed))
+    else:
+        input_source = KeyboardInput()
+    
+    # Optionally record the run
+    replay = None
+    if args.record:
+        replay = Replay(seed, welcome=not args.headless, autoplay=args.headless)
+        input_source = RecordingInput(input_source, replay)
+    
+    try:
+        if args.headless:
+            game = Game(headless=True, input_source=input_source, seed=seed)
+            if args.startup_profile:
+                startup.print_timeline()
+            stats = game.simulate(args.ticks)
+            print(f"Simulated {stats['ticks']} ticks in {stats['seconds']:.2f}s "
+                  f"({stats['ticks_per_second']:.0f} ticks/s) - level {stats['level']}, "
+                  f"score {stats['score']}, high score {stats['high_score']}")
+            pygame.quit()
+        else:
+            game = Game(dirty_rects=args.dirty_rects, input_source=input_source, seed=seed,
+                        backend=args.backend, software_renderer=args.software_renderer, postfx=args.postfx,
+                        governor=args.governor)
+            game.run(args.render_fps, args.pacing_stats, args.startup_profile)
+    finally:
+        if replay is not None:
+            replay.save(args.record)
+            print(f"Recorded {len(replay)} ticks (seed {seed}) to {args.record}")
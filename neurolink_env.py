@@ -0,0 +1,231 @@
+"""
+Gym-style environment for NeuroLink: Cyberpunk Data Recovery game.
+Wraps the game's update and draw logic behind reset(seed) / step(action) / render(), with
+pixel observations read straight out of the frame through pygame.surfarray.pixels3d views.
+Grayscale conversion, downsampling, frame stacking and frame-skip max-pooling all write
+into buffers allocated once up front.
+
+Usage:
+    env = NeuroLinkEnv(grayscale=True, downsample=4, frame_stack=4, frame_skip=4)
+    obs, info = env.reset(seed=0)
+    obs, reward, terminated, truncated, info = env.step(ACTION_SHOOT | ACTION_LEFT)
+"""
+
+import os
+import time
+import numpy as np
+import pygame
+from config import *
+from controls import ActionInput, ACTION_LEFT, ACTION_RIGHT, ACTION_SHOOT
+from game_state import GameState
+from timing import SimulationClock
+import timing
+
+# ITU-R BT.601 luma weights in 1/256ths (they sum to 256, so the result fits a byte)
+GRAY_WEIGHTS = (77, 150, 29)
+
+ACTION_COUNT = 8  # Every combination of ACTION_LEFT, ACTION_RIGHT and ACTION_SHOOT
+
+
+class NeuroLinkEnv:
+    """One NeuroLink game as a reinforcement learning environment
+
+    Actions are ACTION_* bitmasks (0-7); rewards are score gained; an episode
+    terminates at game over and cleared levels advance by themselves. Observations
+    are uint8 arrays of shape observation_shape - (stack, height, width[, 3]) when
+    stacking, else (height, width[, 3]) - and are views of internal buffers that
+    the next step() or reset() overwrites.
+    """
+
+    def __init__(self, grayscale=False, downsample=1, frame_stack=1, frame_skip=1, max_pool=True,
+                 render_mode=None, max_episode_steps=None, seed=None):
+        """Initialize the game and the observation buffers
+
+        Args:
+            grayscale: Observe luma instead of RGB
+            downsample: Keep every n-th pixel in both directions
+            frame_stack: Observe the last n frames
+            frame_skip: Repeat each action for n simulation ticks
+            max_pool: With frame_skip, observe the pixel-wise max of the last two frames
+            render_mode: None or "rgb_array" to draw off-screen, "human" to show a window
+            max_episode_steps: Truncate episodes after this many steps (never if None)
+            seed: Seed of the first episode (random if None)
+        """
+        if render_mode != "human":
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        from neurolink import Game  # After the video driver is chosen
+
+        self.grayscale = grayscale
+        self.downsample = downsample
+        self.frame_stack = frame_stack
+        self.frame_skip = frame_skip
+        self.max_pool = max_pool and frame_skip > 1
+        self.render_mode = render_mode
+        self.max_episode_steps = max_episode_steps
+        self.steps = 0
+        self.action = 0
+
+        clock = None if render_mode == "human" else SimulationClock()
+        # Sound only plays in a window (the loader never starts otherwise); the governor
+        # stays off so observations do not change with the machine's speed
+        self.game = Game(input_source=ActionInput(lambda tick: self.action), clock=clock, seed=seed,
+                         governor=False, sound=render_mode == "human")
+        self.game.show_welcome = False
+
+        # Draw into a surface of our own unless a window is wanted, so several
+        # environments can share one process
+        if render_mode != "human":
+            self.game.screen = pygame.Surface((WIDTH, HEIGHT))
+        self.surface = self.game.screen
+
+        # Preallocated buffers
+        height = -(-HEIGHT // downsample)
+        width = -(-WIDTH // downsample)
+        self.frame_shape = (height, width) if grayscale else (height, width, 3)
+        self.observation_shape = (frame_stack,) + self.frame_shape if frame_stack > 1 else self.frame_shape
+        self.frame = np.zeros(self.frame_shape, np.uint8)
+        self.pooled = np.zeros(self.frame_shape, np.uint8) if self.max_pool else None
+        self.luma = np.zeros((height, width), np.uint16) if grayscale else None
+        self.luma_channel = np.zeros((height, width), np.uint16) if grayscale else None
+
+        # Frame stack ring, written twice so the last frame_stack frames are always
+        # one contiguous, oldest-first slice
+        self.stack = np.zeros((2 * frame_stack,) + self.frame_shape, np.uint8) if frame_stack > 1 else None
+        self.stack_index = 0
+
+        # Time spent drawing and extracting observations (ms, last step)
+        self.draw_ms = 0.0
+        self.observe_ms = 0.0
+
+    def capture(self, out):
+        """Draw the current frame and write its observation into out"""
+        start = time.perf_counter()
+        self.game.draw_frame(present=False)
+        drawn = time.perf_counter()
+
+        pixels = pygame.surfarray.pixels3d(self.surface)  # (width, height, 3) view, no copy
+        step = self.downsample
+        view = pixels[::step, ::step].transpose(1, 0, 2)
+        if self.grayscale:
+            luma, channel = self.luma, self.luma_channel
+            np.multiply(view[..., 0], GRAY_WEIGHTS[0], out=luma, dtype=np.uint16)
+            for index in (1, 2):
+                np.multiply(view[..., index], GRAY_WEIGHTS[index], out=channel, dtype=np.uint16)
+                luma += channel
+            luma >>= 8
+            np.copyto(out, luma, casting="unsafe")
+        else:
+            np.copyto(out, view)
+        del view, pixels  # Unlock the surface for the next draw
+
+        self.draw_ms += (drawn - start) * 1000
+        self.observe_ms += (time.perf_counter() - drawn) * 1000
+
+    def observation(self, reset=False):
+        """Return the observation for the current frame, pushing it onto the stack"""
+        if self.stack is None:
+            return self.frame
+
+        stack, count = self.stack, self.frame_stack
+        if reset:
+            stack[:] = self.frame
+            self.stack_index = count - 1
+        else:
+            self.stack_index = (self.stack_index + 1) % count
+            stack[self.stack_index] = self.frame
+            stack[self.stack_index + count] = self.frame
+        return stack[self.stack_index + 1:self.stack_index + 1 + count]
+
+    def info(self):
+        """Return episode details"""
+        gs = self.game.game_state
+        return {
+            "score": gs.score,
+            "level": gs.level,
+            "lives": gs.player.lives,
+            "steps": self.steps,
+            "draw_ms": self.draw_ms,
+            "observe_ms": self.observe_ms,
+        }
+
+    def reset(self, seed=None):
+        """Start a new episode and return (observation, info)
+
+        A seed starts a fresh random stream; without one the stream carries on.
+        """
+        game = self.game
+        if seed is not None:
+            game.game_state = GameState(game.sound_manager, seed)
+        else:
+            game.game_state.reset()
+        timing.set_clock(game.game_state.clock)
+        self.steps = 0
+        self.action = 0
+        self.draw_ms = self.observe_ms = 0.0
+        self.capture(self.frame)
+        return self.observation(reset=True), self.info()
+
+    def step(self, action):
+        """Apply an ACTION_* bitmask for frame_skip ticks
+
+        Returns (observation, reward, terminated, truncated, info).
+        """
+        game = self.game
+        gs = game.game_state
+        timing.set_clock(gs.clock)  # Other environments in this process may have moved it
+        self.action = action
+        self.draw_ms = self.observe_ms = 0.0
+        score = gs.score
+        terminated = False
+        for tick in range(self.frame_skip):
+            terminated = game.step()
+            if terminated:
+                break
+            if gs.game_won:
+                gs.next_level()
+            if self.max_pool and tick == self.frame_skip - 2:
+                self.capture(self.pooled)
+
+        self.capture(self.frame)
+        if self.max_pool and not terminated:
+            np.maximum(self.frame, self.pooled, out=self.frame)
+
+        self.steps += 1
+        truncated = self.max_episode_steps is not None and self.steps >= self.max_episode_steps
+        if self.render_mode == "human":
+            self.render()
+        return self.observation(), gs.score - score, terminated, truncated, self.info()
+
+    def render(self):
+        """Show the last frame in the window ("human") or return a copy of it as (height, width, 3)"""
+        if self.render_mode == "human":
+            pygame.display.flip()
+            pygame.event.pump()
+            self.game.clock.tick(FPS / self.frame_skip)
+            return None
+        return pygame.surfarray.array3d(self.surface).transpose(1, 0, 2)
+
+    def close(self):
+        """Shut pygame down"""
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    # Throughput of the common preprocessing setup with a random agent
+    env = NeuroLinkEnv(grayscale=True, downsample=4, frame_stack=4, frame_skip=4)
+    rng = np.random.default_rng(0)
+    obs, info = env.reset(seed=0)
+    steps, draw_ms, observe_ms = 1000, 0.0, 0.0
+    start = time.perf_counter()
+    for _ in range(steps):
+        obs, reward, terminated, truncated, info = env.step(int(rng.integers(ACTION_COUNT)))
+        draw_ms += info["draw_ms"]
+        observe_ms += info["observe_ms"]
+        if terminated or truncated:
+            obs, info = env.reset()
+    elapsed = time.perf_counter() - start
+    print(f"{steps} steps ({steps * env.frame_skip} ticks) in {elapsed:.2f}s - {steps / elapsed:.0f} steps/s, "
+          f"observation {obs.shape}; per step: draw {draw_ms / steps:.2f} ms, "
+          f"observation {observe_ms / steps:.2f} ms, total {elapsed * 1000 / steps:.2f} ms")
+    env.close()
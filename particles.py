@@ -0,0 +1,139 @@
+"""
+Particle engine for NeuroLink: Cyberpunk Data Recovery game.
+Stores explosion particles as NumPy arrays so thousands of them can be updated in one
+vectorized step and drawn with a single batched blit.
+"""
+
+import pygame
+import numpy as np
+from config import *
+
+class ParticleSystem:
+    """Struct-of-arrays explosion particles with pre-rendered dots per (size, color)"""
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, seed=None):
+        """Initialize empty particle arrays"""
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.allocate(capacity)
+
+        # Palette of particle colors and their pre-rendered dots
+        self.colors = []
+        self.color_index = {}
+        self.dots = []
+
+        # Screen area covered by the particles on the last draw
+        self.last_rect = None
+
+    def allocate(self, capacity):
+        """(Re)allocate the particle arrays, keeping live particles"""
+        old = getattr(self, "x", None)
+        self.capacity = capacity
+        arrays = {
+            "x": np.float64, "y": np.float64,
+            "dx": np.float64, "dy": np.float64,
+            "lifetime": np.int32, "size": np.int32, "color": np.int32,
+        }
+        for name, dtype in arrays.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+
+    def __len__(self):
+        """Return the number of live particles"""
+        return self.count
+
+    def register_color(self, color):
+        """Return the palette index of a color, pre-rendering its dots on first use"""
+        color = tuple(color)
+        index = self.color_index.get(color)
+        if index is None:
+            index = len(self.colors)
+            self.colors.append(color)
+            self.color_index[color] = index
+            dots = [None] * (PARTICLE_MAX_SIZE + 1)
+            for size in range(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE + 1):
+                dot = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(dot, color, (size, size), size)
+                dots[size] = dot
+            self.dots.append(dots)
+        return index
+
+    def emit(self, x, y, color, count=PARTICLE_COUNT_NORMAL):
+        """Spawn count particles at (x, y) flying outward in random directions"""
+        if count <= 0:
+            return
+        if self.count + count > self.capacity:
+            capacity = self.capacity
+            while self.count + count > capacity:
+                capacity *= 2
+            self.allocate(capacity)
+
+        start = self.count
+        end = start + count
+        rng = self.rng
+
+        angle = rng.uniform(0, np.pi * 2, count)
+        speed = rng.uniform(PARTICLE_MIN_SPEED, PARTICLE_MAX_SPEED, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.dx[start:end] = np.cos(angle) * speed
+        self.dy[start:end] = np.sin(angle) * speed
+        self.lifetime[start:end] = rng.integers(PARTICLE_MIN_LIFETIME, PARTICLE_MAX_LIFETIME + 1, count)
+        self.size[start:end] = rng.integers(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE + 1, count)
+        self.color[start:end] = self.register_color(color)
+        self.count = end
+
+    def update(self):
+        """Advance every particle one step and drop the expired ones"""
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+        self.lifetime[:n] -= 1
+
+        alive = self.lifetime[:n] > 0
+        if alive.all():
+            return
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        for array in (self.x, self.y, self.dx, self.dy, self.lifetime, self.size, self.color):
+            array[:k] = array[keep]
+        self.count = k
+
+    def empty(self):
+        """Remove all particles"""
+        self.count = 0
+
+    def clear(self, surface, background):
+        """Erase the area covered by the last draw"""
+        if self.last_rect:
+            surface.blit(background, self.last_rect, self.last_rect)
+
+    def draw(self, surface):
+        """Blit all particles in one batch and return the changed screen areas"""
+        n = self.count
+        previous = self.last_rect
+        if not n:
+            self.last_rect = None
+            return [previous] if previous else []
+
+        size = self.size[:n]
+        left = self.x[:n].astype(np.int32) - size
+        top = self.y[:n].astype(np.int32) - size
+
+        dots = self.dots
+        blit_sequence = [(dots[c][s], (px, py)) for c, s, px, py
+                         in zip(self.color[:n].tolist(), size.tolist(), left.tolist(), top.tolist())]
+        if hasattr(surface, "fblits"):
+            surface.fblits(blit_sequence)
+        else:
+            surface.blits(blit_sequence, doreturn=False)
+
+        rect = pygame.Rect(int(left.min()), int(top.min()), 0, 0)
+        rect.width = int((left + size * 2).max()) - rect.x
+        rect.height = int((top + size * 2).max()) - rect.y
+        self.last_rect = rect
+        return [rect.union(previous) if previous else rect]
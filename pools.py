@@ -0,0 +1,68 @@
+"""
+Sprite object pools for NeuroLink: Cyberpunk Data Recovery game.
+Recycles short-lived sprites (data packets, corruption packets, upgrades) so combat does not
+allocate a fresh Surface for every shot.
+"""
+
+class SpritePool:
+    """Free list of reusable sprites of a single class
+
+    Pooled sprite classes re-initialize themselves through reset(*args) and hand
+    themselves back through release() when they are killed. Every sprite the pool
+    builds is tagged with it, and release() ignores sprites it did not hand out,
+    so copies made elsewhere (replay keyframes) never unbalance its counters.
+    """
+
+    def __init__(self, sprite_class, prototype_args):
+        """Initialize an empty pool"""
+        self.sprite_class = sprite_class
+        self.prototype_args = prototype_args
+        self.free = []
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def reserve(self, size):
+        """Pre-allocate sprites until the pool holds at least size of them"""
+        while len(self.free) + self.in_use < size:
+            sprite = self.sprite_class(*self.prototype_args)
+            sprite.pool = self
+            sprite.pooled = True
+            self.free.append(sprite)
+
+    def acquire(self, *args):
+        """Return a sprite reset with args, reusing a free one when possible"""
+        if self.free:
+            self.hits += 1
+            sprite = self.free.pop()
+            sprite.reset(*args)
+        else:
+            self.misses += 1
+            sprite = self.sprite_class(*args)
+            sprite.pool = self
+
+        sprite.pooled = False
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return sprite
+
+    def release(self, sprite):
+        """Return a killed sprite to the free list"""
+        if sprite.pool is not self or sprite.pooled:
+            return
+        sprite.pooled = True
+        self.in_use -= 1
+        self.free.append(sprite)
+
+    def stats(self):
+        """Return the pool counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,169 @@
+"""
+Post-processing for NeuroLink: Cyberpunk Data Recovery game.
+Makes the neon glow: the finished world layers are scaled to half or quarter resolution,
+their bright pixels picked out and box-blurred with NumPy through a surfarray view, and the
+glow is scaled back up and added on. A precomputed scanline and CRT mask is multiplied over it.
+
+Run it directly to measure each quality tier on a gameplay frame:
+    python postfx.py [--frames N]
+"""
+
+import time
+import numpy as np
+import pygame
+from config import *
+
+class PostProcess:
+    """Glow and scanline stage with quality tiers from POSTFX_TIERS
+
+    Every buffer a tier needs is allocated when the tier is selected, so apply()
+    allocates nothing. The NumPy work runs on rows of packed pixels (4 bytes per
+    pixel, the unused byte included), so every step is a contiguous slice.
+    """
+
+    def __init__(self, size=(WIDTH, HEIGHT), quality=POSTFX_QUALITY):
+        """Initialize the stage at a quality tier (0 is off)"""
+        self.size = size
+        self.quality = None
+        self.cost_ms = 0.0  # Time the last apply() took
+        self.set_quality(quality)
+
+    @property
+    def enabled(self):
+        """Return whether the stage does anything"""
+        return self.quality > 0
+
+    @property
+    def name(self):
+        """Return the current tier's name"""
+        return POSTFX_TIERS[self.quality][0]
+
+    def set_quality(self, quality):
+        """Switch to a tier, allocating its buffers"""
+        quality = max(0, min(len(POSTFX_TIERS) - 1, quality))
+        if quality == self.quality:
+            return
+        self.quality = quality
+        _, scale, self.radius, self.passes, self.smooth, scanlines, crt_mask = POSTFX_TIERS[quality]
+        if not quality:
+            self.small = self.rows = self.level = self.blur = self.scratch = self.glow = self.mask = None
+            return
+
+        width, height = self.size
+        self.small = pygame.Surface((width // scale, height // scale))
+        self.rows = pygame.surfarray.pixels2d(self.small).T.view(np.uint8)  # (height, width * 4) view
+        self.level = np.zeros(self.rows.shape, np.uint8)  # Pixels raised to at least the threshold
+        self.blur = np.zeros(self.rows.shape, np.uint16)  # Box blur sums, ping-ponged with scratch
+        self.scratch = np.zeros(self.rows.shape, np.uint16)
+        self.glow = pygame.Surface(self.size)
+
+        # Each blur step divides its 2 * radius + 1 tap sum by the power of two below
+        # it, which brightens by taps / 2 ** shift; one fixed-point multiply undoes
+        # that and applies the glow strength, after a clamp that keeps it in 16 bits
+        taps = 2 * self.radius + 1
+        self.shift = taps.bit_length() - 1
+        brightening = (taps / (1 << self.shift)) ** (2 * self.passes)
+        self.gain = max(1, round(256 * POSTFX_GLOW_STRENGTH / brightening))
+        self.limit = 65535 // self.gain  # Saturates at 255 after the multiply and shift
+        self.mask = self.make_mask(scanlines, crt_mask) if scanlines or crt_mask else None
+
+    def make_mask(self, scanlines, crt_mask):
+        """Build the surface multiplied over each frame: dimmed odd rows and RGB mask columns"""
+        width, height = self.size
+        mask = np.full((width, height, 3), 255, np.uint16)
+        if scanlines:
+            mask[:, 1::2] = mask[:, 1::2] * POSTFX_SCANLINE_LEVEL // 255
+        if crt_mask:
+            # Each column keeps one channel at full strength, like an aperture grille
+            for channel in range(3):
+                dimmed = [c for c in range(3) if c != channel]
+                mask[channel::3, :, dimmed] = mask[channel::3, :, dimmed] * POSTFX_MASK_LEVEL // 255
+        return pygame.surfarray.make_surface(mask.astype(np.uint8))
+
+    def box_blur(self, source, out, step):
+        """Sum each value and its radius neighbours either side, step values apart, into out
+
+        A step of 4 (one packed pixel) blurs along rows, one row's length blurs down columns.
+        """
+        np.copyto(out, source)
+        flat_source, flat_out = source.reshape(-1), out.reshape(-1)
+        for offset in range(step, step * self.radius + 1, step):
+            flat_out[offset:] += flat_source[:-offset]
+            flat_out[:-offset] += flat_source[offset:]
+        out >>= self.shift
+
+    def apply(self, surface):
+        """Add the glow of surface's bright pixels to it, then multiply the mask over it"""
+        if not self.quality:
+            return
+        start = time.perf_counter()
+
+        # Bright pass at low resolution
+        pygame.transform.scale(surface, self.small.get_size(), self.small)
+        blur, scratch = self.blur, self.scratch
+        np.maximum(self.rows, POSTFX_THRESHOLD, out=self.level)
+        np.subtract(self.level, POSTFX_THRESHOLD, out=blur)
+
+        # Separable box blur; pixels at row ends bleed into the next row, which the
+        # glow never shows since the screen edges stay dark
+        for _ in range(self.passes):
+            self.box_blur(blur, scratch, 4)
+            self.box_blur(scratch, blur, blur.shape[1])
+        np.minimum(blur, self.limit, out=blur)
+        blur *= self.gain
+        blur >>= 8
+        np.copyto(self.rows, blur, casting="unsafe")
+
+        # Back to full size and added on; the mask darkens rows and columns
+        if self.smooth:
+            pygame.transform.smoothscale(self.small, self.size, self.glow)
+        else:
+            pygame.transform.scale(self.small, self.size, self.glow)
+        surface.blit(self.glow, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        if self.mask is not None:
+            surface.blit(self.mask, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        self.cost_ms = (time.perf_counter() - start) * 1000
+
+
+def measure_tiers(frames=200, seed=0):
+    """Return {tier name: (p50 ms, p99 ms)} for applying each tier to gameplay frames"""
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from controls import ActionInput, random_policy
+    from neurolink import Game
+    from timing import SimulationClock
+
+    game = Game(input_source=ActionInput(random_policy(seed)), clock=SimulationClock(), seed=seed)
+    game.show_welcome = False
+    game.start_game()
+    game.sound_manager.enabled = False
+    gs = game.game_state
+    surface = pygame.Surface((WIDTH, HEIGHT))
+
+    costs = {}
+    for quality, tier in enumerate(POSTFX_TIERS):
+        post = PostProcess(quality=quality)
+        samples = []
+        for _ in range(frames):
+            game.step()
+            gs.player.lives = max(gs.player.lives, PLAYER_INITIAL_LIVES)
+            surface.fill(BLACK)
+            gs.stars.draw(surface)
+            gs.all_sprites.draw(surface)
+            gs.particles.draw(surface)
+            start = time.perf_counter()
+            post.apply(surface)
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        costs[tier[0]] = (samples[len(samples) // 2], samples[min(len(samples) - 1, len(samples) * 99 // 100)])
+    return costs
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Measure each post-processing tier at the game's resolution")
+    parser.add_argument("--frames", type=int, default=200, help="frames per tier")
+    args = parser.parse_args()
+    for name, (p50, p99) in measure_tiers(args.frames).items():
+        print(f"{name:<8} p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  ({WIDTH}x{HEIGHT})")
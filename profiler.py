@@ -0,0 +1,252 @@
+"""
+Frame profiler for NeuroLink: Cyberpunk Data Recovery game.
+Times named phases of the game loop by wrapping methods on the live objects, and draws an
+in-game overlay (F3) with rolling frame-time graphs, percentiles and sprite counts.
+"""
+
+import csv
+import time
+from collections import deque
+import pygame
+from config import *
+from text_cache import load_font
+
+_MISSING = object()
+
+
+def percentile(ordered, p):
+    """Return the p-th percentile of an already sorted list"""
+    return ordered[min(len(ordered) - 1, len(ordered) * p // 100)]
+
+
+def summarize(samples):
+    """Return percentile, mean and max of millisecond samples"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    result = {f"p{p}": percentile(ordered, p) for p in BENCH_PERCENTILES}
+    result["mean"] = sum(ordered) / len(ordered)
+    result["max"] = ordered[-1]
+    return {key: round(value, 4) for key, value in result.items()}
+
+
+class PhaseTimer:
+    """Collects per-frame milliseconds for named phases of the game loop
+
+    Phases are measured by wrapping bound methods (or module functions) on the
+    objects the game uses, so the game code itself needs no instrumentation and
+    pays nothing once unwrap_all() has run.
+    """
+
+    def __init__(self, history=None):
+        """Initialize with no samples, keeping the last history frames (all if None)"""
+        self.history = history
+        self.samples = {}
+        self.frame = {}
+        self.wrapped = []  # (object, attribute name, previous instance attribute)
+
+    def wrap(self, obj, name, phase):
+        """Time every call of obj.name under phase"""
+        method = getattr(obj, name)
+        frame = self.frame
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                frame[phase] = frame.get(phase, 0.0) + (perf_counter() - start) * 1000
+
+        self.wrapped.append((obj, name, vars(obj).get(name, _MISSING)))
+        setattr(obj, name, timed)
+        if phase not in self.samples:
+            self.samples[phase] = self.new_series()
+
+    def unwrap_all(self):
+        """Restore every wrapped method, newest first"""
+        for obj, name, previous in reversed(self.wrapped):
+            if previous is _MISSING:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, previous)
+        self.wrapped = []
+
+    def new_series(self):
+        """Return an empty sample series, back-filled so all series stay aligned"""
+        frames = len(self.samples["frame"]) if "frame" in self.samples else 0
+        return deque([0.0] * frames, maxlen=self.history)
+
+    def end_frame(self, frame_ms):
+        """Store this frame's phase times (0 for phases that did not run)"""
+        self.frame["frame"] = frame_ms
+        if "frame" not in self.samples:
+            self.samples["frame"] = self.new_series()
+        for phase, samples in self.samples.items():
+            samples.append(self.frame.get(phase, 0.0))
+        self.frame.clear()
+
+    def summary(self):
+        """Return percentile, mean and max milliseconds per phase"""
+        return {phase: summarize(samples) for phase, samples in self.samples.items()}
+
+
+class ProfilerOverlay:
+    """Toggleable in-game frame profiler
+
+    While enabled, the game loop phases are wrapped by a PhaseTimer; the panel is
+    re-rendered PROFILER_REFRESH_HZ times a second and blitted from cache in between.
+    """
+
+    def __init__(self, font=None):
+        """Initialize a disabled profiler (loading its font when first enabled if none is given)"""
+        self.font = font
+        self.enabled = False
+        self.timer = None
+        self.targets = ()  # Objects the timer is currently wrapped around
+        self.frame_start = 0.0
+        self.panel = None
+        self.panel_time = 0.0
+        self.panel_cost = 0.0  # Milliseconds spent re-rendering the panel last time
+        self.counts = {}
+
+    def toggle(self):
+        """Switch the profiler on or off"""
+        self.enabled = not self.enabled
+        if self.enabled:
+            if self.font is None:
+                self.font = load_font("monospace", PROFILER_FONT_SIZE)
+            self.timer = PhaseTimer(PROFILER_HISTORY)
+            self.panel = None
+        else:
+            self.timer.unwrap_all()
+            self.targets = ()
+
+    def phases(self, game):
+        """Return the (object, method name, phase) triples to time"""
+        gs = game.game_state
+        present = [(game.texture_renderer, "present", "display.flip")] if game.texture_renderer else []
+        return present + [
+            (game, "handle_events", "handle_events"),
+            (game, "move_enemies", "move_enemies"),
+            (game, "enemy_shoot", "enemy_shoot"),
+            (game, "check_collisions", "check_collisions"),
+            (gs.player, "update", "player.update"),
+            (gs.player_bullets, "update", "player_bullets.update"),
+            (gs.enemy_bullets, "update", "enemy_bullets.update"),
+            (gs.powerups, "update", "powerups.update"),
+            (gs.particles, "update", "particles.update"),
+            (gs.stars, "update", "stars.update"),
+            (gs.stars, "draw", "stars.draw"),
+            (gs.all_sprites, "draw", "all_sprites.draw"),
+            (gs.particles, "draw", "particles.draw"),
+            (game.postfx, "apply", "postfx"),
+            (game, "draw_hud", "draw_hud"),
+            (pygame.display, "flip", "display.flip"),
+            (pygame.display, "update", "display.flip"),
+        ]
+
+    def begin_frame(self, game):
+        """Start timing a frame, re-wrapping the game objects if they were replaced"""
+        phases = self.phases(game)
+        targets = tuple(obj for obj, _, _ in phases)
+        if targets != self.targets:
+            self.timer.unwrap_all()
+            for obj, name, phase in phases:
+                self.timer.wrap(obj, name, phase)
+            self.targets = targets
+
+        gs = game.game_state
+        self.counts = {
+            "all_sprites": len(gs.all_sprites),
+            "enemies": len(gs.enemies),
+            "player_bullets": len(gs.player_bullets),
+            "enemy_bullets": len(gs.enemy_bullets),
+            "powerups": len(gs.powerups),
+            "particles": len(gs.particles),
+            "voices dropped": game.sound_manager.stats["dropped"],
+            "voices stolen": game.sound_manager.stats["stolen"],
+        }
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Finish timing a frame"""
+        self.timer.end_frame((time.perf_counter() - self.frame_start) * 1000)
+
+    def draw(self, surface):
+        """Blit the overlay panel, re-rendering it at most PROFILER_REFRESH_HZ times a second"""
+        now = time.perf_counter()
+        if self.panel is None or now - self.panel_time >= 1 / PROFILER_REFRESH_HZ:
+            self.panel = self.render_panel()
+            self.panel_time = now
+            self.panel_cost = (time.perf_counter() - now) * 1000
+        return surface.blit(self.panel, (WIDTH - self.panel.get_width() - 10, 40))
+
+    def render_panel(self):
+        """Render graphs, percentiles and sprite counts into a new panel surface"""
+        samples = self.timer.samples
+        font = self.font
+        line_height = font.get_linesize()
+        graph_height = PROFILER_GRAPH_HEIGHT
+        frames = samples.get("frame", ())
+        phases = [phase for phase in samples if phase != "frame"] if frames else []
+        rows = 3 + len(phases) + len(self.counts)
+        width = PROFILER_WIDTH
+        height = graph_height + 10 + rows * line_height
+
+        panel = pygame.Surface((width, height))
+        panel.fill(DARK_BLUE)
+        pygame.draw.rect(panel, GRID_LINE, panel.get_rect(), 1)
+
+        # Rolling frame-time graph, scaled so one frame budget is half the height
+        budget = 1000 / FPS
+        scale = graph_height / (2 * budget)
+        pygame.draw.line(panel, GRID_LINE, (0, graph_height - budget * scale), (width, graph_height - budget * scale))
+        for series, color in ((frames, NEON_CYAN), (self.draw_series(), NEON_PINK)):
+            recent = list(series)[-width:]
+            if len(recent) > 1:
+                offset = width - len(recent)
+                points = [(offset + i, graph_height - min(ms * scale, graph_height)) for i, ms in enumerate(recent)]
+                pygame.draw.lines(panel, color, False, points)
+
+        # Percentiles per phase
+        y = graph_height + 5
+        lines = []
+        if frames:
+            ordered = sorted(frames)
+            lines.append((f"frame  p50 {percentile(ordered, 50):5.2f}  p99 {percentile(ordered, 99):5.2f} ms", NEON_CYAN))
+        lines.append((f"panel {self.panel_cost:5.2f} ms @ {PROFILER_REFRESH_HZ} Hz", GRID_LINE))
+        if phases:
+            lines.append((f"{'phase':<22}  p50   p99 ms", GRID_LINE))
+        for phase in phases:
+            ordered = sorted(samples[phase])
+            lines.append((f"{phase:<22} {percentile(ordered, 50):5.2f} {percentile(ordered, 99):5.2f}", WHITE))
+        for group, count in self.counts.items():
+            lines.append((f"{group:<22} {count:>5}", NEON_GREEN))
+
+        for text, color in lines:
+            panel.blit(font.render(text, False, color), (6, y))
+            y += line_height
+
+        if PROFILER_ALPHA is not None:
+            panel.set_alpha(PROFILER_ALPHA)
+        return panel
+
+    def draw_series(self):
+        """Return the per-frame draw time (sprites, particles, stars, post-processing, HUD and flip)"""
+        samples = self.timer.samples
+        series = [samples[phase] for phase in ("stars.draw", "all_sprites.draw", "particles.draw", "postfx",
+                                                "draw_hud", "display.flip") if phase in samples]
+        return [sum(values) for values in zip(*series)]
+
+    def export_csv(self, path=None):
+        """Write the buffered samples, one row per frame, and return the file path"""
+        path = path or time.strftime(PROFILER_CSV_NAME)
+        samples = self.timer.samples
+        phases = list(samples)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame_index"] + [f"{phase}_ms" for phase in phases])
+            for index, row in enumerate(zip(*(samples[phase] for phase in phases))):
+                writer.writerow([index] + [f"{ms:.4f}" for ms in row])
+        return path
@@ -0,0 +1,75 @@
+"""
+Dirty-rectangle renderer for NeuroLink: Cyberpunk Data Recovery game.
+Pushes only the changed screen regions to the display instead of flipping the whole frame.
+"""
+
+import pygame
+from config import *
+
+class DirtyRenderer:
+    """Clears and redraws only the areas touched by sprites and HUD elements"""
+
+    def __init__(self, screen, threshold=DIRTY_RECT_FULL_FLIP_THRESHOLD):
+        """Initialize the renderer with a cached background"""
+        self.screen = screen
+        self.threshold = threshold
+        self.screen_area = screen.get_width() * screen.get_height()
+
+        # Cached background used to erase old sprite positions
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.background.fill(BLACK)
+
+        # Areas drawn outside the sprite group last frame (HUD text, lives)
+        self.overlay_rects = []
+        self.layers = []
+        self.full_redraw = True
+
+        # Stats
+        self.dirty_frames = 0
+        self.full_frames = 0
+
+    def invalidate(self):
+        """Force the next frame to redraw and flip the whole screen"""
+        self.full_redraw = True
+
+    def clear(self, layers):
+        """Erase last frame's layers and overlays with the cached background
+
+        Each layer is a sprite group or anything else with the same clear(surface, bgd)
+        and draw(surface) -> rects interface.
+        """
+        if len(layers) != len(self.layers) or any(a is not b for a, b in zip(layers, self.layers)):
+            # New layers (e.g. after a reset) - nothing on screen is tracked
+            self.layers = list(layers)
+            self.full_redraw = True
+
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            return
+
+        for layer in layers:
+            layer.clear(self.screen, self.background)
+        for rect in self.overlay_rects:
+            self.screen.blit(self.background, rect, rect)
+
+    def draw(self, layers):
+        """Draw the layers in order and return the changed regions"""
+        rects = []
+        for layer in layers:
+            rects += layer.draw(self.screen)
+        return rects
+
+    def present(self, sprite_rects, overlay_rects):
+        """Update the display with the changed regions, or flip if too much changed"""
+        dirty_rects = sprite_rects + self.overlay_rects + overlay_rects
+        self.overlay_rects = overlay_rects
+
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if self.full_redraw or dirty_area > self.screen_area * self.threshold:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty_rects)
+            self.dirty_frames += 1
+
+        self.full_redraw = False
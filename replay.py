@@ -0,0 +1,262 @@
+"""
+Input recording and replay for NeuroLink: Cyberpunk Data Recovery game.
+A replay is the game seed plus the held keys and key presses of every simulation tick, so a
+run can be reproduced exactly, played back headless faster than real time and seeked through
+keyframes of the game state.
+
+Usage:
+    python neurolink.py --record run.nlr              # record a live game
+    python replay.py run.nlr                          # play it back headless
+    python replay.py run.nlr --seek 3600              # jump to one minute in
+"""
+
+import copy
+import copyreg
+import struct
+import time
+import zlib
+import argparse
+import pygame
+from config import *
+from controls import ACTION_LEFT, ACTION_RIGHT, HeldKeys
+import timing
+
+REPLAY_MAGIC = b"NLRP"
+REPLAY_VERSION = 2  # Version 2 no longer simulates behind the welcome screen
+REPLAY_HEADER = struct.Struct("<4sBHQIB")  # Magic, version, tick rate, seed, ticks, flags
+REPLAY_KEYS = 0x80  # Tick byte flag: key presses follow
+
+# Header flags
+REPLAY_WELCOME = 1  # The run started on the welcome screen
+REPLAY_AUTOPLAY = 2  # Game over and cleared levels advanced by themselves (headless runs)
+
+
+class Replay:
+    """Seed and per-tick input of one run
+
+    Each tick stores a held-key mask (ACTION_LEFT, ACTION_RIGHT) and the keys
+    pressed before that tick's update.
+    """
+
+    def __init__(self, seed, welcome=False, autoplay=False, fps=FPS):
+        """Initialize an empty replay"""
+        self.seed = seed
+        self.welcome = welcome
+        self.autoplay = autoplay
+        self.fps = fps
+        self.held = bytearray()
+        self.keys = {}  # tick -> key codes pressed before it
+
+    def __len__(self):
+        """Return the number of recorded ticks"""
+        return len(self.held)
+
+    def record_tick(self, held, keys):
+        """Append one tick of input"""
+        if keys:
+            self.keys[len(self.held)] = list(keys)
+        self.held.append(held)
+
+    def save(self, path):
+        """Write the replay as a header and a zlib-compressed tick stream"""
+        body = bytearray()
+        for tick, held in enumerate(self.held):
+            keys = self.keys.get(tick)
+            if keys:
+                body.append(held | REPLAY_KEYS)
+                body.append(len(keys))
+                body += struct.pack(f"<{len(keys)}I", *keys)
+            else:
+                body.append(held)
+
+        flags = (REPLAY_WELCOME if self.welcome else 0) | (REPLAY_AUTOPLAY if self.autoplay else 0)
+        with open(path, "wb") as f:
+            f.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.fps, self.seed, len(self), flags))
+            f.write(zlib.compress(bytes(body), 9))
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay written by save()"""
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, fps, seed, ticks, flags = REPLAY_HEADER.unpack_from(data)
+        # Version 1 replays play back the same unless they started on the welcome screen
+        if magic != REPLAY_MAGIC or not (version == REPLAY_VERSION or version == 1 and not flags & REPLAY_WELCOME):
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} NeuroLink replay")
+        replay = cls(seed, bool(flags & REPLAY_WELCOME), bool(flags & REPLAY_AUTOPLAY), fps)
+
+        body = zlib.decompress(data[REPLAY_HEADER.size:])
+        offset = 0
+        for _ in range(ticks):
+            held = body[offset]
+            offset += 1
+            keys = ()
+            if held & REPLAY_KEYS:
+                count = body[offset]
+                keys = struct.unpack_from(f"<{count}I", body, offset + 1)
+                offset += 1 + 4 * count
+            replay.record_tick(held & ~REPLAY_KEYS, keys)
+        return replay
+
+
+class RecordingInput:
+    """Input source that passes another source through and records it into a replay"""
+
+    def __init__(self, source, replay):
+        """Initialize with the wrapped input source and the replay to fill"""
+        self.source = source
+        self.replay = replay
+        self.pending = []  # Keys pressed since the last tick
+
+    def get_events(self):
+        """Return the wrapped source's events, remembering key presses"""
+        events = self.source.get_events()
+        self.pending.extend(event.key for event in events if event.type == pygame.KEYDOWN)
+        return events
+
+    def get_pressed(self):
+        """Return the wrapped source's held keys, closing the current tick"""
+        pressed = self.source.get_pressed()
+        held = (ACTION_LEFT if pressed[pygame.K_LEFT] else 0) | (ACTION_RIGHT if pressed[pygame.K_RIGHT] else 0)
+        self.replay.record_tick(held, self.pending)
+        self.pending = []
+        return pressed
+
+
+class ReplayInput:
+    """Input source that feeds a replay back one tick per update"""
+
+    def __init__(self, replay):
+        """Initialize at the first tick"""
+        self.replay = replay
+        self.position = 0
+
+    def get_events(self):
+        """Return the key presses recorded before the current tick"""
+        return [pygame.event.Event(pygame.KEYDOWN, key=key) for key in self.replay.keys.get(self.position, ())]
+
+    def get_pressed(self):
+        """Return the current tick's held keys and move on to the next tick"""
+        held = self.replay.held[self.position] if self.position < len(self.replay) else 0
+        self.position += 1
+        keys = []
+        if held & ACTION_LEFT:
+            keys.append(pygame.K_LEFT)
+        if held & ACTION_RIGHT:
+            keys.append(pygame.K_RIGHT)
+        return HeldKeys(keys)
+
+
+def _surface_from_bytes(data, size, fmt):
+    """Rebuild a surface copied by _reduce_surface"""
+    return pygame.image.frombytes(data, size, fmt)
+
+
+def _reduce_surface(surface):
+    """Let copy.deepcopy copy sprite images along with the game state"""
+    fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+    return _surface_from_bytes, (pygame.image.tobytes(surface, fmt), surface.get_size(), fmt)
+
+
+copyreg.pickle(pygame.Surface, _reduce_surface)
+
+
+class ReplayPlayer:
+    """Headless replay playback with keyframes for seeking
+
+    A deep copy of the game state is kept every keyframe_interval ticks as
+    playback passes them; seeking restores the nearest earlier keyframe and
+    simulates forward from there.
+    """
+
+    def __init__(self, replay, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        """Initialize a headless game at the start of the replay"""
+        from neurolink import Game  # neurolink imports this module for --record
+
+        self.replay = replay
+        self.keyframe_interval = keyframe_interval
+        self.input = ReplayInput(replay)
+        self.game = Game(headless=True, input_source=self.input, seed=replay.seed)
+        self.game.show_welcome = replay.welcome
+        self.keyframes = {}
+        self.capture()
+
+    @property
+    def tick(self):
+        """Return the number of ticks played"""
+        return self.input.position
+
+    def capture(self):
+        """Keep a keyframe of the current tick"""
+        game = self.game
+        memo = {id(game.sound_manager): game.sound_manager}
+        self.keyframes[self.tick] = (copy.deepcopy(game.game_state, memo), game.show_welcome)
+
+    def restore(self, tick):
+        """Continue from the keyframe at tick"""
+        game = self.game
+        game_state, show_welcome = self.keyframes[tick]
+        memo = {id(game.sound_manager): game.sound_manager}
+        game.game_state = copy.deepcopy(game_state, memo)  # Keep the keyframe itself pristine
+        game.show_welcome = show_welcome
+        timing.set_clock(game.game_state.clock)
+        self.input.position = tick
+
+    def step(self):
+        """Play one tick"""
+        self.game.step(self.replay.autoplay)
+        if self.tick % self.keyframe_interval == 0 and self.tick not in self.keyframes:
+            self.capture()
+
+    def seek(self, tick):
+        """Move to tick, restoring the closest keyframe when that is quicker than stepping"""
+        tick = max(0, min(tick, len(self.replay)))
+        keyframe = max(t for t in self.keyframes if t <= tick)
+        if tick < self.tick or keyframe > self.tick:
+            self.restore(keyframe)
+        while self.tick < tick:
+            self.step()
+
+    def play(self, ticks=None):
+        """Play up to ticks more ticks (the rest of the replay by default) and return stats"""
+        end = len(self.replay) if ticks is None else min(len(self.replay), self.tick + ticks)
+        start = time.perf_counter()
+        played = end - self.tick
+        while self.tick < end:
+            self.step()
+        elapsed = time.perf_counter() - start
+
+        gs = self.game.game_state  # Shorthand
+        return {
+            "ticks": played,
+            "seconds": elapsed,
+            "speedup": played / self.replay.fps / elapsed if elapsed else float("inf"),
+            "tick": self.tick,
+            "level": gs.level,
+            "score": gs.score,
+            "high_score": gs.high_score,
+        }
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Play back a NeuroLink replay headless")
+    parser.add_argument("replay", help="replay file recorded with neurolink.py --record")
+    parser.add_argument("--seek", type=int, default=0, help="tick to jump to before playing")
+    parser.add_argument("--ticks", type=int, default=None, help="ticks to play after seeking (default: all)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    replay = Replay.load(args.replay)
+    player = ReplayPlayer(replay)
+    if args.seek:
+        start = time.perf_counter()
+        player.seek(args.seek)
+        print(f"Seeked to tick {player.tick} in {time.perf_counter() - start:.2f}s")
+    stats = player.play(args.ticks)
+    print(f"Played {stats['ticks']} ticks in {stats['seconds']:.2f}s ({stats['speedup']:.0f}x real time) - "
+          f"tick {stats['tick']}/{len(replay)}, level {stats['level']}, score {stats['score']}, "
+          f"high score {stats['high_score']}")
+    pygame.quit()
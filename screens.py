@@ -0,0 +1,210 @@
+"""
+Menu screen composition for NeuroLink: Cyberpunk Data Recovery game.
+Bakes the static layers of the welcome, pause, game over and level complete screens once
+so each frame only redraws the animated parts.
+"""
+
+import pygame
+import math
+import timing
+from config import *
+
+class ScreenCache:
+    """Pre-composed static layers for the menu and overlay screens"""
+
+    INSTRUCTIONS = [
+        "Arrow Keys: Navigate Data Interceptor",
+        "Spacebar: Send Data Packets",
+        "P: Pause Neural Connection",
+        "M: Toggle Audio Atmosphere",
+        "Collect System Upgrades to enhance your Interceptor",
+        "Breach Firewall Nodes every 5 network levels",
+        "",
+        "Press any key to initiate connection"
+    ]
+
+    def __init__(self, font, small_font, title_font):
+        """Initialize the cache and bake all static layers"""
+        self.font = font
+        self.small_font = small_font
+        self.title_font = title_font
+
+        # Animated text surfaces keyed by (text, color)
+        self.pulse_frames = {}
+
+        # Value-dependent text keyed by the values it shows
+        self.game_over_key = None
+        self.game_over_blits = []
+        self.game_won_key = None
+        self.game_won_blits = []
+
+        self.bake_welcome()
+        self.bake_pause()
+        self.bake_game_over()
+
+    def render_pulse(self, font, text, color):
+        """Render animated text once per distinct color"""
+        key = (text, color)
+        surface = self.pulse_frames.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self.pulse_frames[key] = surface
+        return surface
+
+    def centered(self, surface, y):
+        """Return a (surface, position) pair centering the surface horizontally"""
+        return surface, (WIDTH // 2 - surface.get_width() // 2, y)
+
+    def bake_welcome(self):
+        """Bake the welcome screen gradient, grid lines and static foreground"""
+        # Create a gradient background
+        self.gradient = pygame.Surface((WIDTH, HEIGHT))
+        for y in range(HEIGHT):
+            # Create a dark to slightly blue gradient
+            color_value = max(5, min(20, int(20 * (1 - y / HEIGHT))))
+            self.gradient.fill((0, color_value, color_value + 10), (0, y, WIDTH, 1))
+
+        # Single grid lines, blitted with per-line alpha
+        self.grid_vline = pygame.Surface((1, HEIGHT))
+        self.grid_vline.fill(GRID_LINE)
+        self.grid_hline = pygame.Surface((WIDTH, 1))
+        self.grid_hline.fill(GRID_LINE)
+
+        # Layout follows the rendered text sizes
+        title_text = self.title_font.render("NEUROLINK", True, NEON_CYAN)
+        subtitle_text = self.font.render("CYBERPUNK DATA RECOVERY", True, NEON_PINK)
+        self.title_y = int(HEIGHT * 0.25)
+        self.subtitle_y = self.title_y + title_text.get_height() + 20
+
+        # Static foreground: separator, instructions and call-to-action shadow
+        self.welcome_blits = []
+
+        line_width = int(subtitle_text.get_width() * 0.8)
+        line_x = WIDTH // 2 - line_width // 2
+        line_y = self.subtitle_y + subtitle_text.get_height() + 20
+        separator = pygame.Surface((line_width + 1, 2))
+        separator.fill(NEON_TEAL)
+        self.welcome_blits.append((separator, (line_x, line_y)))
+
+        y_pos = line_y + 40
+        last = len(self.INSTRUCTIONS) - 1
+        for idx, instruction in enumerate(self.INSTRUCTIONS):
+            # Skip empty lines but maintain spacing
+            if not instruction:
+                y_pos += 20
+                continue
+
+            if idx == last:
+                # Call to action is animated; only its shadow is static
+                self.cta_text = self.font.render(instruction, True, NEON_YELLOW)
+                self.cta_y = y_pos
+                inst_shadow = self.font.render(instruction, True, (30, 30, 40))
+                self.welcome_blits.append((inst_shadow, (WIDTH // 2 - self.cta_text.get_width() // 2 + 2, y_pos + 2)))
+            else:
+                inst_color = NEON_TEAL if idx % 2 == 0 else NEON_BLUE
+                inst_text = self.small_font.render(instruction, True, inst_color)
+                self.welcome_blits.append(self.centered(inst_text, y_pos))
+            y_pos += 30 if idx != last - 1 else 45  # Larger gap before final instruction
+
+        # Simple interceptor logo at the bottom, drawn over the call to action
+        icon_size = 30
+        self.logo = logo = pygame.Surface((icon_size * 2 + 1, icon_size * 2 + 11), pygame.SRCALPHA)
+        pygame.draw.polygon(logo, NEON_CYAN, [
+            (icon_size, 0),  # Top point
+            (0, icon_size * 2),  # Bottom left
+            (icon_size * 2, icon_size * 2),  # Bottom right
+        ])
+        pygame.draw.rect(logo, NEON_BLUE, (icon_size - 10, icon_size * 2, 20, 10))
+        self.logo_pos = (WIDTH // 2 - icon_size, HEIGHT - 100 - icon_size)
+
+    def bake_pause(self):
+        """Bake the pause overlay and its text"""
+        self.pause_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self.pause_overlay.fill((0, 0, 0, 128))
+        self.pause_blits = [
+            (self.pause_overlay, (0, 0)),
+            self.centered(self.title_font.render("PAUSED", True, WHITE), HEIGHT // 2 - 50),
+            self.centered(self.font.render("Press P to continue", True, WHITE), HEIGHT // 2 + 20),
+        ]
+
+    def bake_game_over(self):
+        """Bake the static game over text"""
+        self.game_over_static = [
+            self.centered(self.title_font.render("GAME OVER", True, NEON_RED), HEIGHT // 2 - 100),
+            self.centered(self.font.render("Press R to restart", True, NEON_TEAL), HEIGHT // 2 + 50),
+            self.centered(self.font.render("Press Q to quit", True, NEON_TEAL), HEIGHT // 2 + 80),
+        ]
+        self.game_won_next = self.centered(self.font.render("Press N for next level", True, WHITE), HEIGHT // 2 + 20)
+
+    def draw_welcome(self, screen, stars):
+        """Draw the welcome screen, animating only the grid, title and call to action"""
+        screen.blit(self.gradient, (0, 0))
+
+        # Draw animated digital grid (subtle cyberpunk circuit pattern)
+        current_time = timing.get_ticks() / 1000
+        grid_spacing = 40
+        grid_offset = int(current_time * 10) % grid_spacing
+        grid_alpha = abs(math.sin(current_time)) * 100 + 50
+
+        vline = self.grid_vline
+        for x in range(-grid_offset, WIDTH, grid_spacing):
+            vline.set_alpha(int(grid_alpha * (0.5 + 0.5 * math.sin(x / 100 + current_time))))
+            screen.blit(vline, (x, 0))
+
+        hline = self.grid_hline
+        for y in range(-grid_offset, HEIGHT, grid_spacing):
+            hline.set_alpha(int(grid_alpha * (0.5 + 0.5 * math.sin(y / 100 + current_time))))
+            screen.blit(hline, (0, y))
+
+        # Draw stars with pulsating effect
+        stars.draw(screen)
+
+        # Title pulse
+        title_color = (NEON_CYAN[0], NEON_CYAN[1], min(255, NEON_CYAN[2] + int(40 * math.sin(current_time * 3))))
+        title_text = self.render_pulse(self.title_font, "NEUROLINK", title_color)
+        screen.blit(*self.centered(title_text, self.title_y))
+
+        # Subtitle pulse with a subtle horizontal glitch
+        subtitle_color = (255, min(255, 100 + int(20 * math.sin(current_time * 2 + 1))), 153)
+        subtitle_text = self.render_pulse(self.font, "CYBERPUNK DATA RECOVERY", subtitle_color)
+        glitch_offset = int(math.sin(current_time * 10) * 2)
+        screen.blit(subtitle_text, (WIDTH // 2 - subtitle_text.get_width() // 2 + glitch_offset, self.subtitle_y))
+
+        screen.blits(self.welcome_blits, doreturn=False)
+
+        # Subtle horizontal motion for call to action
+        cta_x = WIDTH // 2 - self.cta_text.get_width() // 2 + int(math.sin(current_time * 2) * 3)
+        screen.blit(self.cta_text, (cta_x, self.cta_y))
+        screen.blit(self.logo, self.logo_pos)
+
+    def draw_pause(self, screen):
+        """Draw the pause overlay"""
+        screen.blits(self.pause_blits, doreturn=False)
+
+    def draw_game_over(self, screen, stars, score, high_score):
+        """Draw the game over screen, re-rendering score text only when it changes"""
+        screen.fill(BLACK)
+
+        # Draw stars in background
+        stars.draw(screen)
+
+        key = (score, high_score)
+        if key != self.game_over_key:
+            self.game_over_key = key
+            self.game_over_blits = self.game_over_static + [
+                self.centered(self.font.render(f"Final Score: {score}", True, NEON_BLUE), HEIGHT // 2 - 30),
+                self.centered(self.font.render(f"High Score: {high_score}", True, NEON_TEAL), HEIGHT // 2 + 10),
+            ]
+        screen.blits(self.game_over_blits, doreturn=False)
+
+    def draw_game_won(self, screen, level, score):
+        """Draw the level complete screen, re-rendering text only when it changes"""
+        key = (level, score)
+        if key != self.game_won_key:
+            self.game_won_key = key
+            self.game_won_blits = [
+                self.centered(self.title_font.render(f"LEVEL {level} COMPLETE!", True, GREEN), HEIGHT // 2 - 80),
+                self.centered(self.font.render(f"Score: {score}", True, WHITE), HEIGHT // 2 - 30),
+                self.game_won_next,
+            ]
+        screen.blits(self.game_won_blits, doreturn=False)
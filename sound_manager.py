@@ -5,69 +5,213 @@ Handles loading and playing digital audio effects for the cyberpunk atmosphere.
 
 import pygame
 import os
-from config import SOUND_VOLUME
+import glob
+import hashlib
+import threading
+import time
+from config import (SOUND_VOLUME, SOUND_DIR, SOUND_FILES, SOUND_CACHE, SOUND_CACHE_DIR, SOUND_CHANNEL_GROUPS,
+                    SOUND_GROUP, SOUND_DEFAULT_GROUP, SOUND_PRIORITY, SOUND_DEDUPE_WINDOW, SOUND_SEGMENTS)
 
 class SoundManager:
-    """Manages game audio effects for the cyberpunk atmosphere"""
+    """Manages game audio effects for the cyberpunk atmosphere
+
+    The audio device opens and sound files load on a background thread, and each
+    sound becomes playable as soon as its file is in; until then (or if its file
+    is missing) playing it is a no-op. Each file is decoded once, shared by every sound that uses it, and
+    its samples are cached on disk so later launches skip decoding.
+
+    Playback goes through voices: each sound belongs to a group of reserved mixer
+    channels, so a burst of hits can't take the channels game over needs. A full
+    group steals its lowest-priority, oldest voice or drops the new sound, and a
+    repeat of the same sound within SOUND_DEDUPE_WINDOW is dropped.
+    """
     
-    def __init__(self):
-        """Initialize the sound manager"""
+    def __init__(self, enabled=True, background=True):
+        """Initialize the sound manager (a disabled manager skips loading entirely)
+
+        Args:
+            enabled: Load and play sounds
+            background: Load on a background thread instead of blocking
+        """
         self.sounds = {}
-        self.enabled = True
-        self.load_sounds()
+        self.missing = {}  # Sound name -> why it is unavailable
+        self.segments = {}  # (sound name, start, duration) -> sliced Sound
+        self.enabled = enabled
+        self.state = "off"  # off, loading, ready or unavailable (no audio device)
+        self.loaded = threading.Event()
+        self.voices = {}  # Group -> [channel, priority, start time] per reserved channel
+        self.last_played = {}  # Sound or segment -> start time, for dedupe
+        self.stats = {"played": 0, "deduped": 0, "dropped": 0, "stolen": 0}
+        if not enabled:
+            self.loaded.set()
+            return
+
+        self.state = "loading"
+        if background:
+            threading.Thread(target=self.load_sounds, name="sound-loader", daemon=True).start()
+        else:
+            self.load_sounds()
+    
+    @property
+    def ready(self):
+        """Return whether loading has finished"""
+        return self.loaded.is_set()
+    
+    def wait_until_loaded(self, timeout=None):
+        """Block until loading has finished and return whether it has"""
+        return self.loaded.wait(timeout)
+    
+    def reserve_channels(self):
+        """Split the first mixer channels into the SOUND_CHANNEL_GROUPS voice groups"""
+        total = sum(SOUND_CHANNEL_GROUPS.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)  # Keep Sound.play() elsewhere off them
+        voices = {}
+        index = 0
+        for group, count in SOUND_CHANNEL_GROUPS.items():
+            voices[group] = [[pygame.mixer.Channel(i), 0, 0.0] for i in range(index, index + count)]
+            index += count
+        self.voices = voices  # Published whole, since play() runs on another thread
     
     def load_sounds(self):
-        """Load all game sound effects"""
+        """Open the audio device and load all game sound effects, decoding each source file once"""
         try:
-            # Load sound files
-            self.sounds["shoot"] = pygame.mixer.Sound(os.path.join("sounds", "Space Shooter SFX by edwardszakal.wav"))
-            self.sounds["hit"] = pygame.mixer.Sound(os.path.join("sounds", "Space Shooter SFX by edwardszakal.wav"))
-            self.sounds["game_over"] = pygame.mixer.Sound(os.path.join("sounds", "Game Over 02 Voices by LilMati.wav"))
-            self.sounds["powerup"] = pygame.mixer.Sound(os.path.join("sounds", "Bouncing Power Up 1_2 by Joao Janz.wav"))
-            self.sounds["explosion"] = pygame.mixer.Sound(os.path.join("sounds", "Space Explosion by Morgan Purkis.wav"))
-            self.sounds["level_up"] = pygame.mixer.Sound(os.path.join("sounds", "Level Up Mission Complete by Beetlemuse.wav"))
-            
-            # Set volume levels
-            for sound_name, volume in SOUND_VOLUME.items():
-                if sound_name in self.sounds:
-                    self.sounds[sound_name].set_volume(volume)
-            
-            print("Sound files loaded successfully!")
-        except Exception as e:
-            print(f"Warning: Error loading sound files. Game will run without sound. Error: {e}")
-            self.enabled = False
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+            except pygame.error:
+                self.state = "unavailable"
+                print("Warning: No audio device. Game will run without sound.")
+                return
+            self.reserve_channels()
+
+            # Sounds that share a file share its decoded samples
+            files = {}
+            for sound_name, filename in SOUND_FILES.items():
+                files.setdefault(filename, []).append(sound_name)
+
+            for filename, sound_names in files.items():
+                try:
+                    sound = self.load_file(os.path.join(SOUND_DIR, filename))
+                except (pygame.error, OSError) as e:
+                    for sound_name in sound_names:
+                        self.missing[sound_name] = str(e)
+                    continue
+                for sound_name in sound_names:
+                    self.sounds[sound_name] = sound
+
+            for sound_name, (source, start, duration) in SOUND_SEGMENTS.items():
+                if source in self.sounds:
+                    self.sounds[sound_name] = self.slice(self.sounds[source], start, duration)
+                else:
+                    self.missing[sound_name] = f"segment of unavailable sound {source!r}"
+
+            self.state = "ready"
+            if self.missing:
+                print(f"Warning: Some sound files could not be loaded; these sounds stay silent: "
+                      f"{', '.join(sorted(self.missing))}")
+            else:
+                print("Sound files loaded successfully!")
+        finally:
+            self.loaded.set()
     
-    def play(self, sound_name):
-        """Play a sound effect by name"""
-        if not self.enabled or sound_name not in self.sounds:
-            return
-        
-        self.sounds[sound_name].play()
+    def load_file(self, path):
+        """Return a Sound for path, from the decoded-sample cache when it is current"""
+        if not SOUND_CACHE:
+            return pygame.mixer.Sound(path)
+
+        # The cache entry is keyed on the file and on the mixer's sample format
+        stat = os.stat(path)
+        key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{pygame.mixer.get_init()}"
+        stem = os.path.splitext(os.path.basename(path))[0].replace(" ", "_")
+        cache_path = os.path.join(SOUND_CACHE_DIR, f"{stem}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.pcm")
+        try:
+            with open(cache_path, "rb") as f:
+                return pygame.mixer.Sound(buffer=f.read())
+        except OSError:
+            pass
+
+        sound = pygame.mixer.Sound(path)
+        try:
+            os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+            for stale in glob.glob(os.path.join(SOUND_CACHE_DIR, glob.escape(stem) + "-*.pcm")):
+                os.remove(stale)
+            with open(cache_path + ".tmp", "wb") as f:
+                f.write(sound.get_raw())
+            os.replace(cache_path + ".tmp", cache_path)
+        except OSError:
+            pass  # A read-only install just decodes every launch
+        return sound
+    
+    def slice(self, sound, start, duration):
+        """Return a new Sound holding duration seconds of sound from start (to the end if duration is None)"""
+        frequency, size, channels = pygame.mixer.get_init()
+        frame = abs(size) // 8 * channels
+        raw = sound.get_raw()
+        first = min(int(start * frequency) * frame, len(raw))
+        last = len(raw) if duration is None else min(first + int(duration * frequency) * frame, len(raw))
+        return pygame.mixer.Sound(buffer=raw[first:last]) if last > first else None
+    
+    def play(self, sound_name, volume=None):
+        """Play a sound effect by name and return its channel (None if it didn't play)"""
+        return self.start_voice(sound_name, self.sounds.get(sound_name), sound_name, volume)
     
     def play_segment(self, sound_name, start_time, duration, volume=None):
         """
         Play a specific segment from a sound file
-        
+
+        The segment is sliced into its own buffer the first time and reused after.
+
         Args:
             sound_name: Name of the sound in the sounds dictionary
             start_time: Start time in seconds
             duration: Duration to play in seconds
             volume: Optional volume override (0.0 to 1.0)
         """
-        if not self.enabled or sound_name not in self.sounds:
-            return
-        
-        # Create a temporary channel for this sound
-        channel = pygame.mixer.find_channel(True)
-        if channel:
-            # Set the volume
-            if volume is not None:
-                channel.set_volume(volume)
-            else:
-                channel.set_volume(SOUND_VOLUME.get(sound_name, 0.5))
-            
-            # Play the sound
-            channel.play(self.sounds[sound_name])
+        key = (sound_name, start_time, duration)
+        if key not in self.segments:
+            if sound_name not in self.sounds:
+                return None
+            self.segments[key] = self.slice(self.sounds[sound_name], start_time, duration)
+        return self.start_voice(sound_name, self.segments[key], key, volume)
+    
+    def start_voice(self, sound_name, sound, key, volume=None):
+        """Start sound on a voice of sound_name's group, stealing one if the group is full
+
+        Args:
+            sound_name: Sound (or segment) name, for its group, priority and volume
+            sound: Sound to play
+            key: What repeats are deduplicated on
+            volume: Optional volume override (0.0 to 1.0)
+        """
+        if not self.enabled or sound is None or not self.voices:
+            return None
+
+        now = time.perf_counter()
+        if now - self.last_played.get(key, float("-inf")) < SOUND_DEDUPE_WINDOW:
+            self.stats["deduped"] += 1
+            return None
+
+        # Segments take their group, priority and volume from their source sound
+        base = SOUND_SEGMENTS[sound_name][0] if sound_name in SOUND_SEGMENTS else sound_name
+        voices = self.voices[SOUND_GROUP.get(sound_name, SOUND_GROUP.get(base, SOUND_DEFAULT_GROUP))]
+        priority = SOUND_PRIORITY.get(sound_name, SOUND_PRIORITY.get(base, 0))
+        voice = next((voice for voice in voices if not voice[0].get_busy()), None)
+        if voice is None:
+            voice = min(voices, key=lambda voice: (voice[1], voice[2]))
+            if voice[1] > priority:
+                self.stats["dropped"] += 1
+                return None
+            self.stats["stolen"] += 1
+
+        channel = voice[0]
+        channel.play(sound)
+        channel.set_volume(volume if volume is not None else
+                           SOUND_VOLUME.get(sound_name, SOUND_VOLUME.get(base, 0.5)))
+        voice[1:] = [priority, now]
+        self.last_played[key] = now
+        self.stats["played"] += 1
+        return channel
     
     def toggle_sound(self):
         """Toggle sound on/off"""
@@ -0,0 +1,188 @@
+"""
+Spatial hash broadphase for NeuroLink: Cyberpunk Data Recovery game.
+A sprite group that also buckets its members into a uniform grid, so collision queries only
+look at sprites in nearby cells instead of every member of the group.
+"""
+
+import pygame
+from config import *
+
+class SpatialGroup(pygame.sprite.Group):
+    """Sprite group with a uniform-grid spatial hash kept in sync with its members
+
+    Sprites are re-bucketed when the group is updated; code that moves members
+    directly must call relocate() or relocate_all() afterwards. Members that move
+    as one unit (a formation) can instead be hashed relative to an origin object
+    with x and y attributes, so moving the origin needs no re-bucketing at all.
+    """
+
+    def __init__(self, *sprites, cell_size=ENEMY_SPACING):
+        """Initialize an empty hash"""
+        self.cell_size = cell_size
+        self.origin = None
+        self.buckets = {}  # (cell x, cell y) -> {sprite: None}, an ordered set
+        self.cells = {}  # sprite -> cell range it was bucketed with
+        self.order = {}  # sprite -> insertion serial, to keep group order in results
+        self.serial = 0
+        super().__init__(*sprites)
+
+    def cell_range(self, rect):
+        """Return the (x0, y0, x1, y1) cell range covered by a rect"""
+        size = self.cell_size
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        if self.origin is not None:
+            ox, oy = self.origin.x, self.origin.y
+            left, top, right, bottom = left - ox, top - oy, right - ox, bottom - oy
+        return (left // size, top // size, (right - 1) // size, (bottom - 1) // size)
+
+    def bucket(self, sprite, cells):
+        """Insert a sprite into every bucket of a cell range"""
+        buckets = self.buckets
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket is None:
+                    buckets[(cx, cy)] = bucket = {}
+                bucket[sprite] = None
+
+    def unbucket(self, sprite, cells):
+        """Remove a sprite from every bucket of a cell range"""
+        buckets = self.buckets
+        x0, y0, x1, y1 = cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets[(cx, cy)]
+                del bucket[sprite]
+                if not bucket:
+                    del buckets[(cx, cy)]
+
+    def add_internal(self, sprite, layer=None):
+        """Add a sprite to the group and the hash"""
+        super().add_internal(sprite, layer)
+        cells = self.cell_range(sprite.rect)
+        self.cells[sprite] = cells
+        self.order[sprite] = self.serial
+        self.serial += 1
+        self.bucket(sprite, cells)
+
+    def remove_internal(self, sprite):
+        """Remove a sprite from the group and the hash"""
+        super().remove_internal(sprite)
+        self.unbucket(sprite, self.cells.pop(sprite))
+        del self.order[sprite]
+
+    def relocate(self, sprite):
+        """Re-bucket a sprite after its rect moved"""
+        cells = self.cell_range(sprite.rect)
+        old = self.cells[sprite]
+        if cells != old:
+            self.unbucket(sprite, old)
+            self.bucket(sprite, cells)
+            self.cells[sprite] = cells
+
+    def relocate_all(self):
+        """Re-bucket every member after they moved"""
+        for sprite in self.sprites():
+            self.relocate(sprite)
+
+    def update(self, *args, **kwargs):
+        """Update all members, then re-bucket the ones that moved"""
+        super().update(*args, **kwargs)
+        self.relocate_all()
+
+    def query(self, rect):
+        """Return members in the cells a rect covers, in group order"""
+        buckets = self.buckets
+        x0, y0, x1, y1 = self.cell_range(rect)
+        if x0 == x1 and y0 == y1:
+            return sorted(buckets.get((x0, y0), ()), key=self.order.__getitem__)
+
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
+
+    def query_below(self, y):
+        """Return members in cell rows that reach down to y or further, in group order"""
+        if self.origin is not None:
+            y -= self.origin.y
+        row = y // self.cell_size
+        found = {}
+        for (cx, cy), bucket in self.buckets.items():
+            if cy >= row:
+                found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
+
+    def collide(self, rect):
+        """Return members whose rect overlaps rect, in group order"""
+        return [sprite for sprite in self.query(rect) if rect.colliderect(sprite.rect)]
+
+
+def spritecollide(sprite, group, dokill):
+    """Drop-in for pygame.sprite.spritecollide using the group's spatial hash"""
+    hits = group.collide(sprite.rect)
+    if dokill:
+        for hit in hits:
+            hit.kill()
+    return hits
+
+
+def groupcollide(groupa, groupb, dokilla, dokillb):
+    """Drop-in for pygame.sprite.groupcollide, querying groupb's spatial hash"""
+    crashed = {}
+    for sprite in groupa.sprites():
+        hits = spritecollide(sprite, groupb, dokillb)
+        if hits:
+            crashed[sprite] = hits
+            if dokilla:
+                sprite.kill()
+    return crashed
+
+
+def benchmark(rows=20, cols=40, bullets=200, rounds=200):
+    """Time bullet-vs-enemy collision with the spatial hash against pygame's brute force"""
+    import random
+    import time
+
+    class Box(pygame.sprite.Sprite):
+        def __init__(self, x, y, w, h):
+            super().__init__()
+            self.rect = pygame.Rect(x, y, w, h)
+
+    rng = random.Random(0)
+    width = cols * ENEMY_SPACING
+    height = rows * ENEMY_SPACING + 200
+    enemy_boxes = [Box(c * ENEMY_SPACING, r * ENEMY_SPACING, ENEMY_WIDTH, ENEMY_HEIGHT)
+                   for r in range(rows) for c in range(cols)]
+    bullet_boxes = [Box(rng.randrange(width), rng.randrange(height), BULLET_WIDTH, BULLET_HEIGHT)
+                    for _ in range(bullets)]
+
+    plain_enemies = pygame.sprite.Group(enemy_boxes)
+    hashed_enemies = SpatialGroup(enemy_boxes)
+    bullet_group = pygame.sprite.Group(bullet_boxes)
+
+    expected = pygame.sprite.groupcollide(bullet_group, plain_enemies, False, False)
+    actual = groupcollide(bullet_group, hashed_enemies, False, False)
+    assert expected == actual, "spatial hash results differ from pygame.sprite.groupcollide"
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        pygame.sprite.groupcollide(bullet_group, plain_enemies, False, False)
+    brute = (time.perf_counter() - start) / rounds * 1000
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        groupcollide(bullet_group, hashed_enemies, False, False)
+    hashed = (time.perf_counter() - start) / rounds * 1000
+
+    print(f"{rows * cols} enemies x {bullets} bullets, {len(expected)} hits")
+    print(f"groupcollide: {brute:.3f} ms   spatial hash: {hashed:.3f} ms   ({brute / hashed:.1f}x)")
+
+
+if __name__ == "__main__":
+    benchmark()
+    benchmark(ENEMY_ROWS, ENEMY_COLS, 10)
@@ -6,7 +6,22 @@ Contains all digital entities as pygame sprites for better organization and coll
 import pygame
 import random
 import math
+import timing
 from config import *
+from fragment_atlas import FragmentAtlas, color_level
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that hands itself back to the pool it came from when killed"""
+    
+    pool = None  # Set by the SpritePool that built the sprite (sprites built directly have none)
+    pooled = True  # Not checked out of a pool
+    
+    def kill(self):
+        """Remove the sprite from all groups and return it to its pool"""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
 
 class Player(pygame.sprite.Sprite):
     """Data Interceptor sprite - player's digital vessel in cyberspace"""
@@ -15,7 +30,8 @@ class Player(pygame.sprite.Sprite):
         super().__init__()
         self.width = PLAYER_WIDTH
         self.height = PLAYER_HEIGHT
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.bake_frames()
+        self.image = self.frames[(False, False, False, 0, 0)]
         self.rect = self.image.get_rect()
         self.rect.centerx = WIDTH // 2
         self.rect.bottom = HEIGHT - 20
@@ -33,77 +49,107 @@ class Player(pygame.sprite.Sprite):
         # Update the image
         self.update_image()
     
-    def update_image(self):
-        """Update the interceptor's visual appearance based on current state"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparent background
+    # Pre-rendered frames keyed by (shield, double_shot, invincible, thrust phase, glitch phase)
+    frames = {}
+    
+    @classmethod
+    def bake_frames(cls):
+        """Pre-render every interceptor frame so per-frame updates are a single lookup"""
+        if cls.frames:
+            return
+        rng = random.Random(PLAYER_FRAME_SEED)  # Render-only, apart from the game's stream
+        for shield in (False, True):
+            for double_shot in (False, True):
+                for invincible in (False, True):
+                    glitch_phases = range(PLAYER_GLITCH_FRAMES + 1) if invincible else (0,)
+                    for thrust_phase in range(PLAYER_ANIM_FRAMES):
+                        for glitch_phase in glitch_phases:
+                            key = (shield, double_shot, invincible, thrust_phase, glitch_phase)
+                            cls.frames[key] = cls.render_frame(*key, rng)
+    
+    @staticmethod
+    def render_frame(shield, double_shot, invincible, thrust_phase, glitch_phase, rng):
+        """Render a single interceptor frame for the given state and animation phase, jittered by rng"""
+        width = PLAYER_WIDTH
+        height = PLAYER_HEIGHT
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Phase time within the 1 second animation cycle
+        time_val = thrust_phase / PLAYER_ANIM_FRAMES
         
         # Draw firewall shield if active
-        if self.shield:
-            shield_radius = max(self.width, self.height) + 10
+        if shield:
+            shield_radius = max(width, height) + 10
             shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
             # Hexagonal shield with pulsing glow effect
-            time_pulse = pygame.time.get_ticks() % 1000 / 1000
-            alpha = int(100 + 100 * time_pulse)
+            alpha = int(100 + 100 * time_val)
             points = []
             for i in range(6):
                 angle = 2 * math.pi * i / 6
                 points.append((shield_radius + shield_radius * math.cos(angle), 
                                shield_radius + shield_radius * math.sin(angle)))
             pygame.draw.polygon(shield_surface, (*NEON_BLUE, alpha), points, 2)
-            self.image.blit(shield_surface, (-shield_radius + self.width // 2, -shield_radius + self.height // 2))
+            image.blit(shield_surface, (-shield_radius + width // 2, -shield_radius + height // 2))
         # Interceptor color based on power-ups
         ship_color = NEON_TEAL
-        if self.double_shot:
+        if double_shot:
             ship_color = NEON_YELLOW
         
         # Cyberpunk interceptor design - sleeker with neon edges
         # Main body
         points = [
-            (self.width // 2, 0),  # Top
-            (0, self.height * 0.8),  # Lower left
-            (self.width // 4, self.height * 0.6),  # Inner left
-            (self.width * 3 // 4, self.height * 0.6),  # Inner right
-            (self.width, self.height * 0.8)  # Lower right
+            (width // 2, 0),  # Top
+            (0, height * 0.8),  # Lower left
+            (width // 4, height * 0.6),  # Inner left
+            (width * 3 // 4, height * 0.6),  # Inner right
+            (width, height * 0.8)  # Lower right
         ]
-        pygame.draw.polygon(self.image, ship_color, points)
+        pygame.draw.polygon(image, ship_color, points)
         
         # Neon trim - glowing edge effect
-        pygame.draw.lines(self.image, NEON_PINK, False, points, 2)
+        pygame.draw.lines(image, NEON_PINK, False, points, 2)
         
         # Digital circuit pattern
-        line_start = (self.width // 4, self.height * 0.3)
-        line_end = (self.width * 3 // 4, self.height * 0.3)
-        pygame.draw.line(self.image, NEON_BLUE, line_start, line_end, 1)
+        line_start = (width // 4, height * 0.3)
+        line_end = (width * 3 // 4, height * 0.3)
+        pygame.draw.line(image, NEON_BLUE, line_start, line_end, 1)
         
         # Draw engine thrust (animated with digital particles)
-        time_val = pygame.time.get_ticks() / 1000
         thrust_width = 3 + int(2 * math.sin(time_val * 10))
         thrust_color = NEON_ORANGE if time_val % 0.2 < 0.1 else NEON_YELLOW
         
         for i in range(3):
-            height_offset = random.randint(1, 5) * 2
-            x_offset = random.randint(-2, 2)
+            height_offset = rng.randint(1, 5) * 2
+            x_offset = rng.randint(-2, 2)
             points = [
-                (self.width // 2 - thrust_width + x_offset, self.height * 0.6),
-                (self.width // 2 + x_offset, self.height * 0.6 + height_offset),
-                (self.width // 2 + thrust_width + x_offset, self.height * 0.6)
+                (width // 2 - thrust_width + x_offset, height * 0.6),
+                (width // 2 + x_offset, height * 0.6 + height_offset),
+                (width // 2 + thrust_width + x_offset, height * 0.6)
             ]
-            pygame.draw.polygon(self.image, thrust_color, points)
+            pygame.draw.polygon(image, thrust_color, points)
         
         # Digital distortion when in neural buffer (invincible)
-        if self.invincible:
-            glitch_amount = 3
-            glitch_time = pygame.time.get_ticks() % 200
-            if glitch_time < 50:  # Create digital glitch effect
+        if invincible:
+            if glitch_phase > 0:  # Create digital glitch effect
                 for _ in range(3):
-                    x = random.randint(0, self.width - 5)
-                    y = random.randint(0, self.height - 2)
-                    w = random.randint(5, 15)
-                    h = random.randint(1, 3)
-                    pygame.draw.rect(self.image, NEON_PURPLE, (x, y, w, h))
-            self.image.set_alpha(200)
+                    x = rng.randint(0, width - 5)
+                    y = rng.randint(0, height - 2)
+                    w = rng.randint(5, 15)
+                    h = rng.randint(1, 3)
+                    pygame.draw.rect(image, NEON_PURPLE, (x, y, w, h))
+            image.set_alpha(200)
         else:
-            self.image.set_alpha(255)
+            image.set_alpha(255)
+        return image
+    
+    def update_image(self):
+        """Update the interceptor's visual appearance based on current state"""
+        ticks = timing.get_ticks()
+        thrust_phase = ticks % 1000 * PLAYER_ANIM_FRAMES // 1000
+        glitch_phase = 0
+        if self.invincible and ticks % 200 < 50:
+            glitch_phase = 1 + ticks // 200 % PLAYER_GLITCH_FRAMES
+        self.image = self.frames[(self.shield, self.double_shot, self.invincible, thrust_phase, glitch_phase)]
     
     def update(self):
         """Update player state"""
@@ -138,16 +184,21 @@ class Player(pygame.sprite.Sprite):
         if self.rect.right > WIDTH:
             self.rect.right = WIDTH
     
-    def shoot(self):
-        """Create bullets when player shoots"""
+    def shoot(self, spawn=None):
+        """Create bullets when player shoots
+        
+        Args:
+            spawn: Makes a bullet from (x, y), such as a bullet pool's acquire (new bullets if None)
+        """
+        spawn = spawn or Bullet
         bullets = []
         if self.double_shot:
             # Two bullets side by side
-            bullets.append(Bullet(self.rect.left + self.width // 3, self.rect.top))
-            bullets.append(Bullet(self.rect.left + self.width * 2 // 3, self.rect.top))
+            bullets.append(spawn(self.rect.left + self.width // 3, self.rect.top))
+            bullets.append(spawn(self.rect.left + self.width * 2 // 3, self.rect.top))
         else:
             # Single bullet
-            bullets.append(Bullet(self.rect.centerx, self.rect.top))
+            bullets.append(spawn(self.rect.centerx, self.rect.top))
         return bullets
     
     def activate_shield(self):
@@ -180,35 +231,42 @@ class Player(pygame.sprite.Sprite):
         return False  # Player was invincible, no hit registered
 
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite):
     """Player data packet sprite - represents the interceptor's data recovery tools"""
     
+    frames = {}  # Pulse value -> Surface, shared by every packet and never redrawn
+    
     def __init__(self, x, y):
         super().__init__()
         self.width = BULLET_WIDTH
         self.height = BULLET_HEIGHT
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.speed = BULLET_SPEED
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """(Re)launch the data packet from a position"""
         # Create digital data packet with pulse animation
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = timing.get_ticks()
         self.update_image()
         
-        self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
-        self.speed = BULLET_SPEED
     
     def update_image(self):
         """Update bullet appearance with animated digital effect"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparent
-        
         # Digital pulse effect
-        time_val = (pygame.time.get_ticks() - self.creation_time) / 200
+        time_val = (timing.get_ticks() - self.creation_time) / 200
         pulse = int(math.sin(time_val) * 50) + 200  # Pulsing value between 150-250
         
-        # Neon core with digital trail
-        pygame.draw.rect(self.image, NEON_TEAL, (0, 0, self.width, self.height))
-        pygame.draw.rect(self.image, (pulse, pulse, 255), (1, 1, self.width-2, self.height-2))
+        image = self.frames.get(pulse)
+        if image is None:
+            # Neon core with digital trail
+            image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            pygame.draw.rect(image, NEON_TEAL, (0, 0, self.width, self.height))
+            pygame.draw.rect(image, (pulse, pulse, 255), (1, 1, self.width-2, self.height-2))
+            self.frames[pulse] = image
+        self.image = image
     
     def update(self):
         """Move bullet upward"""
@@ -218,40 +276,48 @@ class Bullet(pygame.sprite.Sprite):
             self.kill()
 
 
-class EnemyBullet(pygame.sprite.Sprite):
+class EnemyBullet(PooledSprite):
     """Corruption packet sprite - digital threats emitted by data fragments"""
     
+    frames = {}  # Core color -> Surface, shared by every packet and never redrawn
+    
     def __init__(self, x, y):
         super().__init__()
         self.width = BULLET_WIDTH
         self.height = BULLET_HEIGHT
-        self.image = pygame.Surface((self.width + 2, self.height + 2), pygame.SRCALPHA)
-        
+        self.rect = pygame.Rect(0, 0, self.width + 2, self.height + 2)
+        self.speed = BULLET_SPEED * 0.7  # Slightly slower than player packets
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """(Re)launch the corruption packet from a position"""
         # Create corrupted data packet with glitch effect
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = timing.get_ticks()
         self.update_image()
         
-        self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.top = y
-        self.speed = BULLET_SPEED * 0.7  # Slightly slower than player packets
     
     def update_image(self):
         """Update bullet appearance with corrupted digital effect"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparent
-        
         # Digital corruption effect
-        time_val = (pygame.time.get_ticks() - self.creation_time) / 150
+        time_val = (timing.get_ticks() - self.creation_time) / 150
         glitch = int(math.sin(time_val * 2) * 30) + 220  # Glitching value
         
-        # Corrupted data with jagged edges and unstable core
-        pygame.draw.rect(self.image, NEON_RED, (0, 0, self.width + 2, self.height + 2))
         # Unstable core
-        if (pygame.time.get_ticks() % 200) < 100:
+        if (timing.get_ticks() % 200) < 100:
             core_color = (glitch, 50, 50)
         else:
             core_color = (glitch, glitch, 50)
-        pygame.draw.rect(self.image, core_color, (1, 1, self.width, self.height))
+        
+        image = self.frames.get(core_color)
+        if image is None:
+            # Corrupted data with jagged edges and unstable core
+            image = pygame.Surface((self.width + 2, self.height + 2), pygame.SRCALPHA)
+            pygame.draw.rect(image, NEON_RED, (0, 0, self.width + 2, self.height + 2))
+            pygame.draw.rect(image, core_color, (1, 1, self.width, self.height))
+            self.frames[core_color] = image
+        self.image = image
     
     def update(self):
         """Move bullet downward"""
@@ -262,107 +328,65 @@ class EnemyBullet(pygame.sprite.Sprite):
 
 
 class Enemy(pygame.sprite.Sprite):
-    """Digital data fragment sprite - targets for recovery"""
+    """Digital data fragment sprite - targets for recovery
     
-    def __init__(self, x, y):
+    Fragments turn and pulse every frame; image picks the frame for the current
+    moment from the FragmentAtlas shared by all of them, so nothing is drawn.
+    """
+    
+    formation = None  # Formation the fragment marches with, if any
+    
+    def __init__(self, x, y, rng=None):
         super().__init__()
+        self.rng = rng if rng is not None else random.Random()  # The game's seeded stream
         self.width = ENEMY_WIDTH
         self.height = ENEMY_HEIGHT
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.rect = pygame.Rect(x, y, self.width, self.height)
         self.state = 0  # Evolution state (0-3: from simple to complex)
         self.is_boss = False
-        self.birth_time = pygame.time.get_ticks()
-        self.rotation_angle = random.randint(0, 359)
+        self.birth_time = timing.get_ticks()
+        self.rotation_angle = self.rng.randint(0, 359)
         
         # Random color variation to add visual diversity
-        self.color_shift = random.randint(-30, 30)
-        
-        # Update the image
-        self.update_image()
+        self.color_shift = self.rng.randint(-30, 30)
+        self.color_level = color_level(self.color_shift)
+        self.circuits = 0
+    
+    @property
+    def rect(self):
+        """Fragment rect, following its formation's offset when it marches with one"""
+        formation = self.formation
+        if formation is not None and self.synced_step != formation.step:
+            self._rect.topleft = (formation.x + self.home[0], formation.y + self.home[1])
+            self.synced_step = formation.step
+        return self._rect
+    
+    @rect.setter
+    def rect(self, rect):
+        self._rect = rect
+    
+    def kill(self):
+        """Remove the fragment from all groups and its formation"""
+        super().kill()
+        if self.formation is not None:
+            self.formation.remove(self)
+    
+    @property
+    def image(self):
+        """Current animation frame, picked from the shared atlas"""
+        ticks = timing.get_ticks()
+        age = ticks - self.birth_time
+        rotation = self.rotation_angle + age * ENEMY_ROTATION_SPEED / 1000
+        pulse = abs(math.sin(age / 500)) * 0.3 + 0.7  # Value between 0.7-1.0
+        return Enemy.atlas.frame(self.state, self.color_level, self.circuits, rotation, pulse, ticks)
     
     def update_image(self):
-        """Update the data fragment's visual appearance based on current state"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparent background
-        
-        # Determine shape complexity and color based on state
-        # Higher states are more evolved/complex data
-        if self.state == 0:
-            # Simple data - basic hexagon shape with minimal detail
-            base_color = NEON_TEAL
-            num_sides = 6
-            detail_level = 0
-        elif self.state == 1:
-            # Starting to evolve - octagon with inner details
-            base_color = NEON_GREEN
-            num_sides = 8
-            detail_level = 1
-        elif self.state == 2:
-            # More complex - decagon with multiple layers
-            base_color = NEON_YELLOW
-            num_sides = 10
-            detail_level = 2
-        else:  # state 3 (most evolved)
-            # Final form - complex with internal structure
-            base_color = NEON_ORANGE
-            num_sides = 12
-            detail_level = 3
-        
-        # Apply color shift for variety
-        r = max(0, min(255, base_color[0] + self.color_shift))
-        g = max(0, min(255, base_color[1] + self.color_shift))
-        b = max(0, min(255, base_color[2] + self.color_shift))
-        color = (r, g, b)
-        
-        # Digital pulsing effect
-        time_val = (pygame.time.get_ticks() - self.birth_time) / 500
-        self.rotation_angle = (self.rotation_angle + 0.5) % 360
-        pulse = abs(math.sin(time_val)) * 0.3 + 0.7  # Value between 0.7-1.0
-        
-        # Draw fragment shape
-        center = (self.width // 2, self.height // 2)
-        outer_radius = int(min(self.width, self.height) // 2 * pulse)
-        
-        # Draw outer shape
-        points = []
-        for i in range(num_sides):
-            angle = 2 * math.pi * i / num_sides + math.radians(self.rotation_angle)
-            x = center[0] + outer_radius * math.cos(angle)
-            y = center[1] + outer_radius * math.sin(angle)
-            points.append((x, y))
-        pygame.draw.polygon(self.image, color, points)
-        
-        # Add inner details based on complexity level
-        if detail_level > 0:
-            inner_radius = outer_radius * 0.7
-            points = []
-            for i in range(num_sides):
-                angle = 2 * math.pi * i / num_sides + math.radians(self.rotation_angle + 180/num_sides)
-                x = center[0] + inner_radius * math.cos(angle)
-                y = center[1] + inner_radius * math.sin(angle)
-                points.append((x, y))
-            pygame.draw.polygon(self.image, (0, 0, 0), points)
-            pygame.draw.polygon(self.image, NEON_PURPLE, points, 1)
-        
-        if detail_level > 1:
-            # Add circuit-like patterns
-            for i in range(min(4, detail_level)):
-                start_angle = math.radians(random.randint(0, 359))
-                line_len = outer_radius * 0.6
-                start_pos = (center[0] + math.cos(start_angle) * outer_radius * 0.3,
-                            center[1] + math.sin(start_angle) * outer_radius * 0.3)
-                end_pos = (start_pos[0] + math.cos(start_angle) * line_len,
-                          start_pos[1] + math.sin(start_angle) * line_len)
-                pygame.draw.line(self.image, NEON_BLUE, start_pos, end_pos, 1)
-        
-        if detail_level > 2:
-            # Add pulsing center core
-            core_radius = int(outer_radius * 0.25 * pulse)
-            time_core = (pygame.time.get_ticks() % 1000) / 1000
-            core_color = NEON_RED if time_core > 0.5 else NEON_PINK
-            pygame.draw.circle(self.image, core_color, center, core_radius)
+        """Pick the circuit pattern for a new evolution state (the frames come from the atlas)"""
+        # Evolved fragments roll their circuit lines from the game's stream, as they always have
+        self.circuits = 0
+        if self.state > 1:
+            angles = [self.rng.randint(0, 359) for _ in range(min(4, self.state))]
+            self.circuits = sum(angles) % ENEMY_ATLAS_CIRCUIT_VARIANTS
     
     def hit(self):
         """Handle data fragment being hit"""
@@ -380,10 +404,21 @@ class Enemy(pygame.sprite.Sprite):
 
 
 class Boss(Enemy):
-    """Firewall Node - powerful system defense mechanism"""
+    """Firewall Node - powerful system defense mechanism
+    
+    The node is composed from cached layers - a body with the health core, ring
+    frames pre-rotated every ring_step degrees and shield overlays per
+    opacity level, both shared by all nodes - into a new frame whenever image is
+    read and its look has changed, so it animates every frame while hits only
+    lower its health, and a frame never changes once it has been shown.
+    """
     
-    def __init__(self, x, y, level):
-        super().__init__(x, y)
+    layer_frames = {}  # (layer, color, degrees or opacity) -> (cropped surface, offset), built on first use
+    core = None  # Body layer, None until the node is set up
+    
+    def __init__(self, x, y, level, rng=None, ring_step=BOSS_RING_ANGLE_STEP):
+        super().__init__(x, y, rng)
+        self.ring_step = ring_step  # Degrees between ring frames (coarser steps recompose less often)
         self.width = ENEMY_WIDTH * BOSS_SCALE
         self.height = ENEMY_HEIGHT * BOSS_SCALE
         self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
@@ -395,10 +430,8 @@ class Boss(Enemy):
         self.max_health = self.health
         
         # Visual animation variables
-        self.phase = 0
         self.outer_ring_rotation = 0
         self.inner_ring_rotation = 0
-        self.pulse_time = 0
         self.shield_active = False
         self.shield_flicker = 0
         
@@ -407,19 +440,33 @@ class Boss(Enemy):
         self.danger_color = NEON_RED
         self.highlight_color = NEON_YELLOW if level < 10 else NEON_ORANGE if level < 15 else NEON_PURPLE
         
-        # Update the image
-        self.update_image()
+        # Layer geometry
+        self.center = (self.width // 2, self.height // 2)
+        self.outer_radius = min(self.width, self.height) // 2 - 5
+        self.core_radius = self.outer_radius * 0.2
+        self.inner_radius = self.outer_radius * 0.6
+        
+        # Body layer; the composed frame is rebuilt when its look changes
+        core_size = int(self.core_radius) * 2 + 2
+        self.core_offset = (self.center[0] - core_size // 2, self.center[1] - core_size // 2)
+        self.core_health = None
+        self.core = pygame.Surface((core_size, core_size), pygame.SRCALPHA)
+        self.look = None
+    
+    @property
+    def image(self):
+        """Current frame, recomposed first if the node's look has changed"""
+        if self.core is not None:
+            self.update_image()
+        return self.frame
+    
+    @image.setter
+    def image(self, image):
+        self.frame = image
     
     def update_image(self):
-        """Update the firewall node's visual appearance"""
-        self.image.fill((0, 0, 0, 0))  # Clear with transparent background
-        
-        center = (self.width // 2, self.height // 2)
-        outer_radius = min(self.width, self.height) // 2 - 5
-        
-        # Update animation values
-        time_val = pygame.time.get_ticks() / 1000
-        self.pulse_time = (self.pulse_time + 0.02) % 1.0
+        """Advance the animation and recompose the frame if anything visible changed"""
+        time_val = timing.get_ticks() / 1000
         self.outer_ring_rotation = (time_val * 20) % 360
         self.inner_ring_rotation = (-time_val * 15) % 360
         
@@ -430,128 +477,170 @@ class Boss(Enemy):
         else:
             self.shield_active = False
         
-        # Draw base structure - concentric rings
-        # Core
-        core_radius = outer_radius * 0.2
-        pygame.draw.circle(self.image, self.danger_color, center, core_radius)
+        shield_alpha = 0
+        if self.shield_active and self.shield_flicker < 0.7:
+            shield_alpha = int(100 + 100 * abs(math.sin(time_val * 5)))
+            shield_alpha -= shield_alpha % BOSS_SHIELD_ALPHA_STEP
+        
+        # Rings repeat every 360/segments degrees, so that many degrees cover them
+        rings = (("inner", self.inner_ring_rotation, 45), ("circuits", self.outer_ring_rotation / 6, 60),
+                 ("barrier", self.outer_ring_rotation / 3, 60))
+        step = self.ring_step
+        frames = tuple(int(angle % period / step) * step for _, angle, period in rings)
+        look = (frames, self.health, shield_alpha)
+        if look == self.look:
+            return
+        self.look = look
+        
+        if self.health != self.core_health:
+            self.render_core()
+        
+        # The barrier and inner ring never overlap anything drawn before them, so
+        # they can skip alpha blending; the circuits are drawn over the core
+        image = self.frame = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        (inner, inner_offset), (circuits, circuits_offset), (barrier, barrier_offset) = (
+            self.layer_frame(ring, frame) for (ring, _, _), frame in zip(rings, frames))
+        image.blit(barrier, barrier_offset, special_flags=pygame.BLEND_RGBA_MAX)
+        image.blit(inner, inner_offset, special_flags=pygame.BLEND_RGBA_MAX)
+        image.blit(self.core, self.core_offset)
+        image.blit(circuits, circuits_offset)
+        if shield_alpha:
+            image.blit(*self.layer_frame("shield", shield_alpha))
+    
+    def render_core(self):
+        """Draw the core with its health indicator into the body layer"""
+        self.core_health = self.health
+        center = (self.center[0] - self.core_offset[0], self.center[1] - self.core_offset[1])
+        self.core.fill((0, 0, 0, 0))
+        pygame.draw.circle(self.core, self.danger_color, center, self.core_radius)
         
         # Health indicator as digital grid within core
         health_pct = self.health / self.max_health
-        health_radius = int(core_radius * health_pct)
+        health_radius = int(self.core_radius * health_pct)
         if health_radius > 0:
             health_color = (int(255 * (1-health_pct)), int(255 * health_pct), 100)
-            pygame.draw.circle(self.image, health_color, center, health_radius)
-        
-        # Inner defensive ring - rotating segments
-        inner_radius = outer_radius * 0.6
-        segments = 8
-        for i in range(segments):
-            start_angle = math.radians(self.inner_ring_rotation + i * (360/segments))
-            end_angle = math.radians(self.inner_ring_rotation + (i+0.6) * (360/segments))
-            pygame.draw.arc(self.image, self.highlight_color, 
-                          (center[0]-inner_radius, center[1]-inner_radius, inner_radius*2, inner_radius*2),
-                          start_angle, end_angle, 5)
-        
-        # Digital circuit connections
-        for i in range(6):
-            angle = math.radians(i * 60 + self.outer_ring_rotation/6)
-            start_x = center[0] + core_radius * math.cos(angle)
-            start_y = center[1] + core_radius * math.sin(angle)
-            end_x = center[0] + inner_radius * 0.8 * math.cos(angle)
-            end_y = center[1] + inner_radius * 0.8 * math.sin(angle)
-            pygame.draw.line(self.image, NEON_BLUE, (start_x, start_y), (end_x, end_y), 2)
-        
-        # Outer security barrier - hexagonal with security nodes
-        points = []
-        for i in range(6):
-            angle = math.radians(self.outer_ring_rotation/3 + i * 60)
-            x = center[0] + outer_radius * math.cos(angle)
-            y = center[1] + outer_radius * math.sin(angle)
-            points.append((x, y))
-            
-            # Security nodes at vertices
-            node_radius = outer_radius * 0.15
-            pygame.draw.circle(self.image, NEON_TEAL, (int(x), int(y)), int(node_radius))
-            pygame.draw.circle(self.image, (0,0,0), (int(x), int(y)), int(node_radius*0.7))
-            pygame.draw.circle(self.image, self.danger_color, (int(x), int(y)), int(node_radius*0.4))
-            
-        # Connect the points for outer barrier
-        pygame.draw.lines(self.image, NEON_TEAL, True, points, 3)
-        
-        # Shield effect when active (pulsing hexagonal shield)
-        if self.shield_active and self.shield_flicker < 0.7:
+            pygame.draw.circle(self.core, health_color, center, health_radius)
+    
+    def layer_frame(self, layer, frame):
+        """Return (surface, offset) of a ring rotated frame degrees or of the shield at opacity frame,
+        drawing and cropping it on first use"""
+        key = (layer, self.highlight_color if layer == "inner" else self.danger_color, frame)
+        cached = Boss.layer_frames.get(key)
+        if cached is not None:
+            return cached
+        
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        rotation = frame
+        center = self.center
+        if layer == "shield":
+            # Semi-transparent pulsing hexagonal shield
             shield_points = []
-            shield_radius = outer_radius * 1.2
+            shield_radius = self.outer_radius * 1.2
             for i in range(6):
                 angle = math.radians(60 + i * 60)
                 x = center[0] + shield_radius * math.cos(angle)
                 y = center[1] + shield_radius * math.sin(angle)
                 shield_points.append((x, y))
+            pygame.draw.polygon(surface, (*NEON_BLUE[:3], frame), shield_points)
+        elif layer == "inner":
+            # Inner defensive ring - rotating segments
+            inner_radius = self.inner_radius
+            segments = 8
+            for i in range(segments):
+                start_angle = math.radians(rotation + i * (360/segments))
+                end_angle = math.radians(rotation + (i+0.6) * (360/segments))
+                pygame.draw.arc(surface, self.highlight_color,
+                              (center[0]-inner_radius, center[1]-inner_radius, inner_radius*2, inner_radius*2),
+                              start_angle, end_angle, 5)
+        elif layer == "circuits":
+            # Digital circuit connections
+            for i in range(6):
+                angle = math.radians(i * 60 + rotation)
+                start_x = center[0] + self.core_radius * math.cos(angle)
+                start_y = center[1] + self.core_radius * math.sin(angle)
+                end_x = center[0] + self.inner_radius * 0.8 * math.cos(angle)
+                end_y = center[1] + self.inner_radius * 0.8 * math.sin(angle)
+                pygame.draw.line(surface, NEON_BLUE, (start_x, start_y), (end_x, end_y), 2)
+        else:
+            # Outer security barrier - hexagonal with security nodes
+            outer_radius = self.outer_radius
+            points = []
+            for i in range(6):
+                angle = math.radians(rotation + i * 60)
+                x = center[0] + outer_radius * math.cos(angle)
+                y = center[1] + outer_radius * math.sin(angle)
+                points.append((x, y))
                 
-            # Semi-transparent shield
-            shield_alpha = int(100 + 100 * abs(math.sin(time_val * 5)))
-            shield_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            pygame.draw.polygon(shield_surface, (*NEON_BLUE[:3], shield_alpha), shield_points)
-            self.image.blit(shield_surface, (0, 0))
-        
-        # Draw health bar
-        health_width = self.width
-        health_height = 10
-        health_x = 0
-        health_y = -20
-        health_percent = self.health / self.max_health
-        
-        # Background (empty health)
-        pygame.draw.rect(self.image, RED, (health_x, health_y, health_width, health_height))
-        # Foreground (current health)
-        pygame.draw.rect(self.image, GREEN, (health_x, health_y, int(health_width * health_percent), health_height))
+                # Security nodes at vertices
+                node_radius = outer_radius * 0.15
+                pygame.draw.circle(surface, NEON_TEAL, (int(x), int(y)), int(node_radius))
+                pygame.draw.circle(surface, (0,0,0), (int(x), int(y)), int(node_radius*0.7))
+                pygame.draw.circle(surface, self.danger_color, (int(x), int(y)), int(node_radius*0.4))
+                
+            # Connect the points for outer barrier
+            pygame.draw.lines(surface, NEON_TEAL, True, points, 3)
+        
+        bounds = surface.get_bounding_rect()
+        cached = (surface.subsurface(bounds).copy(), bounds.topleft)
+        Boss.layer_frames[key] = cached
+        return cached
     
     def hit(self):
-        """Handle boss being hit"""
+        """Handle boss being hit (the frame is recomposed when next drawn)"""
         self.health -= 1
-        self.update_image()
         return self.health <= 0  # Return True if boss is destroyed
 
 
-class PowerUp(pygame.sprite.Sprite):
+class PowerUp(PooledSprite):
     """Power-up sprite"""
     
+    frames = {}  # Power-up type -> Surface, shared by every power-up and never redrawn
+    
     def __init__(self, x, y, powerup_type):
         super().__init__()
-        self.type = powerup_type
         self.width = POWERUP_SIZE
         self.height = POWERUP_SIZE
-        self.image = pygame.Surface((self.width, self.height))
-        self.image.fill(POWERUP_COLORS[self.type])
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.centery = y
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
         self.speed = POWERUP_SPEED
+        self.reset(x, y, powerup_type)
+    
+    def reset(self, x, y, powerup_type):
+        """(Re)spawn the power-up, drawing its type's frame the first time it is needed"""
+        self.type = powerup_type
+        image = self.frames.get(powerup_type)
+        if image is None:
+            image = pygame.Surface((self.width, self.height))
+            image.fill(POWERUP_COLORS[self.type])
+            
+            # Draw icon inside
+            self.draw_icon(image)
+            self.frames[powerup_type] = image
+        self.image = image
         
-        # Draw icon inside
-        self.draw_icon()
+        self.rect.centerx = x
+        self.rect.centery = y
     
-    def draw_icon(self):
+    def draw_icon(self, image):
         """Draw an icon representing the power-up type"""
         if self.type == "shield":
-            pygame.draw.circle(self.image, NEON_CYAN, (self.width // 2, self.height // 2), self.width // 3, 1)
+            pygame.draw.circle(image, NEON_CYAN, (self.width // 2, self.height // 2), self.width // 3, 1)
         elif self.type == "double_shot":
-            pygame.draw.line(self.image, NEON_CYAN, 
+            pygame.draw.line(image, NEON_CYAN, 
                             (self.width // 3, self.height // 2),
                             (self.width * 2 // 3, self.height // 4), 2)
-            pygame.draw.line(self.image, NEON_CYAN, 
+            pygame.draw.line(image, NEON_CYAN, 
                             (self.width // 3, self.height // 2),
                             (self.width * 2 // 3, self.height * 3 // 4), 2)
         elif self.type == "life":
-            pygame.draw.polygon(self.image, NEON_CYAN, [
+            pygame.draw.polygon(image, NEON_CYAN, [
                 (self.width // 2, self.height // 4),
                 (self.width // 4, self.height * 3 // 4),
                 (self.width * 3 // 4, self.height * 3 // 4)
             ])
         elif self.type == "bomb":
-            pygame.draw.circle(self.image, NEON_CYAN, (self.width // 2, self.height // 2), self.width // 3)
+            pygame.draw.circle(image, NEON_CYAN, (self.width // 2, self.height // 2), self.width // 3)
             # Fuse
-            pygame.draw.line(self.image, NEON_CYAN, 
+            pygame.draw.line(image, NEON_CYAN, 
                             (self.width // 2, self.height // 3),
                             (self.width * 2 // 3, 0), 2)
     
@@ -563,57 +652,5 @@ class PowerUp(pygame.sprite.Sprite):
             self.kill()
 
 
-class Particle(pygame.sprite.Sprite):
-    """Explosion particle sprite"""
-    
-    def __init__(self, x, y, color):
-        super().__init__()
-        self.x = x
-        self.y = y
-        self.size = random.randint(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE)
-        self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (self.size, self.size), self.size)
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.centery = y
-        
-        # Movement
-        angle = random.uniform(0, math.pi * 2)
-        speed = random.uniform(PARTICLE_MIN_SPEED, PARTICLE_MAX_SPEED)
-        self.dx = math.cos(angle) * speed
-        self.dy = math.sin(angle) * speed
-        
-        # Lifetime
-        self.lifetime = random.randint(PARTICLE_MIN_LIFETIME, PARTICLE_MAX_LIFETIME)
-    
-    def update(self):
-        """Update particle position and lifetime"""
-        self.x += self.dx
-        self.y += self.dy
-        self.rect.centerx = int(self.x)
-        self.rect.centery = int(self.y)
-        
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
-
-
-class Star(pygame.sprite.Sprite):
-    """Background star sprite"""
-    
-    def __init__(self):
-        super().__init__()
-        self.size = random.randint(STAR_MIN_SIZE, STAR_MAX_SIZE)
-        self.image = pygame.Surface((self.size, self.size))
-        self.image.fill(NEON_CYAN)
-        self.rect = self.image.get_rect()
-        self.rect.x = random.randint(0, WIDTH)
-        self.rect.y = random.randint(0, HEIGHT)
-        self.speed = random.uniform(STAR_MIN_SPEED, STAR_MAX_SPEED)
-    
-    def update(self):
-        """Move star downward for parallax effect"""
-        self.rect.y += self.speed
-        if self.rect.top > HEIGHT:
-            self.rect.y = 0
-            self.rect.x = random.randint(0, WIDTH)
+# Data fragment frames, shared by every fragment
+Enemy.atlas = FragmentAtlas()
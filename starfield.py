@@ -0,0 +1,145 @@
+"""
+Star background for NeuroLink: Cyberpunk Data Recovery game.
+Keeps every star's float position in NumPy arrays so the whole field scrolls with sub-pixel
+precision in one vectorized step, with several parallax layers drawn through direct pixel writes.
+"""
+
+import pygame
+import numpy as np
+from config import *
+
+class StarField:
+    """Parallax star layers stored as arrays instead of one sprite per star"""
+
+    def __init__(self, count=STAR_COUNT, layers=STAR_LAYERS, seed=None):
+        """Create the star layers"""
+        self.rng = np.random.default_rng(seed)
+        self.layers = layers
+        self.share = 1.0  # Share of the stars drawn
+        self.populate(count)
+
+    def populate(self, count):
+        """(Re)create count stars split across the parallax layers"""
+        rng = self.rng
+        x, y, speed, size, layer = [], [], [], [], []
+        for index, (share, min_size, max_size, min_speed, max_speed, color) in enumerate(self.layers):
+            n = int(round(count * share))
+            x.append(rng.integers(0, WIDTH + 1, n))
+            y.append(rng.uniform(0, HEIGHT, n))
+            speed.append(rng.uniform(min_speed, max_speed, n))
+            size.append(rng.integers(min_size, max_size + 1, n))
+            layer.append(np.full(n, index))
+
+        self.x = np.concatenate(x).astype(np.int32)
+        self.y = np.concatenate(y)
+        self.speed = np.concatenate(speed)
+        self.size = np.concatenate(size).astype(np.int32)
+        self.layer = np.concatenate(layer).astype(np.int32)
+        self.count = len(self.x)
+
+        # Order in which stars are hidden when only a share is drawn - low-discrepancy,
+        # so every layer thins out evenly
+        self.rank = np.arange(self.count) * 0.6180339887 % 1.0
+        self.set_share(self.share)
+
+        # Per-star surface color, mapped lazily for the target surface format
+        self.mapped_for = None
+        self.mapped = None
+
+        # Positions covered by the last draw
+        self.drawn_x = None
+        self.drawn_y = None
+
+    def set_share(self, share):
+        """Draw only this share of the stars (0-1)"""
+        self.share = share
+        shown = self.rank < share
+        self.shown = np.flatnonzero(shown)
+
+        # Drawn star indices grouped by size, so each square is stamped with a few array writes
+        self.size_groups = [(s, np.flatnonzero((self.size == s) & shown)) for s in np.unique(self.size).tolist()]
+
+    def __len__(self):
+        """Return the number of stars"""
+        return self.count
+
+    def update(self):
+        """Scroll every star down by its own sub-pixel speed"""
+        self.y += self.speed
+        wrapped = np.flatnonzero(self.y > HEIGHT)
+        if len(wrapped):
+            self.y[wrapped] = 0
+            self.x[wrapped] = self.rng.integers(0, WIDTH + 1, len(wrapped))
+
+    def map_colors(self, surface):
+        """Map each layer color to the surface pixel format"""
+        key = (surface.get_bitsize(), surface.get_masks())
+        if self.mapped_for != key:
+            palette = np.array([surface.map_rgb(layer[5]) for layer in self.layers], dtype=np.int64)
+            self.mapped = palette[self.layer]
+            self.mapped_for = key
+        return self.mapped
+
+    def moved(self, top):
+        """Return the indices of stars whose drawn pixel position changed
+
+        Returns None when there is no previous draw or too many stars moved for
+        per-star rectangles to pay off.
+        """
+        if self.drawn_x is None or len(self.drawn_x) != self.count:
+            return None
+        moved = np.flatnonzero((self.x != self.drawn_x) | (top != self.drawn_y))
+        return moved if len(moved) <= STAR_DIRTY_LIMIT else None
+
+    def clear(self, surface, background):
+        """Erase stars that will be drawn somewhere else this frame"""
+        moved = self.moved(self.y.astype(np.int32))
+        if moved is None:
+            surface.blit(background, (0, 0))
+            return
+        surface.blits([(background, (x, y), (x, y, s, s)) for x, y, s in zip(
+            self.drawn_x[moved].tolist(), self.drawn_y[moved].tolist(), self.size[moved].tolist())],
+            doreturn=False)
+
+    def draw(self, surface):
+        """Stamp every star straight into the surface pixels and return the changed areas"""
+        top = self.y.astype(np.int32)
+        width, height = surface.get_size()
+
+        try:
+            pixels = pygame.surfarray.pixels2d(surface) if isinstance(surface, pygame.Surface) else None
+        except ValueError:
+            pixels = None  # 24-bit surfaces have no 2D pixel view
+        if pixels is None:
+            # Fill each star instead (texture targets have no pixels either)
+            shown = self.shown
+            for x, y, s, i in zip(self.x[shown].tolist(), top[shown].tolist(), self.size[shown].tolist(),
+                                  self.layer[shown].tolist()):
+                surface.fill(self.layers[i][5], (x, y, s, s))
+        else:
+            colors = self.map_colors(surface)
+            for s, group in self.size_groups:
+                gx = self.x[group]
+                gy = top[group]
+                gc = colors[group]
+                for dx in range(s):
+                    for dy in range(s):
+                        px = gx + dx
+                        py = gy + dy
+                        inside = (px < width) & (py < height)
+                        pixels[px[inside], py[inside]] = gc[inside]
+            del pixels
+
+        moved = self.moved(top)
+        if moved is None:
+            rects = [surface.get_rect()]
+        else:
+            # Old and new squares separately, so wrapped stars do not span the screen
+            size = self.size[moved].tolist()
+            rects = [pygame.Rect(x, y, s, s) for x, y, s in zip(
+                self.drawn_x[moved].tolist(), self.drawn_y[moved].tolist(), size)]
+            rects += [pygame.Rect(x, y, s, s) for x, y, s in zip(
+                self.x[moved].tolist(), top[moved].tolist(), size)]
+        self.drawn_x = self.x.copy()
+        self.drawn_y = top
+        return rects
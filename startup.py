@@ -0,0 +1,36 @@
+"""
+Startup timeline for NeuroLink: Cyberpunk Data Recovery game.
+Import this module first: it stamps the time, and the imports and init steps after it mark
+themselves here so --startup-profile can print how long each one took.
+"""
+
+import time
+
+START = time.perf_counter()
+
+steps = []  # (label, milliseconds since START, milliseconds since the previous step)
+live = False  # Print steps as they are marked (once the timeline has been printed)
+
+
+def mark(label):
+    """Record that the step called label has just finished"""
+    elapsed = (time.perf_counter() - START) * 1000
+    previous = steps[-1][1] if steps else 0.0
+    steps.append((label, elapsed, elapsed - previous))
+    if live:
+        print(format_step(steps[-1]))
+
+
+def format_step(step):
+    """Return one timeline row"""
+    label, elapsed, duration = step
+    return f"{elapsed:9.1f} ms  {duration:+8.1f} ms  {label}"
+
+
+def print_timeline():
+    """Print the steps so far and every step marked after this"""
+    global live
+    print(f"Startup timeline (since {__name__} was imported):")
+    for step in steps:
+        print(format_step(step))
+    live = True
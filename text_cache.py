@@ -0,0 +1,108 @@
+"""
+Text rendering cache for NeuroLink: Cyberpunk Data Recovery game.
+Keeps rendered text surfaces around so the HUD does not rasterize unchanged strings every frame.
+"""
+
+import pygame
+import json
+import os
+from collections import OrderedDict
+from config import *
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """Initialize an empty cache"""
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Return the rendered text surface, rendering it only on a cache miss"""
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+class DigitAtlas:
+    """Pre-rendered fixed-width digit glyphs for composing changing numbers"""
+
+    def __init__(self, font, color):
+        """Render the ten digit glyphs once"""
+        self.glyphs = [font.render(str(digit), True, color) for digit in range(10)]
+        self.digit_width = max(glyph.get_width() for glyph in self.glyphs)
+        self.height = max(glyph.get_height() for glyph in self.glyphs)
+
+        # Center each glyph in its fixed-width cell
+        self.offsets = [(self.digit_width - glyph.get_width()) // 2 for glyph in self.glyphs]
+
+    def width(self, number):
+        """Return the pixel width of a non-negative integer"""
+        return len(str(number)) * self.digit_width
+
+    def draw(self, surface, number, pos):
+        """Blit a non-negative integer at pos and return the area it covers"""
+        x, y = pos
+        blits = []
+        for index, char in enumerate(str(number)):
+            digit = ord(char) - 48
+            blits.append((self.glyphs[digit], (x + index * self.digit_width + self.offsets[digit], y)))
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(x, y, self.width(number), self.height)
+
+
+fonts = {}  # (name, size) -> Font, shared by everything that draws text
+
+
+def load_font(name, size):
+    """Return pygame.font.SysFont(name, size), loading each (name, size) once per run
+
+    SysFont scans the installed fonts every launch before resolving any name. The
+    path a name resolves to is kept in FONT_CACHE_FILE instead, so later launches
+    open it directly, and the default font (name None) never needs the scan.
+    """
+    key = (name, size)
+    font = fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(resolve_font(name), size)
+        fonts[key] = font
+    return font
+
+
+def resolve_font(name):
+    """Return the path of the system font called name (None for pygame's default font)"""
+    if name is None:
+        return None
+
+    try:
+        with open(FONT_CACHE_FILE) as f:
+            paths = json.load(f)
+    except (OSError, ValueError):
+        paths = {}
+    path = paths.get(name)
+    if path and os.path.exists(path):
+        return path
+
+    path = pygame.font.match_font(name)
+    if path:
+        paths[name] = path
+        try:
+            with open(FONT_CACHE_FILE, "w") as f:
+                json.dump(paths, f, indent=2)
+        except OSError:
+            pass
+    return path
@@ -0,0 +1,190 @@
+"""
+Texture renderer for NeuroLink: Cyberpunk Data Recovery game.
+Draws through SDL's 2D renderer (pygame._sdl2.video) instead of software surface blits: sprite
+frames, particle dots and HUD text are uploaded once as textures and every gameplay frame is a
+run of texture copies. Menu and overlay screens are drawn in software and uploaded whole.
+
+Run it directly to check that both paths draw the same frames:
+    python texture_renderer.py [--ticks N] [--every N] [--seed S] [--gpu]
+"""
+
+import weakref
+import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+from config import *
+
+class TextureTarget:
+    """Stand-in for the screen surface that turns blits into texture copies and fills into rect fills
+
+    A surface is uploaded the first time it is drawn and its texture lives as long
+    as the surface, so whatever is drawn here must not change after it is first
+    shown (sprite frames, particle dots and cached text are all drawn once).
+    """
+
+    def __init__(self, renderer, size):
+        """Initialize the target with no textures"""
+        self.renderer = renderer
+        self.rect = pygame.Rect((0, 0), size)
+        self.textures = weakref.WeakKeyDictionary()  # Surface -> Texture
+        self.uploads = 0
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+    def get_rect(self):
+        return self.rect.copy()
+
+    def texture(self, surface):
+        """Return the texture for surface, uploading it the first time"""
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)  # Keeps its alpha and blend mode
+            self.textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Copy source's texture to dest and return the area it covers, like Surface.blit"""
+        if special_flags:
+            raise ValueError("texture targets only support plain blits")
+        width, height = source.get_size() if area is None else area[2:]
+        rect = pygame.Rect(dest[0], dest[1], width, height)
+        self.texture(source).draw(area, rect)
+        return rect.clip(self.rect)
+
+    def blits(self, blit_sequence, doreturn=True):
+        """Copy each (source, dest[, area[, special_flags]]) in order"""
+        rects = [self.blit(*blit) for blit in blit_sequence]
+        return rects if doreturn else None
+
+    def fblits(self, blit_sequence, special_flags=0):
+        """Copy each (source, dest) in order"""
+        for source, dest in blit_sequence:
+            self.blit(source, dest, None, special_flags)
+
+    def fill(self, color, rect=None):
+        """Fill rect (the whole target if None) with an opaque color"""
+        self.renderer.draw_color = (*color[:3], 255)
+        if rect is None:
+            self.renderer.clear()
+            return self.rect.copy()
+        rect = pygame.Rect(rect).clip(self.rect)
+        self.renderer.fill_rect(rect)
+        return rect
+
+
+class TextureRenderer:
+    """A window drawn through an SDL renderer, for gameplay frames on a TextureTarget
+
+    Anything that needs pixel access draws onto canvas instead, a software
+    surface that present_canvas() uploads and shows as one texture.
+    """
+
+    def __init__(self, title, size=(WIDTH, HEIGHT), software=TEXTURE_RENDERER_SOFTWARE, vsync=False):
+        """Open the window
+
+        Args:
+            title: Window title
+            size: Window size in pixels
+            software: Use SDL's software renderer even when a GPU one is available
+            vsync: Present in step with the display refresh
+        """
+        self.window = Window(title, size)
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        self.target = TextureTarget(self.renderer, size)
+        self.canvas = pygame.Surface(size)
+        self.canvas_texture = Texture(self.renderer, size, streaming=True)
+
+        # Stats
+        self.texture_frames = 0
+        self.canvas_frames = 0
+
+    def begin(self):
+        """Clear the window for a gameplay frame and return the target to draw it on"""
+        self.target.fill(BLACK)
+        return self.target
+
+    def present(self):
+        """Show the gameplay frame drawn on the target"""
+        self.renderer.present()
+        self.texture_frames += 1
+
+    def present_canvas(self):
+        """Upload the canvas and show it"""
+        self.canvas_texture.update(self.canvas)
+        self.canvas_texture.draw()
+        self.renderer.present()
+        self.canvas_frames += 1
+
+    def to_surface(self):
+        """Return a copy of the last frame drawn (before or after presenting)"""
+        return self.renderer.to_surface()
+
+
+def compare_frames(ticks=1800, every=30, seed=0, software=True):
+    """Play a seeded bot game and draw every n-th tick both ways, comparing the pixels
+
+    Returns (frames compared, frames that differ, largest channel difference,
+    pixels that differ, mean software ms, mean texture ms).
+    """
+    import time
+    import numpy as np
+    from controls import ActionInput
+    from neurolink import Game, random_policy
+
+    game = Game(input_source=ActionInput(random_policy(seed)), seed=seed,
+                backend="texture", software_renderer=software)
+    game.show_welcome = False
+    game.start_game()
+    game.sound_manager.enabled = False
+    textures = game.texture_renderer
+
+    frames = differing = worst = pixels = 0
+    surface_ms = texture_ms = 0.0
+    for tick in range(ticks):
+        game.step(autoplay=True)
+        if tick % every:
+            continue
+
+        start = time.perf_counter()
+        game.draw_frame(present=False)  # Software path, onto the canvas
+        drawn = time.perf_counter()
+        game.draw_frame()
+        texture_ms += (time.perf_counter() - drawn) * 1000
+        surface_ms += (drawn - start) * 1000
+
+        # Overlay frames go through the canvas either way; only gameplay frames tell
+        expected = pygame.surfarray.pixels3d(textures.canvas).astype(np.int16)
+        actual = pygame.surfarray.pixels3d(textures.to_surface()).astype(np.int16)
+        difference = np.abs(expected - actual).max(axis=2)
+        frames += 1
+        if difference.any():
+            differing += 1
+            worst = max(worst, int(difference.max()))
+            pixels += int(np.count_nonzero(difference))
+    return frames, differing, worst, pixels, surface_ms / max(frames, 1), texture_ms / max(frames, 1)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Compare the texture renderer's frames with the surface path's")
+    parser.add_argument("--ticks", type=int, default=1800, help="ticks of bot play")
+    parser.add_argument("--every", type=int, default=30, help="compare every n-th tick")
+    parser.add_argument("--seed", type=int, default=0, help="game seed")
+    parser.add_argument("--gpu", action="store_true", help="use the GPU renderer if there is one")
+    args = parser.parse_args()
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    frames, differing, worst, pixels, surface_ms, texture_ms = compare_frames(
+        args.ticks, args.every, args.seed, software=not args.gpu)
+    print(f"{frames} frames compared: {frames - differing} identical, {differing} differ "
+          f"({pixels} pixels, at most {worst}/255 per channel - SDL rounds alpha blending differently); "
+          f"draw {surface_ms:.2f} ms surface, {texture_ms:.2f} ms texture")
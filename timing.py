@@ -0,0 +1,57 @@
+"""
+Time sources for NeuroLink: Cyberpunk Data Recovery game.
+All animation and frame pacing reads time through this module, so a simulation clock can
+stand in for the wall clock when the game runs headless.
+"""
+
+import pygame
+import time
+from config import FPS
+
+class WallClock:
+    """Real time from pygame, capped at the target frame rate"""
+
+    def __init__(self):
+        """Initialize the frame limiter"""
+        self.clock = pygame.time.Clock()
+        self.start = time.perf_counter()
+
+    def get_ticks(self):
+        """Return milliseconds since the clock was created (pygame's timer needs a full pygame.init())"""
+        return int((time.perf_counter() - self.start) * 1000)
+
+    def tick(self, fps=FPS):
+        """Wait for the next frame and return the milliseconds since the last one"""
+        return self.clock.tick(fps)
+
+
+class SimulationClock:
+    """Simulated time that advances one frame per tick and never sleeps"""
+
+    def __init__(self, fps=FPS):
+        """Initialize the clock at time zero"""
+        self.frame_ms = 1000 / fps
+        self.frames = 0
+
+    def get_ticks(self):
+        """Return simulated milliseconds since the start"""
+        return int(self.frames * self.frame_ms)
+
+    def tick(self, fps=FPS):
+        """Advance one frame immediately and return its simulated length"""
+        self.frames += 1
+        return self.frame_ms
+
+
+current = WallClock()
+
+
+def set_clock(clock):
+    """Make clock the time source for all game animation"""
+    global current
+    current = clock
+
+
+def get_ticks():
+    """Return the current clock's milliseconds"""
+    return current.get_ticks()